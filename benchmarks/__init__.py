@@ -0,0 +1 @@
+"""Benchmarks of the scoring hot paths, see benchmarks.bench."""
@@ -0,0 +1,6 @@
+"""Run the benchmarks: python3 -m benchmarks --help."""
+
+from benchmarks.bench import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Run the benchmarks, store them as a baseline and report the regressions."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime
+
+from benchmarks.cases import CASES, IMPORT_BUDGET, import_time
+
+# Default file with the stored results, see --save and --compare.
+BASELINE = "benchmarks/baseline.json"
+
+
+def measure(func, repeat: int) -> dict:
+    """
+    Time an operation (seconds per call) in several samples.
+
+    Each sample runs the operation as many times as timeit.autorange needs to
+    take at least 0.2 seconds.
+
+    Args:
+        - func: Operation without arguments.
+        - repeat: Number of samples.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [x / number for x in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "number": number,
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "samples": samples,
+    }
+
+
+def run(names: list, repeat: int, report=None) -> dict:
+    """
+    Run the benchmarks and return them with the details of the environment.
+
+    Args:
+        - names: Names of the benchmarks, see benchmarks.cases.CASES.
+        - repeat: Number of samples of each benchmark.
+        - report: Called with (name, result) after each benchmark.
+    """
+    results = {}
+    for name in names:
+        results[name] = measure(func=CASES[name](), repeat=repeat)
+        if report is not None:
+            report(name, results[name])
+
+    return {
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "version": __version__,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def mann_whitney(a: list, b: list) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test (normal approximation).
+
+    Tells if the samples of two runs come from different distributions,
+    without assuming the timings are normal.
+
+    Args:
+        - a: Samples of the first run.
+        - b: Samples of the second run.
+    """
+    values = sorted([(x, 0) for x in a] + [(x, 1) for x in b])
+    ranks = [0.0] * len(values)
+
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1, n2 = len(a), len(b)
+    u = sum(r for r, (_, group) in zip(ranks, values) if group == 0)
+    u -= n1 * (n1 + 1) / 2
+
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sigma == 0:
+        return 1.0
+
+    z = abs(u - n1 * n2 / 2) / sigma
+    return math.erfc(z / math.sqrt(2))
+
+
+def compare(old: dict, new: dict, threshold: float, alpha: float) -> list:
+    """
+    Compare two runs, benchmark by benchmark.
+
+    A benchmark is slower (or faster) when the median changed more than the
+    threshold and the Mann-Whitney p-value is below alpha, so noise is not
+    reported as a regression.
+
+    Args:
+        - old: The stored run (baseline).
+        - new: The current run.
+        - threshold: Minimum relative change of the median, e.g. 0.05 for 5%.
+        - alpha: Significance level of the test.
+    """
+    rows = []
+    before, after = old.get("results", {}), new.get("results", {})
+
+    for name in list(after) + [x for x in before if x not in after]:
+        if name not in before or name not in after:
+            rows.append(
+                {
+                    "name": name,
+                    "status": "new" if name in after else "missing",
+                    "old": before.get(name, {}).get("median"),
+                    "new": after.get(name, {}).get("median"),
+                    "change": None,
+                    "pvalue": None,
+                }
+            )
+            continue
+
+        change = after[name]["median"] / before[name]["median"] - 1
+        pvalue = mann_whitney(before[name]["samples"], after[name]["samples"])
+
+        status = "same"
+        if abs(change) > threshold and pvalue < alpha:
+            status = "slower" if change > 0 else "faster"
+
+        rows.append(
+            {
+                "name": name,
+                "status": status,
+                "old": before[name]["median"],
+                "new": after[name]["median"],
+                "change": change,
+                "pvalue": pvalue,
+            }
+        )
+
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    """
+    Format seconds with the most readable unit.
+
+    Args:
+        - seconds: The time in seconds.
+    """
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def print_result(name: str, result: dict) -> None:
+    print(
+        f"{name:<24} {format_time(result['median']):>10}"
+        f" +- {format_time(result['stdev']):>10}  ({result['number']} loops)"
+    )
+
+
+def print_comparison(rows: list) -> None:
+    print()
+    print(f"{'benchmark':<24} {'baseline':>10} {'current':>10} {'change':>8}  p-value")
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        pvalue = "-" if row["pvalue"] is None else f"{row['pvalue']:.4f}"
+        print(
+            f"{row['name']:<24} {format_time(row['old']):>10}"
+            f" {format_time(row['new']):>10} {change:>8}  {pvalue}  {row['status']}"
+        )
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks",
+        description="Benchmarks of the IPIP-NEO scoring hot paths.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help=f"Benchmarks to run (default all): {', '.join(CASES)}.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=15, help="Samples of each benchmark."
+    )
+    parser.add_argument(
+        "--save",
+        metavar="FILE",
+        nargs="?",
+        const=BASELINE,
+        help=f"Store the results as a baseline (default {BASELINE}).",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        nargs="?",
+        const=BASELINE,
+        help=f"Compare the results with a baseline (default {BASELINE}).",
+    )
+    parser.add_argument(
+        "--diff",
+        metavar=("OLD", "NEW"),
+        nargs=2,
+        help="Compare two stored runs, without running the benchmarks.",
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="Check the cold import time of the modules in IMPORT_BUDGET.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Minimum change of the median to report (default 0.05 = 5%%).",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="Significance level of the Mann-Whitney test (default 0.01).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> None:
+    """
+    Run the benchmarks. The exit status is 1 when a benchmark is slower.
+
+    Args:
+        - argv: Command line arguments, sys.argv by default.
+    """
+    args = parse_args(argv)
+
+    if args.imports:
+        over = False
+        for module, budget in IMPORT_BUDGET.items():
+            seconds = import_time(module=module)
+            over = over or seconds > budget
+            print(
+                f"import {module:<18} {format_time(seconds):>10}"
+                f"  budget {format_time(budget):>10}"
+                f"  {'over' if seconds > budget else 'ok'}"
+            )
+        if over:
+            sys.exit(1)
+        return
+
+    if args.diff:
+        old, new = load(args.diff[0]), load(args.diff[1])
+    else:
+        unknown = [x for x in args.names if x not in CASES]
+        if unknown:
+            sys.exit(f"Unknown benchmark: {', '.join(unknown)}")
+
+        old = load(args.compare) if args.compare else None
+        if old is not None and args.names:
+            results = old.get("results", {})
+            old["results"] = {x: results[x] for x in args.names if x in results}
+        new = run(
+            names=args.names or list(CASES), repeat=args.repeat, report=print_result
+        )
+
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(new, f, indent=2)
+                f.write("\n")
+
+    if old is None:
+        return
+
+    rows = compare(old=old, new=new, threshold=args.threshold, alpha=args.alpha)
+    print_comparison(rows)
+
+    if any(row["status"] == "slower" for row in rows):
+        sys.exit(1)
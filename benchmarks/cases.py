@@ -0,0 +1,179 @@
+"""The benchmarked operations, each one built once by its setup function."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import importlib
+import json
+import random
+import subprocess
+import sys
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.norm import Norm
+from ipipneo.plan import scoring_plan
+from ipipneo.reverse import reverse_selected, reverse_values
+from ipipneo.utility import organize_list_json
+
+# Fixed seed, so every run scores the same answers.
+SEED = 2022
+
+# Maximum cold import time (seconds) of each module, see import_time.
+IMPORT_BUDGET = {"ipipneo": 0.010, "ipipneo.ipipneo": 0.100}
+
+
+def random_answers(nquestion: int, custom: bool = False) -> dict:
+    """
+    Create a reproducible dictionary of answers, shuffled like real input.
+
+    Args:
+        - nquestion: Question type, 120 or 300.
+        - custom: If true, add the (reverse_scored) key to every answer.
+    """
+    rng = random.Random(SEED + nquestion + custom)
+    items = []
+    for question in range(1, nquestion + 1):
+        item = {"id_question": question, "id_select": rng.randint(1, 5)}
+        if custom:
+            item["reverse_scored"] = rng.randint(0, 1)
+        items.append(item)
+
+    rng.shuffle(items)
+    return {"answers": items}
+
+
+def import_time(module: str, runs: int = 5) -> float:
+    """
+    Cold import time of a module in a new interpreter (best of some runs).
+
+    Sums the cumulative time of python -X importtime for the module and its
+    parent packages, including the standard library modules they import.
+
+    Args:
+        - module: Name of the module, e.g. ipipneo.
+        - runs: Number of interpreters started.
+    """
+    parts = module.split(".")
+    names = {".".join(parts[: i + 1]) for i in range(len(parts))}
+
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+
+        total = 0
+        for line in output.splitlines():
+            _, cumulative, name = line.split("|")
+            if name.strip() in names and not name[1:].startswith(" "):
+                total += int(cumulative)
+        times.append(total / 1e6)
+
+    return min(times)
+
+
+def import_fresh(module: str):
+    """
+    Import a module again, as if it was never imported, then restore it.
+
+    Only the ipipneo modules are reloaded, the standard library is cached.
+
+    Args:
+        - module: Name of the module, e.g. ipipneo.
+    """
+
+    def owned() -> list:
+        return [x for x in sys.modules if x == "ipipneo" or x.startswith("ipipneo.")]
+
+    def run():
+        saved = {x: sys.modules.pop(x) for x in owned()}
+        try:
+            importlib.import_module(module)
+        finally:
+            for x in owned():
+                del sys.modules[x]
+            sys.modules.update(saved)
+
+    return run
+
+
+def compute_120():
+    big5, answers = IpipNeo(question=120), random_answers(nquestion=120)
+    return lambda: big5.compute(sex="M", age=40, answers=answers)
+
+
+def compute_300():
+    big5, answers = IpipNeo(question=300), random_answers(nquestion=300)
+    return lambda: big5.compute(sex="F", age=25, answers=answers)
+
+
+def compute_120_custom():
+    big5 = IpipNeo(question=120, test=True)
+    answers = random_answers(nquestion=120, custom=True)
+    return lambda: big5.compute(sex="N", age=60, answers=answers)
+
+
+def norm_lookup():
+    people = [(sex, age) for sex in ("M", "F", "N") for age in range(10, 111, 5)]
+
+    def run():
+        for nquestion in (120, 300):
+            for sex, age in people:
+                Norm.lookup(sex=sex, age=age, nquestion=nquestion)
+
+    return run
+
+
+def reverse_300():
+    plan = scoring_plan(nquestion=300)
+    values = organize_list_json(answers=random_answers(nquestion=300))
+    return lambda: reverse_values(values=values, mask=plan.reverse)
+
+
+def reverse_selected_300():
+    plan = scoring_plan(nquestion=300)
+    items = random_answers(nquestion=300)["answers"]
+    return lambda: reverse_selected(answers=items, keys=plan.reversed_items)
+
+
+def organize_300():
+    answers = random_answers(nquestion=300)
+    return lambda: organize_list_json(answers=answers)
+
+
+def json_result():
+    result = IpipNeo(question=120).compute(
+        sex="M", age=40, answers=random_answers(nquestion=120)
+    )
+    return lambda: json.dumps(result)
+
+
+def json_compact():
+    result = IpipNeo(question=120).compute(
+        sex="M", age=40, answers=random_answers(nquestion=120), compact=True
+    )
+    return lambda: result.to_json()
+
+
+# Name of each benchmark and the setup function that returns the operation.
+CASES = {
+    "import-ipipneo": lambda: import_fresh(module="ipipneo"),
+    "import-ipipneo-full": lambda: import_fresh(module="ipipneo.ipipneo"),
+    "compute-120": compute_120,
+    "compute-300": compute_300,
+    "compute-120-custom": compute_120_custom,
+    "norm-lookup": norm_lookup,
+    "reverse-300": reverse_300,
+    "reverse-selected-300": reverse_selected_300,
+    "organize-300": organize_300,
+    "json-result": json_result,
+    "json-compact": json_compact,
+}
@@ -3,4 +3,28 @@
 __name__ = "five-factor-e"
 __version__ = "1.13.1"
 
-from ipipneo.ipipneo import IpipNeo
+__all__ = ["IpipNeo", "ScoringConfig"]
+
+# Module of each public class, imported on first use.
+_MODULES = {"IpipNeo": "ipipneo.ipipneo", "ScoringConfig": "ipipneo.config"}
+
+
+def __getattr__(name: str):
+    """
+    Import the public classes on first use, so (import ipipneo) stays cheap.
+
+    Args:
+        - name: Name of the attribute.
+    """
+    if name in _MODULES:
+        from importlib import import_module
+
+        value = getattr(import_module(_MODULES[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module 'ipipneo' has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
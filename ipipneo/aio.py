@@ -0,0 +1,237 @@
+"""Asyncio scoring: the CPU work runs in a thread or process executor."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+from ipipneo.config import ScoringConfig
+
+# Scorers of a worker process, one per settings, created on first use and
+# reused (with their warm norm tables) by the next calls. The scale settings
+# are sent with each call, see ScoringConfig.
+_scorers = {}
+
+
+def scorer_settings(scorer) -> tuple:
+    """
+    Return what a worker process needs to create the same scorer.
+
+    Args:
+        - scorer: The IpipNeo of the caller.
+    """
+    return scorer._nquestion, scorer._test, scorer._trusted
+
+
+def call_in_worker(settings: tuple, method: str, kwargs: dict):
+    """
+    Call a method of the worker's scorer with the caller's settings.
+
+    Args:
+        - settings: Created by scorer_settings.
+        - method: Name of the IpipNeo method.
+        - kwargs: Arguments of the method.
+    """
+    scorer = _scorers.get(settings)
+    if scorer is None:
+        from ipipneo.ipipneo import IpipNeo
+
+        question, test, trusted = settings
+        scorer = IpipNeo(question=question, test=test, trusted=trusted)
+        _scorers[settings] = scorer
+
+    return getattr(scorer, method)(**kwargs)
+
+
+def run_in_executor(scorer, executor: Executor, method: str, kwargs: dict):
+    """
+    Schedule a method of the scorer in the executor, return an asyncio future.
+
+    Threads share the scorer (and its cache and timer). Processes use a copy
+    of it created from its settings, see call_in_worker.
+
+    Args:
+        - scorer: The IpipNeo of the caller.
+        - executor: Thread or process executor, None for the loop's default.
+        - method: Name of the IpipNeo method.
+        - kwargs: Arguments of the method.
+    """
+    loop = asyncio.get_running_loop()
+
+    if isinstance(executor, ProcessPoolExecutor):
+        return loop.run_in_executor(
+            executor, call_in_worker, scorer_settings(scorer), method, kwargs
+        )
+
+    return loop.run_in_executor(executor, partial(getattr(scorer, method), **kwargs))
+
+
+async def compute_async(
+    scorer,
+    sex: str,
+    age: int,
+    answers,
+    compare: bool = False,
+    compact: bool = False,
+    executor: Executor = None,
+    timeout: float = None,
+    limit: asyncio.Semaphore = None,
+    config: ScoringConfig = None,
+):
+    """
+    Compute a person without blocking the event loop.
+
+    Answers are the standardized dictionary (see compute) or the selected
+    options ordered by id_question (see compute_vector). On timeout or
+    cancellation the caller stops waiting, a computation already running
+    in a thread is not interrupted. With a (limit), the computation holds
+    its permit until it ends, also after a timeout or a cancellation.
+
+    Args:
+        - scorer: The IpipNeo used.
+        - sex: Gender of the individual (M or F or N).
+        - age: The age of the individual.
+        - answers: Standardized dictionary or the ordered selected options.
+        - compare: If true, it shows the user's answers and reverse score.
+        - compact: If true, return a Result, see Result.to_dict.
+        - executor: Thread or process executor, None for the loop's default.
+        - timeout: Seconds to wait, an asyncio.TimeoutError is raised after it.
+        - limit: Semaphore shared by the callers to bound the computations in flight.
+        - config: The scale settings used, by default the config of the scorer.
+    """
+    if isinstance(answers, dict):
+        method = "compute"
+        kwargs = dict(sex=sex, age=age, answers=answers, compare=compare)
+    else:
+        method = "compute_vector"
+        kwargs = dict(sex=sex, age=age, values=answers)
+    kwargs["compact"] = compact
+    kwargs["config"] = config or scorer._config
+
+    if limit is None:
+        return await asyncio.wait_for(
+            run_in_executor(scorer, executor, method, kwargs), timeout=timeout
+        )
+
+    await limit.acquire()
+    try:
+        future = run_in_executor(scorer, executor, method, kwargs)
+    except BaseException:
+        limit.release()
+        raise
+
+    # The shield keeps the job of a caller that stopped waiting, so the
+    # permit is released when the computation really ends.
+    future.add_done_callback(lambda _: limit.release())
+    return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+
+async def _aiter(records):
+    for record in records:
+        yield record
+
+
+async def iter_compute_async(
+    scorer,
+    records,
+    compare: bool = False,
+    executor: Executor = None,
+    concurrency: int = None,
+    timeout: float = None,
+    ordered: bool = True,
+    config: ScoringConfig = None,
+):
+    """
+    Compute (sex, age, answers) records, yielding each result asynchronously.
+
+    At most (concurrency) records are in flight and the records, a regular or
+    an asynchronous iterable, are read as the results are consumed. A record
+    that fails or times out yields an error dictionary like iter_compute.
+    Closing or cancelling the iteration cancels the records in flight. A
+    record that timed out keeps its place until its computation ends, see
+    compute_async.
+
+    Args:
+        - scorer: The IpipNeo used.
+        - records: Iterable or async iterable of (sex, age, answers) records.
+        - compare: If true, it shows the user's answers and reverse score.
+        - executor: Thread or process executor, None for the loop's default.
+        - concurrency: Maximum records in flight, twice the number of CPUs by default.
+        - timeout: Seconds to wait for each record.
+        - ordered: If false, yield (index, result) in completion order.
+        - config: The scale settings used, by default the config of the scorer.
+    """
+    if concurrency is None:
+        concurrency = 2 * (os.cpu_count() or 1)
+    assert (
+        isinstance(concurrency, int) and concurrency > 0
+    ), "The (concurrency) field must be a positive int!"
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def score(index: int, record):
+        try:
+            if isinstance(record, BaseException):
+                raise record
+
+            sex, age, answers = record
+            return await compute_async(
+                scorer,
+                sex=sex,
+                age=age,
+                answers=answers,
+                compare=compare,
+                executor=executor,
+                timeout=timeout,
+                limit=limit,
+                config=config,
+            )
+        except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
+            raise
+        except BaseException as e:
+            return {"index": index, "error": type(e).__name__, "message": str(e)}
+
+    if hasattr(records, "__aiter__"):
+        source = records.__aiter__()
+    else:
+        source = _aiter(records=records)
+
+    pending, index, exhausted = deque(), 0, False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    record = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(score(index=index, record=record))
+                pending.append((index, task))
+                index += 1
+
+            if not pending:
+                break
+
+            if ordered:
+                _, task = pending.popleft()
+                yield await task
+                continue
+
+            done, _ = await asyncio.wait(
+                [task for _, task in pending], return_when=asyncio.FIRST_COMPLETED
+            )
+            for item in [x for x in pending if x[1] in done]:
+                pending.remove(item)
+                yield item[0], item[1].result()
+    finally:
+        for _, task in pending:
+            task.cancel()
@@ -0,0 +1,436 @@
+"""Vectorized scoring of many IPIP-NEO respondents at once (requires numpy)."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import uuid
+from datetime import datetime
+
+from ipipneo.config import DEFAULT_CONFIG, ScoringConfig
+from ipipneo.model import FacetScale, QuestionNumber
+from ipipneo.norm import Norm
+from ipipneo.plan import scoring_plan
+from ipipneo.result import LEVEL_LABELS, Result
+from ipipneo.table import cubic_percent
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+BIG5_ORDER = ("O", "C", "E", "A", "N")
+BIG5_SEX = ("M", "F", "N")
+
+# One column per domain (OCEAN order) and per facet (O1..O6, C1..C6, ...),
+# the same order as Result.scores.
+BATCH_COLUMNS = BIG5_ORDER + tuple(
+    f"{label}{j}" for label in BIG5_ORDER for j in range(1, 7)
+)
+
+# Keys of the dictionary formerly returned by compute_batch, see BatchResult.get.
+_BATCH_KEYS = (
+    "question",
+    "size",
+    "norm",
+    "domains",
+    "domain_levels",
+    "facets",
+    "facet_levels",
+)
+
+# Position of each OCEAN domain in the norm/facet order used by the
+# inventory (N, E, O, A, C), see Facet.b5create and Norm.calc.
+_OCEAN_FROM_NEOAC = (2, 4, 1, 3, 0)
+
+
+def raise_if_numpy_is_missing() -> bool | ModuleNotFoundError:
+    """Validate that the optional numpy dependency is installed."""
+    if np is None:
+        raise ModuleNotFoundError(
+            "The batch scorer requires the package (numpy)! "
+            "Install it with: pip install five-factor-e[batch]"
+        )
+    return True
+
+
+def level_codes(score, low: int, high: int):
+    """
+    Classify scores as 0 (low), 1 (average) or 2 (high), like Facet.score_level.
+
+    Args:
+        - score: Array with the scores.
+        - low: Value considered low.
+        - high: Value considered high.
+    """
+    value = np.trunc(score)
+    return np.where(value < low, 0, np.where(value <= high, 1, 2)).astype(np.uint8)
+
+
+def clamped_percent(value, scale_min: int, scale_max: int):
+    """
+    Percentiles of an array with 1/99 clamping, like Norm.normalize.
+
+    The vectorized power of numpy may differ from Python in the last bits, so
+    table.cubic_percent is called once per distinct value. Scores come from
+    small integer sums, so there are only a few hundred of them.
+
+    Args:
+        - value: Array with the normalized (z) scores.
+        - scale_min: The minimum value of the norm scale.
+        - scale_max: The maximum value of the norm scale.
+    """
+    unique, inverse = np.unique(value, return_inverse=True)
+    percent = np.asarray(
+        [cubic_percent(value=x) for x in unique.tolist()], dtype=np.float64
+    )[inverse.reshape(value.shape)]
+    percent = np.where(value < scale_min, 1.0, percent)
+    return np.where(value > scale_max, 99.0, percent)
+
+
+def norm_matrix(nquestion: int, sex, age) -> tuple:
+    """
+    Resolve the norms of every row, calling Norm once per distinct (sex, age).
+
+    Args:
+        - nquestion: Question type, 120 or 300.
+        - sex: Array with the gender of each individual (M or F or N).
+        - age: Array with the age of each individual.
+    """
+    sex_code = np.select([sex == "M", sex == "F"], [0, 1], default=2)
+    keys, inverse = np.unique(sex_code * 1000 + age, return_inverse=True)
+
+    ns, ids = [], []
+    for key in keys.tolist():
+        norm = Norm.lookup(
+            sex=BIG5_SEX[key // 1000], age=key % 1000, nquestion=nquestion
+        )
+        ns.append(norm.ns)
+        ids.append(norm.id)
+
+    return (
+        np.asarray(ns, dtype=np.float64).reshape(-1, 71)[inverse.ravel()],
+        np.asarray(ids, dtype=np.int64)[inverse.ravel()],
+    )
+
+
+class BatchResult:
+    """
+    Scores of many people stored by column (struct of arrays).
+
+    Each of the 35 columns (BATCH_COLUMNS) is a contiguous row of the (scores)
+    and (levels) matrices, so columns and slices are views that share memory
+    with the batch. The nested dictionary of a person is only built when the
+    row is requested.
+    """
+
+    __slots__ = (
+        "question",
+        "test",
+        "sex",
+        "age",
+        "norm",
+        "scores",
+        "levels",
+        "_ids",
+        "_date",
+    )
+
+    def __init__(
+        self,
+        question: int,
+        test: bool,
+        sex,
+        age,
+        norm,
+        scores,
+        levels,
+        ids=None,
+        date: datetime = None,
+    ) -> None:
+        """
+        Args:
+            - question: Question type, 120 or 300.
+            - test: Used to test your proposed questions with reverse.
+            - sex: Array with the gender of each row (M or F or N).
+            - age: Array with the age of each row.
+            - norm: Array with the id of the norm used in each row.
+            - scores: Matrix (35, rows) of float64 percentiles, one row per column.
+            - levels: Matrix (35, rows) of uint8 level codes, 0 (low), 1 (average) or 2 (high).
+            - ids: Array (object) with the id of each row, None until it is created.
+            - date: Date of the evaluation.
+        """
+        self.question = question
+        self.test = test
+        self.sex = sex
+        self.age = age
+        self.norm = norm
+        self.scores = scores
+        self.levels = levels
+        self._ids = np.full(len(sex), None, dtype=object) if ids is None else ids
+        self._date = datetime.now() if date is None else date
+
+    def __len__(self) -> int:
+        return self.scores.shape[1]
+
+    @property
+    def size(self) -> int:
+        """Number of people (rows) in the batch."""
+        return len(self)
+
+    @property
+    def ids(self):
+        """Unique id of each row, created on first use."""
+        self._create_ids(slice(None))
+        return self._ids
+
+    def _create_ids(self, index) -> None:
+        """
+        Create the ids still missing in the selected rows.
+
+        Args:
+            - index: Rows to fill (int, slice, mask or positions).
+        """
+        positions = np.arange(len(self))[index]
+        missing = np.atleast_1d(positions)[
+            np.equal(np.atleast_1d(self._ids[positions]), None)
+        ]
+        for position in missing.tolist():
+            self._ids[position] = str(uuid.uuid4())
+
+    def column(self, name: str):
+        """
+        Return the percentiles of a domain or facet, a view of the batch.
+
+        Args:
+            - name: Name of the column, see BATCH_COLUMNS (O, C, ..., O1, ..., N6).
+        """
+        return self.scores[self._column_index(name)]
+
+    def level_column(self, name: str):
+        """
+        Return the level codes of a domain or facet, a view of the batch.
+
+        Args:
+            - name: Name of the column, see BATCH_COLUMNS (O, C, ..., O1, ..., N6).
+        """
+        return self.levels[self._column_index(name)]
+
+    @staticmethod
+    def _column_index(name: str) -> int | ValueError:
+        try:
+            return BATCH_COLUMNS.index(name)
+        except ValueError:
+            raise ValueError(f"The column named ({name}) was not found!")
+
+    def row(self, index: int) -> Result:
+        """
+        Materialize one row as a Result (see Result.to_dict).
+
+        Args:
+            - index: Position of the row.
+        """
+        index = range(len(self))[index]
+        self._create_ids(index)
+
+        result = Result(
+            question=self.question,
+            test=self.test,
+            sex=str(self.sex[index]),
+            age=int(self.age[index]),
+            scores=tuple(self.scores[:, index].tolist()),
+            levels=self.levels[:, index].tobytes(),
+        )
+        result._id = self._ids[index]
+        result._date = self._date
+        return result
+
+    def to_dicts(self):
+        """Yield the nested dictionary of each row, one at a time."""
+        for i in range(len(self)):
+            yield self.row(i).to_dict()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def __getitem__(self, key):
+        """
+        Select by column name, row position or rows.
+
+        A name returns the column (see column), an integer the Result of the
+        row and a slice, mask or positions a new BatchResult. Slices share
+        memory with this batch, masks and positions copy the selected rows.
+        The keys of the former dictionary (domains, facets, ...) are also
+        accepted, see get.
+
+        Args:
+            - key: Column name, row position or rows.
+        """
+        if isinstance(key, str):
+            if key in BATCH_COLUMNS:
+                return self.column(key)
+            if key in _BATCH_KEYS:
+                return self.get(key)
+            raise ValueError(f"The column named ({key}) was not found!")
+
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(key))
+
+        if not isinstance(key, slice):
+            self._create_ids(key)
+
+        return BatchResult(
+            question=self.question,
+            test=self.test,
+            sex=self.sex[key],
+            age=self.age[key],
+            norm=self.norm[key],
+            scores=self.scores[:, key],
+            levels=self.levels[:, key],
+            ids=self._ids[key],
+            date=self._date,
+        )
+
+    def get(self, key: str, default=None):
+        """
+        Return the arrays of the former dictionary output, rows by person.
+
+        Args:
+            - key: One of question, size, norm, domains, domain_levels, facets or facet_levels.
+            - default: Value returned for other keys.
+        """
+        if key == "question":
+            return self.question
+        if key == "size":
+            return len(self)
+        if key == "norm":
+            return self.norm
+        if key == "domains":
+            return self.scores[:5].T
+        if key == "facets":
+            return self.scores[5:].T
+        if key == "domain_levels":
+            return np.asarray(LEVEL_LABELS)[self.levels[:5].T]
+        if key == "facet_levels":
+            return np.asarray(LEVEL_LABELS)[self.levels[5:].T]
+        return default
+
+    def __repr__(self) -> str:
+        return f"BatchResult(question={self.question}, size={len(self)})"
+
+
+def compute_batch(
+    nquestion: int,
+    sex,
+    age,
+    answers,
+    reverse=None,
+    config: ScoringConfig = None,
+    test: bool = False,
+) -> BatchResult | BaseException | AssertionError:
+    """
+    Score a matrix of answers, one respondent per row.
+
+    The numbers are the same as IpipNeo.compute, but every stage (reverse
+    scoring, facet sums, norms, percentiles and levels) runs as whole-array
+    operations. The result keeps one column per domain, in OCEAN order, and per
+    facet grouped by domain (O1..O6, C1..C6, E1..E6, A1..A6, N1..N6).
+
+    Args:
+        - nquestion: Question type, 120 or 300.
+        - sex: Sequence with the gender of each row (M or F or N).
+        - age: Sequence with the age of each row.
+        - answers: Matrix (rows, 120 or 300) with the answers ordered by id_question.
+        - reverse: Items to reverse score (bool mask per item or per cell), test only.
+        - config: The scale settings used, DEFAULT_CONFIG by default.
+        - test: Used to test your proposed questions with reverse.
+    """
+    raise_if_numpy_is_missing()
+
+    config = config or DEFAULT_CONFIG
+    assert isinstance(
+        config, ScoringConfig
+    ), "The (config) field must be a ScoringConfig!"
+    norm_scale, facet_level = config
+
+    if nquestion not in (QuestionNumber.IPIP_120, QuestionNumber.IPIP_300):
+        raise ValueError(f"Type question {nquestion} is invalid!")
+
+    answers = np.asarray(answers)
+    assert answers.ndim == 2, "The (answers) field must be a 2-D matrix!"
+    assert (
+        answers.shape[1] == nquestion
+    ), f"The (answers) field must have {int(nquestion)} columns!"
+    assert np.issubdtype(
+        answers.dtype, np.integer
+    ), "The (answers) field must be an integer matrix!"
+
+    rows = answers.shape[0]
+    sex, age = np.asarray(sex), np.asarray(age)
+    assert sex.shape == (rows,), "The (sex) field must have one value per row!"
+    assert age.shape == (rows,), "The (age) field must have one value per row!"
+    assert np.isin(
+        sex, BIG5_SEX
+    ).all(), "The (sex) field must contain one of (M, F, or N for Neutral)!"
+    assert rows == 0 or np.issubdtype(
+        age.dtype, np.integer
+    ), "The (age) field must be an integer!"
+
+    if rows and ((age < 10) | (age > 110)).any():
+        raise AssertionError("The age must be between 10 and 110!")
+
+    if rows and ((answers < 1) | (answers > 5)).any():
+        raise BaseException("The answers must be numbers between 1 and 5!")
+
+    if reverse is None:
+        reverse = scoring_plan(nquestion=nquestion).reverse
+
+    values = np.where(np.asarray(reverse, dtype=bool), 6 - answers, answers)
+
+    scale = int(nquestion) // FacetScale.IPIP_MAX.value
+    facets = values.reshape(rows, scale, FacetScale.IPIP_MAX.value).sum(axis=1)
+    domains = facets.reshape(rows, 6, 5).sum(axis=1)
+
+    ns, ids = norm_matrix(nquestion=nquestion, sex=sex, age=age)
+
+    normc = (10 * (domains - ns[:, 1:6]) / ns[:, 6:11]) + 50
+    domain_percent = clamped_percent(normc, *norm_scale)
+
+    stats = ns[:, 11:71].reshape(rows, 5, 2, 6)
+    traits = 50 + (
+        10
+        * (facets.reshape(rows, 6, 5).transpose(0, 2, 1) - stats[:, :, 0])
+        / stats[:, :, 1]
+    )
+    facet_percent = clamped_percent(traits, *norm_scale)
+
+    facet_levels = np.where(
+        facet_percent != 0,
+        level_codes(facet_percent, *facet_level),
+        level_codes(traits, *facet_level),
+    )
+    domain_levels = level_codes(domain_percent, *facet_level)
+
+    order = list(_OCEAN_FROM_NEOAC)
+    scores = np.empty((len(BATCH_COLUMNS), rows), dtype=np.float64)
+    scores[:5] = domain_percent[:, order].T
+    scores[5:] = facet_percent[:, order].reshape(rows, 30).T
+
+    levels = np.empty((len(BATCH_COLUMNS), rows), dtype=np.uint8)
+    levels[:5] = domain_levels[:, order].T
+    levels[5:] = facet_levels[:, order].reshape(rows, 30).T
+
+    return BatchResult(
+        question=int(nquestion),
+        test=test,
+        sex=sex,
+        age=age,
+        norm=ids,
+        scores=scores,
+        levels=levels,
+    )
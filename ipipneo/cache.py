@@ -0,0 +1,91 @@
+"""Bounded (LRU) cache of scored answers, shared by IpipNeo instances."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+class CacheInfo(namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))):
+    """Counters of a ResultCache, like functools.lru_cache."""
+
+    __slots__ = ()
+
+
+class ResultCache:
+    """
+    Least recently used cache of scores.
+
+    IpipNeo stores the scores and level codes of a person under a key with
+    the inventory, the norm group, the scale settings and the answers, so the
+    same answers are not scored twice. Every hit becomes a new Result, with its
+    own id and date.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            - maxsize: Maximum number of entries, the least recently used is evicted.
+        """
+        assert isinstance(maxsize, int), "The (maxsize) field must be an int!"
+        assert maxsize > 0, "The (maxsize) field must be greater than zero!"
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple):
+        """
+        Return the value of a key (None if missing) and mark it as recently used.
+
+        Args:
+            - key: Key created by IpipNeo.
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            - key: Key created by IpipNeo.
+            - value: The scores and level codes of a Result.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Return the hits, misses, maximum and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,136 @@
+"""Compact encodings of the answers, one byte or three bits per question."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from ipipneo.utility import place_answers
+
+# Maps each option to its reverse score (1 <-> 5, 2 <-> 4), other bytes are kept.
+REVERSE_TABLE = bytes.maketrans(b"\x01\x02\x03\x04\x05", b"\x05\x04\x03\x02\x01")
+VALID_OPTIONS = b"\x01\x02\x03\x04\x05"
+
+
+def raise_if_encoded_is_invalid(data: bytes) -> bool | BaseException:
+    """
+    Raises an error with the first byte that is not an option between 1 and 5.
+
+    Args:
+        - data: The answers, one byte per question.
+    """
+    if data.translate(None, VALID_OPTIONS):
+        for i, x in enumerate(data):
+            if not 1 <= x <= 5:
+                raise BaseException(
+                    f"The answer ({x}) at position {i} must be between 1 and 5!"
+                )
+
+    return True
+
+
+def encode_answers(answers: dict | list) -> bytes | BaseException:
+    """
+    Encode the answers as one byte per question, ordered by id_question.
+
+    Args:
+        - answers: The standardized answers dictionary or the selected options.
+    """
+    if isinstance(answers, dict):
+        answers = place_answers(answers=answers.get("answers", []))
+
+    data = bytes(answers)
+    raise_if_encoded_is_invalid(data=data)
+
+    return data
+
+
+def decode_answers(data: bytes, packed: bool = False) -> dict | BaseException:
+    """
+    Decode the bytes (or the packed form) into the standardized answers.
+
+    Args:
+        - data: The answers, one byte per question or packed by pack_answers.
+        - packed: If true, the data was packed by pack_answers.
+    """
+    if packed:
+        data = unpack_answers(data=data)
+
+    raise_if_encoded_is_invalid(data=bytes(data))
+
+    return {
+        "answers": [
+            {"id_question": i, "id_select": x} for i, x in enumerate(data, start=1)
+        ]
+    }
+
+
+def pack_answers(data: bytes) -> bytes | BaseException:
+    """
+    Pack the answers into three bits per question (45 bytes for 120 items).
+
+    The first question is stored in the lowest bits. Unused bits are zero,
+    which is never a valid option, so the number of answers is not stored.
+
+    Args:
+        - data: The answers, one byte per question.
+    """
+    data = bytes(data)
+    raise_if_encoded_is_invalid(data=data)
+
+    value = 0
+    for x in reversed(data):
+        value = (value << 3) | x
+
+    return value.to_bytes((3 * len(data) + 7) // 8, "little")
+
+
+def unpack_answers(data: bytes) -> bytes:
+    """
+    Unpack the three bits per question form back into one byte per question.
+
+    Args:
+        - data: The answers packed by pack_answers.
+    """
+    value = int.from_bytes(data, "little")
+
+    values = bytearray()
+    while value:
+        values.append(value & 7)
+        value >>= 3
+
+    return bytes(values)
+
+
+def reverse_mask(reverse: tuple) -> int:
+    """
+    Return the mask that selects the bytes of the reverse scored questions.
+
+    Args:
+        - reverse: True for each reverse scored question, in question order.
+    """
+    return int.from_bytes(bytes(0xFF if r else 0 for r in reverse), "little")
+
+
+def reverse_answers(data: bytes, mask: int) -> bytes:
+    """
+    Reverse score the masked questions with a single translate.
+
+    The whole answer is translated, then the mask keeps the reversed bytes
+    only on the reverse scored questions. Bytes after the inventory are kept.
+
+    Args:
+        - data: The answers, one byte per question.
+        - mask: The mask of the inventory, see reverse_mask.
+    """
+    if not mask:
+        return bytes(data)
+
+    size = len(data)
+    value = int.from_bytes(data, "little")
+    translated = int.from_bytes(data.translate(REVERSE_TABLE), "little")
+
+    return ((value & ~mask) | (translated & mask)).to_bytes(size, "little")
@@ -0,0 +1,72 @@
+"""Immutable scale settings used to score, shared safely between threads."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from collections import namedtuple
+
+from ipipneo.model import FacetLevel, NormScale
+from ipipneo.table import ScoreTable, score_table
+
+
+def _int_pair(value, field: str) -> tuple:
+    value = tuple(value)
+    assert len(value) == 2 and all(
+        isinstance(x, int) for x in value
+    ), f"The ({field}) field must be a pair of ints!"
+    return int(value[0]), int(value[1])
+
+
+class ScoringConfig(namedtuple("ScoringConfig", ("norm_scale", "facet_level"))):
+    """
+    The norm scale (min, max) and the facet level (low, high) of a score.
+
+    A config is frozen and hashable: IpipNeo binds one at construction and
+    every call may bring another, so one scorer serves many tenants at once
+    without shared mutable settings. The score tables are built once per
+    config and norm group, see table.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        norm_scale: tuple = (NormScale.CONST_MIN.value, NormScale.CONST_MAX.value),
+        facet_level: tuple = (FacetLevel.LOW.value, FacetLevel.HIGH.value),
+    ):
+        """
+        Create a config.
+
+        Args:
+            - norm_scale: The minimum and maximum value of the norm scale.
+            - facet_level: The values considered low and high.
+        """
+        return super().__new__(
+            cls,
+            _int_pair(norm_scale, "norm_scale"),
+            _int_pair(facet_level, "facet_level"),
+        )
+
+    def table(self, nquestion: int, ns: tuple) -> ScoreTable:
+        """
+        Return the score table of a norm group with these settings.
+
+        Args:
+            - nquestion: Question type, 120 or 300.
+            - ns: The values of norms.
+        """
+        return score_table(
+            nquestion=nquestion,
+            ns=ns,
+            norm_scale=self.norm_scale,
+            facet_level=self.facet_level,
+        )
+
+
+# Settings of the published norms, used when no config is given.
+DEFAULT_CONFIG = ScoringConfig()
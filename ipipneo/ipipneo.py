@@ -8,31 +8,62 @@ __license__ = "MIT"
 __version__ = "1.13.1"
 __status__ = "production"
 
-import copy
-import uuid
+from operator import itemgetter
 
+from ipipneo.cache import ResultCache
+from ipipneo.codec import (raise_if_encoded_is_invalid, reverse_answers,
+                           unpack_answers)
+from ipipneo.config import DEFAULT_CONFIG, ScoringConfig
 from ipipneo.facet import Facet
 from ipipneo.model import FacetLevel, NormScale, QuestionNumber
 from ipipneo.norm import Norm
-from ipipneo.reverse import (ReverseScored120, ReverseScored300,
-                             ReverseScoredCustom)
-from ipipneo.utility import (add_dict_footer, organize_list_json,
-                             raise_if_age_is_invalid, raise_if_sex_is_invalid)
+from ipipneo.plan import scoring_plan
+from ipipneo.result import Result
+from ipipneo.reverse import reverse_selected, reverse_values
+from ipipneo.timing import StageTimer
+from ipipneo.utility import (integral_answers, place_answers,
+                             raise_if_age_is_invalid, raise_if_sex_is_invalid,
+                             validate_answers)
+
+# Struct codes of the integer buffers accepted by compute_vector.
+BUFFER_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
 
 
 class IpipNeo(Facet):
     """Class that calculates IPIP-NEO answers."""
 
-    def __init__(self, question: int, test: bool = False) -> None:
+    def __init__(
+        self,
+        question: int,
+        test: bool = False,
+        trusted: bool = False,
+        cache: ResultCache = None,
+        timer: StageTimer = None,
+        config: ScoringConfig = None,
+    ) -> None:
         """
         Initialize the class.
 
         Args:
             - question: Question type, 120 or 300.
             - test: Used to test your proposed questions with reverse.
+            - trusted: Skip the validation of answers already validated upstream.
+            - cache: Reuse the scores of answers already computed, see ResultCache.
+            - timer: Record the wall time of each stage, see StageTimer.
+            - config: The scale settings of every call without its own, see ScoringConfig.
         """
         assert isinstance(question, int), "The (question) field must be an int!"
         assert isinstance(test, bool), "The (test) field must be a bool!"
+        assert isinstance(trusted, bool), "The (trusted) field must be a bool!"
+        assert cache is None or isinstance(
+            cache, ResultCache
+        ), "The (cache) field must be a ResultCache!"
+        assert timer is None or isinstance(
+            timer, StageTimer
+        ), "The (timer) field must be a StageTimer!"
+        assert config is None or isinstance(
+            config, ScoringConfig
+        ), "The (config) field must be a ScoringConfig!"
 
         question_mapping = {
             120: QuestionNumber.IPIP_120,
@@ -47,25 +78,29 @@ class IpipNeo(Facet):
         super().__init__(nquestion)
         self._nquestion: int = question
         self._test: bool = test
-        self._norm_scale_min: int = None
-        self._norm_scale_max: int = None
-        self._score_level_low: int = None
-        self._score_level_high: int = None
+        self._trusted: bool = trusted
+        self._cache: ResultCache = cache
+        self._timer: StageTimer = timer
+        self._plan = scoring_plan(nquestion=question, custom=test)
+        self._config: ScoringConfig = config or DEFAULT_CONFIG
 
     def __del__(self):
         """Clear data."""
         self._nquestion: int = None
         self._test: bool = False
-        self._norm_scale_min: int = None
-        self._norm_scale_max: int = None
-        self._score_level_low: int = None
-        self._score_level_high: int = None
+        self._config: ScoringConfig = None
+
+    @property
+    def config(self) -> ScoringConfig:
+        """The ScoringConfig of the calls without their own."""
+        return self._config
 
     def set_new_norm_scale(self, scale_min: int, scale_max: int) -> None:
         """
         Used to set a new norm scale. Used for testing only.
 
-        The default is min=32 and max=73.
+        The default is min=32 and max=73, a zero value keeps its default. The
+        bound config is replaced, the calls already running keep the previous one.
 
         Args:
             - scale_min: The minimum value of the norm scale.
@@ -74,20 +109,24 @@ class IpipNeo(Facet):
         assert isinstance(scale_min, int), "The (scale_min) field must be an int!"
         assert isinstance(scale_max, int), "The (scale_max) field must be an int!"
 
-        self._norm_scale_min = int(scale_min)
-        self._norm_scale_max = int(scale_max)
+        self._config = ScoringConfig(
+            norm_scale=(
+                scale_min or NormScale.CONST_MIN.value,
+                scale_max or NormScale.CONST_MAX.value,
+            ),
+            facet_level=self._config.facet_level,
+        )
 
     def get_current_norm(self) -> tuple:
         """Shows the values ​​of the current level scale used."""
-        if self._norm_scale_min is not None and self._norm_scale_max is not None:
-            return self._norm_scale_min, self._norm_scale_max
-        return NormScale.CONST_MIN.value, NormScale.CONST_MAX.value
+        return self._config.norm_scale
 
     def set_new_facet_level(self, low_min: int, high_max: int) -> None:
         """
         Used to set a new facet level. Used for testing only.
 
-        The default is low=45 and high=55.
+        The default is low=45 and high=55, a zero value keeps its default. The
+        bound config is replaced, the calls already running keep the previous one.
 
         Args:
             - low_min: Value considered low.
@@ -96,16 +135,21 @@ class IpipNeo(Facet):
         assert isinstance(low_min, int), "The (low_min) field must be an int!"
         assert isinstance(high_max, int), "The (high_max) field must be an int!"
 
-        self._score_level_low = int(low_min)
-        self._score_level_high = int(high_max)
+        self._config = ScoringConfig(
+            norm_scale=self._config.norm_scale,
+            facet_level=(
+                low_min or FacetLevel.LOW.value,
+                high_max or FacetLevel.HIGH.value,
+            ),
+        )
 
     def get_current_scale_level(self) -> tuple:
         """Shows the values ​​of the current level scale used."""
-        if self._score_level_low is not None and self._score_level_high is not None:
-            return self._score_level_low, self._score_level_high
-        return FacetLevel.LOW.value, FacetLevel.HIGH.value
+        return self._config.facet_level
 
-    def evaluator(self, sex: str, age: int, score: list) -> dict:
+    def evaluator(
+        self, sex: str, age: int, score: list, config: ScoringConfig = None
+    ) -> dict:
         """
         Apply the calculation of the Big5 and its personalities based on the answers.
 
@@ -113,200 +157,83 @@ class IpipNeo(Facet):
             - sex: Gender of the individual (M or F or N).
             - age: The age of the individual.
             - score: The normalized score.
+            - config: The scale settings of this call, by default the bound config.
         """
-        norm = Norm(sex=sex, age=age, nquestion=self._nquestion)
-        assert isinstance(norm, dict), "norm must be a dict"
-
-        normc = Norm.calc(domain=self.domain(score=score), norm=norm)
-        assert isinstance(normc, dict), "normc must be a dict"
+        raise_if_sex_is_invalid(sex=sex)
+        raise_if_age_is_invalid(age=age)
 
-        distrib = self.distrib(
-            size=len(score), b5=self.b5create(score=score), norm=norm
+        return self._evaluate(
+            sex=sex, age=age, facets=score[1:31], config=config or self._config
         )
-        assert isinstance(distrib, dict), "distrib must be a dict"
 
-        normalize = Norm.normalize(
-            normc=normc,
-            percent=Norm.percent(normc=normc),
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-        )
-        assert isinstance(normalize, dict), "normalize must be a dict"
-
-        N = self.personality(
-            size=len(score),
-            big5=normalize,
-            traits=distrib,
-            label="N",
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-            facet_score_level_low=(
-                self._score_level_low if self._score_level_low else None
-            ),
-            facet_score_level_high=(
-                self._score_level_high if self._score_level_high else None
-            ),
-        )
-        E = self.personality(
-            size=len(score),
-            big5=normalize,
-            traits=distrib,
-            label="E",
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-            facet_score_level_low=(
-                self._score_level_low if self._score_level_low else None
-            ),
-            facet_score_level_high=(
-                self._score_level_high if self._score_level_high else None
-            ),
-        )
-        O = self.personality(
-            size=len(score),
-            big5=normalize,
-            traits=distrib,
-            label="O",
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-            facet_score_level_low=(
-                self._score_level_low if self._score_level_low else None
-            ),
-            facet_score_level_high=(
-                self._score_level_high if self._score_level_high else None
-            ),
-        )
-        A = self.personality(
-            size=len(score),
-            big5=normalize,
-            traits=distrib,
-            label="A",
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-            facet_score_level_low=(
-                self._score_level_low if self._score_level_low else None
-            ),
-            facet_score_level_high=(
-                self._score_level_high if self._score_level_high else None
-            ),
-        )
-        C = self.personality(
-            size=len(score),
-            big5=normalize,
-            traits=distrib,
-            label="C",
-            norm_scale_min=self._norm_scale_min if self._norm_scale_min else None,
-            norm_scale_max=self._norm_scale_max if self._norm_scale_max else None,
-            facet_score_level_low=(
-                self._score_level_low if self._score_level_low else None
-            ),
-            facet_score_level_high=(
-                self._score_level_high if self._score_level_high else None
-            ),
-        )
-        assert isinstance(O, dict), "O must be a dict"
-        assert isinstance(C, dict), "C must be a dict"
-        assert isinstance(E, dict), "E must be a dict"
-        assert isinstance(A, dict), "A must be a dict"
-        assert isinstance(N, dict), "N must be a dict"
-
-        return {
-            "id": str(uuid.uuid4()),
-            "theory": "Big 5 Personality Traits",
-            "model": "IPIP-NEO" if self._nquestion == 120 else "IPIP",
-            "question": self._nquestion,
-            "test": self._test,
-            "person": {
-                "sex": sex,
-                "age": age,
-                "result": {
-                    "personalities": [
-                        {
-                            "openness": self.big_five_level(
-                                big5=O,
-                                label="O",
-                                facet_score_level_low=(
-                                    self._score_level_low
-                                    if self._score_level_low
-                                    else None
-                                ),
-                                facet_score_level_high=(
-                                    self._score_level_high
-                                    if self._score_level_high
-                                    else None
-                                ),
-                            )
-                        },
-                        {
-                            "conscientiousness": self.big_five_level(
-                                big5=C,
-                                label="C",
-                                facet_score_level_low=(
-                                    self._score_level_low
-                                    if self._score_level_low
-                                    else None
-                                ),
-                                facet_score_level_high=(
-                                    self._score_level_high
-                                    if self._score_level_high
-                                    else None
-                                ),
-                            )
-                        },
-                        {
-                            "extraversion": self.big_five_level(
-                                big5=E,
-                                label="E",
-                                facet_score_level_low=(
-                                    self._score_level_low
-                                    if self._score_level_low
-                                    else None
-                                ),
-                                facet_score_level_high=(
-                                    self._score_level_high
-                                    if self._score_level_high
-                                    else None
-                                ),
-                            )
-                        },
-                        {
-                            "agreeableness": self.big_five_level(
-                                big5=A,
-                                label="A",
-                                facet_score_level_low=(
-                                    self._score_level_low
-                                    if self._score_level_low
-                                    else None
-                                ),
-                                facet_score_level_high=(
-                                    self._score_level_high
-                                    if self._score_level_high
-                                    else None
-                                ),
-                            )
-                        },
-                        {
-                            "neuroticism": self.big_five_level(
-                                big5=N,
-                                label="N",
-                                facet_score_level_low=(
-                                    self._score_level_low
-                                    if self._score_level_low
-                                    else None
-                                ),
-                                facet_score_level_high=(
-                                    self._score_level_high
-                                    if self._score_level_high
-                                    else None
-                                ),
-                            )
-                        },
-                    ]
-                },
-            },
-            **add_dict_footer(),
-        }
+    def _evaluate(
+        self, sex: str, age: int, facets: list, config: ScoringConfig
+    ) -> dict:
+        """
+        Build the result of validated people from the 30 raw facet sums.
 
-    def compute(self, sex: str, age: int, answers: dict, compare: bool = False) -> dict:
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - facets: The raw facet sums, in inventory order.
+            - config: The scale settings used.
+        """
+        result = self._result(sex=sex, age=age, facets=facets, config=config)
+
+        timer = self._timer
+        if timer is None:
+            return result.to_dict()
+
+        mark = timer.start()
+        result = result.to_dict()
+        timer.lap("dict", mark)
+        return result
+
+    def _result(
+        self, sex: str, age: int, facets: list, config: ScoringConfig
+    ) -> Result:
+        """
+        Score validated people from the 30 raw facet sums, as a compact Result.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - facets: The raw facet sums, in inventory order.
+            - config: The scale settings used.
+        """
+        timer = self._timer
+        if timer is not None:
+            mark = timer.start()
+
+        ns = Norm.lookup(sex=sex, age=age, nquestion=self._nquestion).ns
+        if timer is not None:
+            mark = timer.lap("norm", mark)
+
+        table = config.table(nquestion=self._nquestion, ns=ns)
+        if timer is not None:
+            mark = timer.lap("table", mark)
+
+        result = Result.from_evaluation(
+            question=self._nquestion,
+            test=self._test,
+            sex=sex,
+            age=age,
+            evaluation=self._plan.evaluate(facets=facets, table=table),
+        )
+        if timer is not None:
+            timer.lap("evaluate", mark)
+
+        return result
+
+    def compute(
+        self,
+        sex: str,
+        age: int,
+        answers: dict,
+        compare: bool = False,
+        compact: bool = False,
+        config: ScoringConfig = None,
+    ) -> dict | Result:
         """
         Compute the answers and generate the data with the results.
 
@@ -315,41 +242,545 @@ class IpipNeo(Facet):
             - age: The age of the individual.
             - answers: Standardized dictionary with answers.
             - compare: If true, it shows the user's answers and reverse score.
+            - compact: If true, return a Result, see Result.to_dict.
+            - config: The scale settings of this call, by default the bound config.
         """
         raise_if_sex_is_invalid(sex=sex)
         raise_if_age_is_invalid(age=age)
         assert isinstance(answers, dict), "answers must be a dict"
 
-        original = copy.deepcopy(answers)
-        assert isinstance(original, dict), "original must be a dict"
+        timer = self._timer
+        if timer is not None:
+            mark = timer.start()
 
-        reversed = (
-            ReverseScoredCustom(answers=copy.deepcopy(answers))
-            if self._test
-            else (
-                ReverseScored120(answers=copy.deepcopy(answers))
-                if self._nquestion == 120
-                else ReverseScored300(answers=copy.deepcopy(answers))
-            )
-        )
-        assert isinstance(reversed, dict), "reversed must be a dict"
+        values, reverse = self._ordered_answers(answers=answers)
+        if timer is not None:
+            timer.lap("answers", mark)
 
-        score = self.score(answers=organize_list_json(answers=reversed))
-        assert isinstance(score, list), "score must be a list"
+        result = self._score(
+            sex=sex,
+            age=age,
+            values=values,
+            reverse=reverse,
+            config=config or self._config,
+        )
+        assert isinstance(result, Result), "result must be a Result"
 
-        result = self.evaluator(sex=sex, age=age, score=score)
-        assert isinstance(result, dict), "result 1 must be a dict"
+        if timer is not None:
+            mark = timer.start()
 
         if compare:
-            result["person"]["result"]["compare"] = {
-                "user_answers_original": original.get("answers", []),
-                "user_answers_reversed": reversed.get("answers", []),
+            items = answers.get("answers", [])
+            selected = reverse_selected(
+                answers=items,
+                keys=None if self._test else self._plan.reversed_items,
+            )
+
+            result.compare = {
+                "user_answers_original": [{**x} for x in items],
+                "user_answers_reversed": [
+                    {**x, "id_select": y} for x, (_, y) in zip(items, selected)
+                ],
             }
-        assert isinstance(result, dict), "result 2 must be a dict"
+            if timer is not None:
+                mark = timer.lap("compare", mark)
+
+        if compact:
+            return result
+
+        result = result.to_dict()
+        if timer is not None:
+            timer.lap("dict", mark)
+
+        return result
 
-        if "answers" in locals():
-            del answers
-        if "original" in locals():
-            del original
+    def _ordered_answers(self, answers: dict) -> tuple:
+        """
+        Return the selected options ordered by id_question and the reverse flags.
+
+        The answers are checked by validate_answers, unless the instance is
+        trusted. The reverse flags are only read in test mode (else None).
+
+        Args:
+            - answers: Dictionary with the list of answers.
+        """
+        if not self._trusted:
+            return validate_answers(
+                answers=answers, nquestion=self._nquestion, custom=self._test
+            )
+
+        items = answers["answers"]
+
+        if not self._test:
+            return place_answers(answers=items, nquestion=self._nquestion), None
+
+        items = sorted(items, key=itemgetter("id_question"))
+        return (
+            [x["id_select"] for x in items],
+            [x.get("reverse_scored") == 1 for x in items],
+        )
 
-        return result or {}
+    def _compute_values(
+        self,
+        sex: str,
+        age: int,
+        values: list,
+        compact: bool = False,
+        config: ScoringConfig = None,
+    ) -> dict | Result:
+        """
+        Compute validated people from the answers ordered by id_question.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - values: The selected options (1 to 5) ordered by id_question.
+            - compact: If true, return a Result, see Result.to_dict.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        timer = self._timer
+        if timer is not None:
+            mark = timer.start()
+
+        if isinstance(values, (bytes, bytearray)):
+            if not self._trusted:
+                raise_if_encoded_is_invalid(data=values)
+        elif not self._trusted and not all(
+            type(x) is int and 1 <= x <= 5 for x in values
+        ):
+            values = integral_answers(values=values)
+
+        if timer is not None:
+            timer.lap("answers", mark)
+
+        result = self._score(
+            sex=sex, age=age, values=values, config=config or self._config
+        )
+
+        if compact:
+            return result
+
+        if timer is None:
+            return result.to_dict()
+
+        mark = timer.start()
+        result = result.to_dict()
+        timer.lap("dict", mark)
+        return result
+
+    def _score(
+        self,
+        sex: str,
+        age: int,
+        values: list | bytes,
+        config: ScoringConfig,
+        reverse: list = None,
+    ) -> Result:
+        """
+        Score the validated answers, through the cache when there is one.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - values: The selected options (1 to 5) ordered by id_question.
+            - reverse: Items to reverse score in test mode (else the inventory keys).
+            - config: The scale settings used.
+        """
+        timer = self._timer
+        if timer is not None:
+            mark = timer.start()
+
+        key = None
+        if self._cache is not None:
+            key = self._cache_key(
+                sex=sex, age=age, values=values, reverse=reverse, config=config
+            )
+            cached = self._cache.get(key)
+            if timer is not None:
+                mark = timer.lap("cache", mark)
+            if cached is not None:
+                scores, levels = cached
+                return Result(
+                    question=self._nquestion,
+                    test=self._test,
+                    sex=sex,
+                    age=age,
+                    scores=scores,
+                    levels=levels,
+                )
+
+        if isinstance(values, (bytes, bytearray)):
+            values = reverse_answers(data=values, mask=self._plan.reverse_mask)
+        else:
+            values = reverse_values(values=values, mask=reverse or self._plan.reverse)
+        if timer is not None:
+            mark = timer.lap("reverse", mark)
+
+        facets = self._plan.facet_sums(values=values)
+        assert isinstance(facets, list), "facets must be a list"
+        if timer is not None:
+            timer.lap("facets", mark)
+
+        result = self._result(sex=sex, age=age, facets=facets, config=config)
+
+        if key is not None:
+            self._cache.put(key, (result.scores, result.levels))
+
+        return result
+
+    def _cache_key(
+        self,
+        sex: str,
+        age: int,
+        values: list | bytes,
+        config: ScoringConfig,
+        reverse: list = None,
+    ) -> tuple:
+        """
+        Key of the cache: inventory, norm group, scale settings and answers.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - values: The selected options ordered by id_question.
+            - reverse: Items to reverse score in test mode.
+            - config: The scale settings used.
+        """
+        try:
+            answers = bytes(values)
+        except (TypeError, ValueError):
+            answers = tuple(values)
+
+        return (
+            self._nquestion,
+            self._test,
+            Norm.lookup(sex=sex, age=age, nquestion=self._nquestion),
+            config,
+            answers,
+            None if reverse is None else bytes(reverse),
+        )
+
+    def compute_encoded(
+        self,
+        sex: str,
+        age: int,
+        data: bytes,
+        compact: bool = False,
+        config: ScoringConfig = None,
+    ) -> dict | Result:
+        """
+        Compute a person from the compact answers of ipipneo.codec.
+
+        The data is either one byte per question (encode_answers) or three
+        bits per question (pack_answers), told apart by its length.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - data: The encoded answers ordered by id_question.
+            - compact: If true, return a Result, see Result.to_dict.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        assert isinstance(data, (bytes, bytearray)), "The (data) field must be bytes!"
+
+        if len(data) == (3 * self._nquestion + 7) // 8:
+            data = unpack_answers(data=data)
+
+        return self.compute_vector(
+            sex=sex, age=age, values=data, compact=compact, config=config
+        )
+
+    def compute_vector(
+        self,
+        sex: str,
+        age: int,
+        values,
+        compact: bool = False,
+        config: ScoringConfig = None,
+    ) -> dict | Result:
+        """
+        Compute a person from the selected options ordered by id_question.
+
+        Accepts any ordered sequence (list, tuple, range) or buffer of integers,
+        like bytes, array("B"), memoryview or a NumPy row or column, without
+        building the answers dictionary. Unsigned byte buffers are copied to
+        bytes and reverse scored with a single translate, the others are read
+        in place. Each item is checked like compute.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - values: The selected options (1 to 5) ordered by id_question.
+            - compact: If true, return a Result, see Result.to_dict.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        assert not self._test, "Test mode requires the answers dictionary!"
+
+        raise_if_sex_is_invalid(sex=sex)
+        raise_if_age_is_invalid(age=age)
+
+        if not isinstance(values, (bytes, bytearray, list, tuple)):
+            try:
+                view = memoryview(values)
+            except TypeError:
+                view = None
+
+            if view is not None:
+                assert view.ndim == 1, "The (values) field must be one dimensional!"
+                assert (
+                    view.format.lstrip("@=<>!") in BUFFER_INTEGER_FORMATS
+                ), "The (values) field must hold integers!"
+                if view.format.lstrip("@=<>!") == "B":
+                    values = view.tobytes()
+                else:
+                    values = view
+
+        if len(values) != self._nquestion:
+            raise BaseException(
+                f"The number of questions setting is wrong: expected "
+                f"{self._nquestion} answers, got {len(values)}"
+            )
+
+        return self._compute_values(
+            sex=sex, age=age, values=values, compact=compact, config=config
+        )
+
+    def iter_compute(
+        self, records, compare: bool = False, config: ScoringConfig = None
+    ):
+        """
+        Compute an iterable of people lazily, one result per record.
+
+        Records are (sex, age, answers) tuples, where answers is the standardized
+        dictionary or the selected options ordered by id_question. A record that
+        fails does not stop the stream, an error dictionary is yielded in its place
+        with the record index, the exception type and its message. A record may
+        also be the exception of a record that could not be read.
+
+        Args:
+            - records: Iterable of (sex, age, answers) records.
+            - compare: If true, it shows the user's answers and reverse score.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        for index, record in enumerate(records):
+            try:
+                if isinstance(record, BaseException):
+                    raise record
+
+                sex, age, answers = record
+
+                if isinstance(answers, dict):
+                    result = self.compute(
+                        sex=sex,
+                        age=age,
+                        answers=answers,
+                        compare=compare,
+                        config=config,
+                    )
+                else:
+                    result = self.compute_vector(
+                        sex=sex, age=age, values=answers, config=config
+                    )
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except BaseException as e:
+                result = {"index": index, "error": type(e).__name__, "message": str(e)}
+
+            yield result
+
+    def compute_many(
+        self,
+        records,
+        workers: int = None,
+        chunksize: int = 256,
+        ordered: bool = True,
+        compare: bool = False,
+        strict: bool = True,
+        config: ScoringConfig = None,
+    ):
+        """
+        Compute many people in parallel over a pool of worker processes.
+
+        The results are yielded lazily, in the same order as the records. With
+        (ordered=False) each result is yielded as an (index, result) pair as
+        soon as it is ready, see ipipneo.parallel.compute_many.
+
+        Args:
+            - records: Iterable of (sex, age, answers) records.
+            - workers: Number of processes, the number of CPUs by default.
+            - chunksize: Number of records sent to a worker at a time.
+            - ordered: If false, yield (index, result) in completion order.
+            - compare: If true, it shows the user's answers and reverse score.
+            - strict: If false, failed records yield an error dictionary.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        from ipipneo.parallel import compute_many
+
+        return compute_many(
+            scorer=self,
+            records=records,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            compare=compare,
+            strict=strict,
+            config=config,
+        )
+
+    async def compute_async(
+        self,
+        sex: str,
+        age: int,
+        answers,
+        compare: bool = False,
+        compact: bool = False,
+        executor=None,
+        timeout: float = None,
+        limit=None,
+        config: ScoringConfig = None,
+    ) -> dict | Result:
+        """
+        Compute a person in an executor, without blocking the event loop.
+
+        Threads share this instance, processes use a copy with the same
+        settings, see ipipneo.aio.compute_async.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - answers: Standardized dictionary or the ordered selected options.
+            - compare: If true, it shows the user's answers and reverse score.
+            - compact: If true, return a Result, see Result.to_dict.
+            - executor: Thread or process executor, None for the loop's default.
+            - timeout: Seconds to wait, an asyncio.TimeoutError is raised after it.
+            - limit: asyncio.Semaphore shared by the callers to bound the computations in flight.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        from ipipneo.aio import compute_async
+
+        return await compute_async(
+            scorer=self,
+            sex=sex,
+            age=age,
+            answers=answers,
+            compare=compare,
+            compact=compact,
+            executor=executor,
+            timeout=timeout,
+            limit=limit,
+            config=config,
+        )
+
+    def iter_compute_async(
+        self,
+        records,
+        compare: bool = False,
+        executor=None,
+        concurrency: int = None,
+        timeout: float = None,
+        ordered: bool = True,
+        config: ScoringConfig = None,
+    ):
+        """
+        Compute (sex, age, answers) records in an executor, as an async iterator.
+
+        At most (concurrency) records are in flight. Like iter_compute, a record
+        that fails (or times out) yields an error dictionary, see
+        ipipneo.aio.iter_compute_async.
+
+        Args:
+            - records: Iterable or async iterable of (sex, age, answers) records.
+            - compare: If true, it shows the user's answers and reverse score.
+            - executor: Thread or process executor, None for the loop's default.
+            - concurrency: Maximum records in flight, twice the number of CPUs by default.
+            - timeout: Seconds to wait for each record.
+            - ordered: If false, yield (index, result) in completion order.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        from ipipneo.aio import iter_compute_async
+
+        return iter_compute_async(
+            scorer=self,
+            records=records,
+            compare=compare,
+            executor=executor,
+            concurrency=concurrency,
+            timeout=timeout,
+            ordered=ordered,
+            config=config,
+        )
+
+    def session(
+        self, sex: str, age: int, answers: dict = None, config: ScoringConfig = None
+    ):
+        """
+        Start an IncrementalSession with the settings of this instance.
+
+        The answers are added one at a time and a provisional result is
+        available at any moment, see ipipneo.session.IncrementalSession.
+        With all the answers, the session is the state used to rescore
+        edited answers.
+
+        Args:
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - answers: Standardized dictionary with the answers already given.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        from ipipneo.session import IncrementalSession
+
+        session = IncrementalSession(
+            question=self._nquestion,
+            sex=sex,
+            age=age,
+            test=self._test,
+            config=config or self._config,
+        )
+
+        if answers is not None:
+            values, reverse = self._ordered_answers(answers=answers)
+            for i, value in enumerate(values, start=1):
+                session.answer(
+                    id_question=i,
+                    id_select=value,
+                    reverse_scored=int(bool(reverse and reverse[i - 1])),
+                )
+
+        return session
+
+    def compute_batch(
+        self,
+        sex: list,
+        age: list,
+        answers,
+        reverse=None,
+        config: ScoringConfig = None,
+    ):
+        """
+        Compute the answers of many people at once, one person per matrix row.
+
+        Requires the optional package (numpy). The results are the same as
+        calling compute for each row, stored by column in a BatchResult, see
+        ipipneo.batch.compute_batch.
+
+        Args:
+            - sex: Sequence with the gender of each individual (M or F or N).
+            - age: Sequence with the age of each individual.
+            - answers: Matrix (people, 120 or 300) with the answers ordered by id_question.
+            - reverse: Items to reverse score (bool mask), required when test is true.
+            - config: The scale settings of this call, by default the bound config.
+        """
+        from ipipneo.batch import compute_batch
+
+        if self._test and reverse is None:
+            raise BaseException("The (reverse) mask is required in test mode!")
+
+        return compute_batch(
+            nquestion=self._nquestion,
+            sex=sex,
+            age=age,
+            answers=answers,
+            reverse=reverse,
+            config=config or self._config,
+            test=self._test,
+        )
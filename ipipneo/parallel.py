@@ -0,0 +1,348 @@
+"""Scoring of many people spread over a pool of worker processes."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from ipipneo.config import ScoringConfig
+from ipipneo.utility import (integral_answers, place_answers,
+                             raise_if_age_is_invalid, raise_if_sex_is_invalid,
+                             validate_answers)
+
+# Scorer of the worker process, created once by the pool initializer and
+# reused (with its warm norm tables) for every chunk.
+_scorer = None
+
+
+def init_worker(
+    question: int, test: bool, config: ScoringConfig, trusted: bool = False
+) -> None:
+    """
+    Create the scorer of a worker process.
+
+    Args:
+        - question: Question type, 120 or 300.
+        - test: Used to test your proposed questions with reverse.
+        - config: The scale settings bound to the scorer.
+        - trusted: Skip the validation of answers already validated upstream.
+    """
+    from ipipneo.ipipneo import IpipNeo
+
+    global _scorer
+    _scorer = IpipNeo(question=question, test=test, trusted=trusted, config=config)
+
+
+def pack_record(record, nquestion: int, full: bool = False) -> tuple:
+    """
+    Validate a (sex, age, answers) record, return its sex, age and answers bytes.
+
+    Args:
+        - record: The (sex, age, answers) record, or the exception of a record
+          that could not be read.
+        - nquestion: Question type, 120 or 300.
+        - full: If true, the answers dictionary is fully checked, with the errors of compute.
+    """
+    if isinstance(record, BaseException):
+        raise record
+
+    sex, age, answers = record
+    raise_if_sex_is_invalid(sex=sex)
+    raise_if_age_is_invalid(age=age)
+
+    if isinstance(answers, dict):
+        if full:
+            answers, _ = validate_answers(answers=answers, nquestion=nquestion)
+        else:
+            answers = place_answers(
+                answers=answers.get("answers", []), nquestion=nquestion
+            )
+
+    if len(answers) != nquestion:
+        raise BaseException(
+            f"The number of questions setting is wrong: expected "
+            f"{nquestion} answers, got {len(answers)}"
+        )
+
+    try:
+        answers = bytes(answers)
+    except (TypeError, ValueError):
+        answers = bytes(integral_answers(values=answers))
+
+    return sex, age, answers
+
+
+def record_error(error: BaseException, index: int, strict: bool):
+    """
+    Return what is sent in place of a failed record.
+
+    Args:
+        - error: The exception of the record.
+        - index: Index of the record in the input.
+        - strict: If true, the exception itself, raised when the record is reached.
+    """
+    if strict:
+        return error
+    return {"index": index, "error": type(error).__name__, "message": str(error)}
+
+
+def pack_chunk(
+    records: list,
+    nquestion: int,
+    compare: bool,
+    test: bool,
+    strict: bool = True,
+    start: int = 0,
+) -> tuple:
+    """
+    Convert a chunk of (sex, age, answers) records into a compact payload.
+
+    Standard inventories are sent as one string with the sexes and two byte
+    strings with the ages and the ordered answers. Comparisons and custom
+    reverse scoring need the original dictionaries, which are sent as is.
+
+    The errors are sent with the payload by position in the chunk, so the
+    results before a failed record are still yielded in input order. In strict
+    mode the chunk stops at the first failed record, whose exception is raised
+    when it is reached, otherwise each one becomes an error dictionary, see
+    iter_compute.
+
+    Args:
+        - records: List of (sex, age, answers) records.
+        - nquestion: Question type, 120 or 300.
+        - compare: If true, it shows the user's answers and reverse score.
+        - test: Used to test your proposed questions with reverse.
+        - strict: If false, failed records become an error dictionary.
+        - start: Index of the first record of the chunk.
+    """
+    if compare or test:
+        return "records", (records, compare, strict, start)
+
+    sexes, ages, values, errors = [], bytearray(), bytearray(), {}
+    for position, record in enumerate(records):
+        try:
+            sex, age, answers = pack_record(
+                record=record, nquestion=nquestion, full=not strict
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException as e:
+            errors[position] = record_error(
+                error=e, index=start + position, strict=strict
+            )
+            if strict:
+                break
+            continue
+
+        sexes.append(sex)
+        ages.append(age)
+        values.extend(answers)
+
+    return "packed", (
+        "".join(sexes),
+        bytes(ages),
+        bytes(values),
+        errors,
+        strict,
+        start,
+    )
+
+
+def score_record(sex: str, age: int, answers, compare: bool):
+    """
+    Score one record in the worker process, like iter_compute.
+
+    Args:
+        - sex: Gender of the individual (M or F or N).
+        - age: The age of the individual.
+        - answers: Standardized dictionary or the selected options ordered by id_question.
+        - compare: If true, it shows the user's answers and reverse score.
+    """
+    if isinstance(answers, dict):
+        return _scorer.compute(sex=sex, age=age, answers=answers, compare=compare)
+    return _scorer.compute_vector(sex=sex, age=age, values=answers)
+
+
+def score_chunk(chunk: tuple) -> list:
+    """
+    Score a chunk in the worker process.
+
+    Args:
+        - chunk: Payload created by pack_chunk.
+    """
+    kind, payload = chunk
+
+    if kind == "records":
+        records, compare, strict, start = payload
+        result = []
+        for position, record in enumerate(records):
+            try:
+                if isinstance(record, BaseException):
+                    raise record
+
+                sex, age, answers = record
+                result.append(
+                    score_record(sex=sex, age=age, answers=answers, compare=compare)
+                )
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except BaseException as e:
+                result.append(
+                    record_error(error=e, index=start + position, strict=strict)
+                )
+                if strict:
+                    break
+        return result
+
+    sexes, ages, values, errors, strict, start = payload
+    size = _scorer._nquestion
+
+    if not errors:
+        try:
+            return [
+                _scorer._compute_values(
+                    sex=sex, age=age, values=values[i * size : (i + 1) * size]
+                )
+                for i, (sex, age) in enumerate(zip(sexes, ages))
+            ]
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException:
+            # Scored again one by one below, to place the error.
+            pass
+
+    result, i = [], 0
+    for position in range(len(sexes) + len(errors)):
+        if position in errors:
+            result.append(errors[position])
+            continue
+
+        try:
+            result.append(
+                _scorer._compute_values(
+                    sex=sexes[i], age=ages[i], values=values[i * size : (i + 1) * size]
+                )
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException as e:
+            result.append(record_error(error=e, index=start + position, strict=strict))
+            if strict:
+                break
+        i += 1
+
+    return result
+
+
+def chunk_results(results: list):
+    """
+    Yield the results of a chunk, raising the error of a failed record in strict mode.
+
+    Args:
+        - results: List returned by score_chunk.
+    """
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        yield result
+
+
+def compute_many(
+    scorer,
+    records,
+    workers: int = None,
+    chunksize: int = 256,
+    ordered: bool = True,
+    compare: bool = False,
+    strict: bool = True,
+    config: ScoringConfig = None,
+):
+    """
+    Score (sex, age, answers) records over a pool of processes.
+
+    Records are read lazily and at most a few chunks per worker are in
+    flight, so memory stays bounded for any number of records. In ordered
+    mode the results are yielded in input order, otherwise each result is
+    yielded as an (index, result) pair as soon as its chunk is ready.
+
+    Args:
+        - scorer: The IpipNeo whose settings are used by the workers.
+        - records: Iterable of (sex, age, answers) records.
+        - workers: Number of processes, the number of CPUs by default.
+        - chunksize: Number of records sent to a worker at a time.
+        - ordered: If false, yield (index, result) in completion order.
+        - compare: If true, it shows the user's answers and reverse score.
+        - strict: If false, failed records yield an error dictionary, see iter_compute.
+        - config: The scale settings used, by default the config of the scorer.
+    """
+    assert (
+        isinstance(chunksize, int) and chunksize > 0
+    ), "The (chunksize) field must be a positive int!"
+
+    workers = workers or os.cpu_count() or 1
+    records = iter(records)
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(
+            scorer._nquestion,
+            scorer._test,
+            config or scorer._config,
+            scorer._trusted,
+        ),
+    )
+
+    starts = {}
+
+    def submit(start: int):
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            return None
+        payload = pack_chunk(
+            records=chunk,
+            nquestion=scorer._nquestion,
+            compare=compare,
+            test=scorer._test,
+            strict=strict,
+            start=start,
+        )
+        future = pool.submit(score_chunk, payload)
+        starts[future] = start
+        return future
+
+    try:
+        pending, start = deque(), 0
+        while True:
+            while len(pending) < 2 * workers:
+                future = submit(start=start)
+                if future is None:
+                    break
+                pending.append(future)
+                start += chunksize
+
+            if not pending:
+                break
+
+            if ordered:
+                future = pending.popleft()
+                starts.pop(future)
+                yield from chunk_results(results=future.result())
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield from enumerate(
+                    chunk_results(results=future.result()), start=starts.pop(future)
+                )
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
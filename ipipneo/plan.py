@@ -0,0 +1,166 @@
+"""Compiled index layout used to score an inventory in a single pass."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from functools import lru_cache
+
+from ipipneo.codec import reverse_mask
+from ipipneo.model import FacetScale, QuestionNumber
+from ipipneo.reverse import (IPIP_NEO_KEYS_REVERSED_120,
+                             IPIP_NEO_KEYS_REVERSED_300,
+                             IPIP_NEO_MASK_REVERSED_120,
+                             IPIP_NEO_MASK_REVERSED_300)
+from ipipneo.utility import big5_target
+
+BIG5_PERSONALITIES = (
+    ("openness", "O"),
+    ("conscientiousness", "C"),
+    ("extraversion", "E"),
+    ("agreeableness", "A"),
+    ("neuroticism", "N"),
+)
+BIG5_INVENTORY_ORDER = "NEOAC"
+
+
+class ScoringPlan:
+    """Item, facet and domain indexes of an inventory (120, 300 or custom)."""
+
+    __slots__ = (
+        "nquestion",
+        "custom",
+        "scale",
+        "item_facet",
+        "facet_slices",
+        "domains",
+        "reverse",
+        "reverse_mask",
+        "reversed_items",
+    )
+
+    def __init__(self, nquestion: int, custom: bool = False) -> None:
+        """
+        Compile the indexes once, the plan is read-only afterwards.
+
+        Facets are numbered by the position of their items in the inventory
+        (0..29) and domains follow the inventory order (N, E, O, A, C).
+
+        Args:
+            - nquestion: Question type, 120 or 300.
+            - custom: If true, reverse scoring comes from the answers (test).
+        """
+        reverse_mapping = {
+            120: (IPIP_NEO_KEYS_REVERSED_120, IPIP_NEO_MASK_REVERSED_120),
+            300: (IPIP_NEO_KEYS_REVERSED_300, IPIP_NEO_MASK_REVERSED_300),
+        }
+
+        if nquestion not in reverse_mapping:
+            raise ValueError(f"The available questions are: {list(QuestionNumber)}")
+
+        size = FacetScale.IPIP_MAX.value
+        keys, mask = reverse_mapping[nquestion]
+        if custom:
+            keys, mask = frozenset(), (False,) * int(nquestion)
+
+        set_value = super().__setattr__
+
+        set_value("nquestion", int(nquestion))
+        set_value("custom", bool(custom))
+        set_value("scale", int(nquestion) // size)
+        set_value("item_facet", tuple(i % size for i in range(nquestion)))
+        set_value(
+            "facet_slices", tuple(slice(i, int(nquestion), size) for i in range(size))
+        )
+        set_value(
+            "domains",
+            tuple(
+                (
+                    name,
+                    label,
+                    BIG5_INVENTORY_ORDER.index(label),
+                    tuple(BIG5_INVENTORY_ORDER.index(label) + 5 * j for j in range(6)),
+                    tuple(trait.value for trait in big5_target(label=label)),
+                )
+                for name, label in BIG5_PERSONALITIES
+            ),
+        )
+        set_value("reverse", mask)
+        set_value("reverse_mask", reverse_mask(reverse=mask))
+        set_value("reversed_items", keys)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("The scoring plan is read-only!")
+
+    def norm_stats(self, ns: tuple) -> tuple:
+        """
+        Return the (mean, deviation) pair of each facet and each domain.
+
+        The pairs are kept instead of a slope and intercept so the
+        z-scores are bit-identical with Facet.distrib and Norm.calc.
+
+        Args:
+            - ns: The values of norms.
+        """
+        facets = tuple(
+            (ns[i // 5 + 11 + 12 * (i % 5)], ns[i // 5 + 17 + 12 * (i % 5)])
+            for i in range(FacetScale.IPIP_MAX.value)
+        )
+        domains = tuple((ns[i + 1], ns[i + 6]) for i in range(5))
+
+        return facets, domains
+
+    def facet_sums(self, values: list) -> list | BaseException:
+        """
+        Sum the answers of each facet in one pass over the ordered values.
+
+        Args:
+            - values: The answers ordered by id_question, already reverse scored.
+        """
+        if len(values) < self.nquestion:
+            raise BaseException(
+                f"The number of questions setting is wrong: expected "
+                f"{self.nquestion} answers, got {len(values)}"
+            )
+
+        return [sum(values[s]) for s in self.facet_slices]
+
+    def evaluate(self, facets: list, table) -> tuple | BaseException:
+        """
+        Look up the domains and facets of a norm table, in OCEAN order.
+
+        Returns one (percent, level, traits) per domain, where traits holds
+        the six (percent, level) pairs of its facets.
+
+        Args:
+            - facets: The 30 raw facet sums.
+            - table: The ScoreTable of the person's norm group.
+        """
+        if len(facets) != FacetScale.IPIP_MAX.value:
+            raise BaseException(f"Invalid number of facets: {len(facets)}")
+
+        result = []
+        for _, _, domain, indexes, _ in self.domains:
+            percent, level = table.domain(
+                index=domain, raw=sum(facets[i] for i in indexes)
+            )
+            traits = tuple(table.facet(index=i, raw=facets[i]) for i in indexes)
+            result.append((percent, level, traits))
+
+        return tuple(result)
+
+
+@lru_cache(maxsize=None)
+def scoring_plan(nquestion: int, custom: bool = False) -> ScoringPlan:
+    """
+    Return the shared plan of an inventory.
+
+    Args:
+        - nquestion: Question type, 120 or 300.
+        - custom: If true, reverse scoring comes from the answers (test).
+    """
+    return ScoringPlan(nquestion=int(nquestion), custom=custom)
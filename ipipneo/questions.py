@@ -0,0 +1,94 @@
+"""Questions of the IPIP-NEO inventories and their translations, shipped with the package."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import json
+import os
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+
+# Environment variable with a local directory used instead of the package data.
+DATA_DIR_ENV = "IPIPNEO_DATA"
+
+# File of each language ID, relative to the directory of the inventory.
+QUESTION_FILES = {
+    0: "questions.json",
+    1: "translation/questions-en-us.json",
+    2: "translation/questions-pt-br.json",
+    3: "translation/questions-es-es.json",
+}
+
+
+def data_dir(directory: str = None):
+    """
+    Return the IPIP-NEO data directory (the one with the 120 and 300 folders).
+
+    The data is installed in the package (ipipneo/data/IPIP-NEO); in a copy of
+    the repository it is the data/IPIP-NEO directory next to the package.
+
+    Args:
+        - directory: Local directory used instead, by default the IPIPNEO_DATA variable.
+    """
+    directory = directory or os.environ.get(DATA_DIR_ENV)
+    if directory:
+        return Path(directory)
+
+    root = resources.files("ipipneo") / "data" / "IPIP-NEO"
+    if root.is_dir():
+        return root
+
+    return Path(__file__).resolve().parent.parent / "data" / "IPIP-NEO"
+
+
+def question_file(question: int, lang: int = 0, directory: str = None):
+    """
+    Return the file of the questions of an inventory in a language.
+
+    Args:
+        - question: Inventory model 120 or 300.
+        - lang: The language ID, see QUESTION_FILES.
+        - directory: Local directory used instead of the package data.
+    """
+    if lang not in QUESTION_FILES:
+        raise BaseException(f"The language ({lang}) is invalid!")
+
+    path = data_dir(directory=directory) / str(question)
+    for name in QUESTION_FILES[lang].split("/"):
+        path = path / name
+
+    return path
+
+
+def load_questions(question: int, lang: int = 0, directory: str = None) -> dict:
+    """
+    Load the questions and options of an inventory, parsed once and kept in memory.
+
+    The dictionary is shared by every call, it must not be changed.
+
+    Args:
+        - question: Inventory model 120 or 300.
+        - lang: The language ID, see QUESTION_FILES.
+        - directory: Local directory used instead, by default the IPIPNEO_DATA variable.
+    """
+    return _load_questions(
+        question=int(question),
+        lang=lang,
+        directory=directory or os.environ.get(DATA_DIR_ENV),
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_questions(question: int, lang: int, directory: str) -> dict:
+    path = question_file(question=question, lang=lang, directory=directory)
+
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise BaseException(f"Question package not found: {path}")
@@ -11,41 +11,31 @@ __status__ = "production"
 import json
 import random
 import sys
-import urllib.request
 from itertools import chain, repeat
 
 try:
     from ipipneo import IpipNeo
+    from ipipneo.questions import load_questions
 except ModuleNotFoundError:
     sys.path.insert(0, "../")
     from ipipneo.ipipneo import IpipNeo
-
-URL_IPIP_QUESTIONS = (
-    "https://raw.githubusercontent.com/NeuroQuestAi/five-factor-e/main/data/IPIP-NEO"
-)
+    from ipipneo.questions import load_questions
 
 
 def load_ipip_questions(lang: int, question: int) -> dict:
     """
-    Load the IPIP-NEO questions.
+    Load the IPIP-NEO questions shipped with the package (read once).
+
+    A local copy of the data can be used with the variable IPIPNEO_DATA.
 
     Args:
         - lang: The language ID.
         - question: Inventory model 120 or 300.
     """
-    target = URL_IPIP_QUESTIONS + "/" + str(question)
-    if lang == 0:
-        target = target + "/questions.json"
-    if lang == 1:
-        target = target + "/translation/questions-en-us.json"
-    if lang == 2:
-        target = target + "/translation/questions-pt-br.json"
-    if lang == 3:
-        target = target + "/translation/questions-es-es.json"
     try:
-        return json.loads(urllib.request.urlopen(target).read())
-    except BaseException:
-        print(f"\nQuestion package not found in repository: {target}")
+        return load_questions(question=question, lang=lang)
+    except BaseException as e:
+        print(f"\n{e}")
         sys.exit(0)
 
 
@@ -101,6 +91,7 @@ def quiz(inventory: int, sex: str, age: int, shuffle: str, lang: int) -> None:
         - lang: Then number of language.
     """
     questions, answers = (get_questions(lang=lang, question=inventory), [])
+    select = get_select(lang=lang, question=inventory)
     print("\n *** Big Five IPIP-NEO Personality Test ***\n")
 
     if str(shuffle[0]).upper() == "Y":
@@ -108,7 +99,7 @@ def quiz(inventory: int, sex: str, age: int, shuffle: str, lang: int) -> None:
 
     for i, q in enumerate(questions, start=1):
         print(f"\nQ.{i} {q.get('text')}\n")
-        print(*get_select(lang=lang, question=inventory), sep="\n")
+        print(*select, sep="\n")
 
         replies = map(
             input,
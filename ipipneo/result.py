@@ -0,0 +1,186 @@
+"""Compact result of one person, the nested dictionary is built on demand."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from datetime import datetime
+
+from ipipneo.plan import scoring_plan
+from ipipneo.utility import add_dict_footer
+
+LEVEL_LABELS = ("low", "average", "high")
+LEVEL_CODES = {label: code for code, label in enumerate(LEVEL_LABELS)}
+
+
+class Result:
+    """The 35 scores and level codes of a person (5 domains and 30 facets)."""
+
+    __slots__ = (
+        "question",
+        "test",
+        "sex",
+        "age",
+        "scores",
+        "levels",
+        "compare",
+        "_id",
+        "_date",
+    )
+
+    def __init__(
+        self,
+        question: int,
+        test: bool,
+        sex: str,
+        age: int,
+        scores: tuple,
+        levels: bytes,
+        compare: dict = None,
+    ) -> None:
+        """
+        Keep the scores in OCEAN order: the 5 domains, then the 6 facets of
+        each domain (O1..O6, C1..C6, E1..E6, A1..A6, N1..N6).
+
+        Args:
+            - question: Question type, 120 or 300.
+            - test: Used to test your proposed questions with reverse.
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - scores: The 35 percentiles.
+            - levels: The 35 level codes, 0 (low), 1 (average) or 2 (high).
+            - compare: The user's answers and reverse score, if requested.
+        """
+        self.question = question
+        self.test = test
+        self.sex = sex
+        self.age = age
+        self.scores = scores
+        self.levels = levels
+        self.compare = compare
+        self._id = None
+        self._date = datetime.now()
+
+    @classmethod
+    def from_evaluation(
+        cls, question: int, test: bool, sex: str, age: int, evaluation: tuple
+    ):
+        """
+        Create the result from ScoringPlan.evaluate.
+
+        Args:
+            - question: Question type, 120 or 300.
+            - test: Used to test your proposed questions with reverse.
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - evaluation: One (percent, level, traits) per domain, in OCEAN order.
+        """
+        scores = [percent for percent, _, _ in evaluation]
+        levels = [LEVEL_CODES[level] for _, level, _ in evaluation]
+        for _, _, traits in evaluation:
+            for percent, level in traits:
+                scores.append(percent)
+                levels.append(LEVEL_CODES[level])
+
+        return cls(
+            question=question,
+            test=test,
+            sex=sex,
+            age=age,
+            scores=tuple(scores),
+            levels=bytes(levels),
+        )
+
+    @property
+    def id(self) -> str:
+        """Unique id of the result, created on first use."""
+        if self._id is None:
+            import uuid
+
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @property
+    def domains(self) -> dict:
+        """The five domain percentiles by name (openness ... neuroticism)."""
+        return {
+            name: score
+            for (name, _, _, _, _), score in zip(
+                scoring_plan(nquestion=self.question).domains, self.scores
+            )
+        }
+
+    def level(self, index: int) -> str:
+        """
+        Return the level label of a score.
+
+        Args:
+            - index: Position of the score, 0 to 34.
+        """
+        return LEVEL_LABELS[self.levels[index]]
+
+    def to_dict(self) -> dict:
+        """Build the nested dictionary returned by IpipNeo.compute."""
+        plan = scoring_plan(nquestion=self.question, custom=self.test)
+        scores, levels = self.scores, self.levels
+
+        personalities = []
+        for d, (name, label, _, _, names) in enumerate(plan.domains):
+            facet = 5 + 6 * d
+            personalities.append(
+                {
+                    name: {
+                        label: scores[d],
+                        "traits": [
+                            {
+                                "trait": j + 1,
+                                trait: scores[facet + j],
+                                "score": LEVEL_LABELS[levels[facet + j]],
+                            }
+                            for j, trait in enumerate(names)
+                        ],
+                        "score": LEVEL_LABELS[levels[d]],
+                    }
+                }
+            )
+
+        result = {
+            "id": self.id,
+            "theory": "Big 5 Personality Traits",
+            "model": "IPIP-NEO" if self.question == 120 else "IPIP",
+            "question": self.question,
+            "test": self.test,
+            "person": {
+                "sex": self.sex,
+                "age": self.age,
+                "result": {"personalities": personalities},
+            },
+            **add_dict_footer(),
+            "date": self._date.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        if self.compare is not None:
+            result["person"]["result"]["compare"] = self.compare
+
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Serialize the nested dictionary to JSON.
+
+        Args:
+            - kwargs: Options of json.dumps.
+        """
+        import json
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        domains = ", ".join(
+            f"{label}={score:.2f}" for label, score in zip("OCEAN", self.scores[:5])
+        )
+        return f"Result(question={self.question}, sex={self.sex!r}, age={self.age}, {domains})"
@@ -219,6 +219,65 @@ IPIP_NEO_ITEMS_REVERSED_300 = [
     300,
 ]
 
+# Precompiled reverse keys (id_question) and position masks of each inventory.
+IPIP_NEO_KEYS_REVERSED_120 = frozenset(IPIP_NEO_ITEMS_REVERSED_120)
+IPIP_NEO_KEYS_REVERSED_300 = frozenset(IPIP_NEO_ITEMS_REVERSED_300)
+
+IPIP_NEO_MASK_REVERSED_120 = tuple(
+    i in IPIP_NEO_KEYS_REVERSED_120 for i in range(1, 121)
+)
+IPIP_NEO_MASK_REVERSED_300 = tuple(
+    i in IPIP_NEO_KEYS_REVERSED_300 for i in range(1, 301)
+)
+
+
+def reverse_selected(answers: list, keys: frozenset = None) -> list | BaseException:
+    """
+    Apply reverse scoring in one pass, without changing the answers.
+
+    Returns one (id_question, id_select) pair per answer in the input order.
+    Without keys the items with (reverse_scored=1) are reversed (test).
+
+    Args:
+        - answers: List with the answers.
+        - keys: The reverse scored id_question of the inventory.
+    """
+    if keys is None:
+        return [
+            (
+                x["id_question"],
+                (
+                    reverse_scored(select=x["id_select"])
+                    if x.get("reverse_scored") == 1
+                    else x["id_select"]
+                ),
+            )
+            for x in answers
+        ]
+
+    return [
+        (
+            x["id_question"],
+            (
+                reverse_scored(select=x["id_select"])
+                if x["id_question"] in keys
+                else x["id_select"]
+            ),
+        )
+        for x in answers
+    ]
+
+
+def reverse_values(values: list, mask: tuple) -> list:
+    """
+    Apply reverse scoring to the selected options ordered by id_question.
+
+    Args:
+        - values: The selected options (1 to 5) ordered by id_question.
+        - mask: True for each reverse scored position.
+    """
+    return [6 - x if r else x for x, r in zip(values, mask)]
+
 
 class ReverseScoredCustom:
     """Reverse scored for Tests."""
@@ -251,17 +310,11 @@ class ReverseScoredCustom:
         if not any("reverse_scored" in x for x in answers.get("answers", [])):
             raise ValueError("The key named (reverse_scored) was not found!")
 
-        def is_reversed_custom(x: dict) -> dict:
-            x["id_select"] = (
-                reverse_scored(select=x["id_select"])
-                if x.get("reverse_scored") == 1
-                else x["id_select"]
-            )
-            return x
+        items = answers.get("answers", [])
+        for x, (_, y) in zip(items, reverse_selected(answers=items)):
+            x["id_select"] = y
 
-        return {
-            "answers": [is_reversed_custom(x=x) for x in answers.get("answers", [])]
-        }
+        return {"answers": list(items)}
 
 
 class ReverseScored120:
@@ -295,19 +348,13 @@ class ReverseScored120:
             len(list(IPIP_NEO_ITEMS_REVERSED_120)) == 55
         ), "The number of reverse items should be 55!"
 
-        def is_reversed_120(x: int, y: int) -> int:
-            for i in IPIP_NEO_ITEMS_REVERSED_120:
-                if x == i:
-                    return reverse_scored(select=y)
-            return y
-
-        update = map(
-            lambda x: x.__setitem__(
-                "id_select", is_reversed_120(x["id_question"], x["id_select"])
-            ),
-            answers.get("answers"),
+        update = reverse_selected(
+            answers=answers.get("answers"), keys=IPIP_NEO_KEYS_REVERSED_120
         )
-        assert len(list(update)) == 120, "The update number should be 120!"
+        for x, (_, y) in zip(answers.get("answers"), update):
+            x["id_select"] = y
+
+        assert len(update) == 120, "The update number should be 120!"
 
         return answers or {}
 
@@ -343,18 +390,12 @@ class ReverseScored300:
             len(list(IPIP_NEO_ITEMS_REVERSED_300)) == 148
         ), "The number of reverse items should be 148!"
 
-        def is_reversed_300(x: int, y: int) -> int:
-            for i in IPIP_NEO_ITEMS_REVERSED_300:
-                if x == i:
-                    return reverse_scored(select=y)
-            return y
-
-        update = map(
-            lambda x: x.__setitem__(
-                "id_select", is_reversed_300(x["id_question"], x["id_select"])
-            ),
-            answers.get("answers"),
+        update = reverse_selected(
+            answers=answers.get("answers"), keys=IPIP_NEO_KEYS_REVERSED_300
         )
-        assert len(list(update)) == 300, "The update number should be 300!"
+        for x, (_, y) in zip(answers.get("answers"), update):
+            x["id_select"] = y
+
+        assert len(update) == 300, "The update number should be 300!"
 
         return answers or {}
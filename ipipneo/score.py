@@ -0,0 +1,189 @@
+"""Non-interactive scoring of newline-delimited JSON respondents."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+import argparse
+import csv
+import fileinput
+import json
+import os
+import sys
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.plan import BIG5_PERSONALITIES
+
+CSV_HEADER = (
+    ["index", "id", "sex", "age"]
+    + [f"{name}{suffix}" for name, _ in BIG5_PERSONALITIES for suffix in ("", "_level")]
+    + ["error"]
+)
+
+
+def read_records(lines):
+    """
+    Convert JSON lines into (sex, age, answers) records, skipping blank lines.
+
+    Each line is an object with sex, age and answers, where answers is the list
+    of {id_question, id_select} or the selected options ordered by id_question.
+    A line that is not a JSON object is yielded as an exception, which
+    iter_compute writes as the error of its record.
+
+    Args:
+        - lines: Iterable of JSON lines.
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            person = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield BaseException(f"Invalid JSON on line {number}: {e}")
+            continue
+
+        if not isinstance(person, dict):
+            yield BaseException(f"Invalid JSON on line {number}: expected an object")
+            continue
+
+        answers = person.get("answers")
+        if isinstance(answers, list) and answers and isinstance(answers[0], dict):
+            answers = {"answers": answers}
+
+        yield person.get("sex"), person.get("age"), answers
+
+
+def csv_row(index: int, result: dict) -> list:
+    """
+    Flatten a result (or an error) into one CSV row.
+
+    Args:
+        - index: Position of the record in the input.
+        - result: The result of compute or the error dictionary.
+    """
+    if "error" in result:
+        empty = [""] * (len(CSV_HEADER) - 2)
+        return [index] + empty + [f"{result['error']}: {result['message']}"]
+
+    person = result["person"]
+    row = [index, result["id"], person["sex"], person["age"]]
+    for domain, (name, label) in zip(
+        person["result"]["personalities"], BIG5_PERSONALITIES
+    ):
+        row.extend([domain[name][label], domain[name]["score"]])
+
+    return row + [""]
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        - argv: The arguments, sys.argv by default.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ipipneo-score",
+        description="Score IPIP-NEO respondents read as JSON lines, one result per line.",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="JSON lines files, the standard input by default."
+    )
+    parser.add_argument(
+        "--inventory",
+        type=int,
+        choices=(120, 300),
+        default=120,
+        help="Inventory model 120 or 300 (default: 120).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes, 0 uses every CPU (default: 1).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Number of records sent to a worker at a time (default: 256).",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Show the user's answers and reverse score.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "csv"),
+        default="json",
+        help="Output one JSON result per line or one CSV row (default: json).",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.workers < 0:
+        parser.error("--workers must be zero or a positive number")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive number")
+
+    return args
+
+
+def main(argv: list = None) -> None:
+    """
+    Score the respondents and write the results to the standard output.
+
+    Failed records are written in place as an error, so the output always
+    has one line per respondent.
+
+    Args:
+        - argv: The arguments, sys.argv by default.
+    """
+    args = parse_args(argv)
+
+    ipip = IpipNeo(question=args.inventory)
+    out = sys.stdout
+    writer = csv.writer(out, lineterminator="\n") if args.format == "csv" else None
+
+    with fileinput.FileInput(files=args.files or ("-",)) as lines:
+        records = read_records(lines=lines)
+
+        if args.workers == 1:
+            results = ipip.iter_compute(records=records, compare=args.compare)
+        else:
+            results = ipip.compute_many(
+                records=records,
+                workers=args.workers or None,
+                chunksize=args.chunk_size,
+                compare=args.compare,
+                strict=False,
+            )
+
+        try:
+            if writer:
+                writer.writerow(CSV_HEADER)
+
+            for index, result in enumerate(results):
+                if writer:
+                    writer.writerow(csv_row(index=index, result=result))
+                else:
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        except BrokenPipeError:
+            # The reader went away (e.g. head), silence the flush at exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+            sys.exit(1)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException as e:
+            print(f"ipipneo-score: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+"""Scoring session updated answer by answer, with provisional results."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from ipipneo.config import DEFAULT_CONFIG, ScoringConfig
+from ipipneo.model import FacetScale
+from ipipneo.norm import Norm
+from ipipneo.plan import scoring_plan
+from ipipneo.result import LEVEL_CODES, Result
+from ipipneo.utility import (integral, raise_if_age_is_invalid,
+                             raise_if_sex_is_invalid)
+
+
+class IncrementalSession:
+    """
+    Running facet sums of one person, updated in O(1) per answer.
+
+    Each answer is reverse scored when it arrives and added to the sum of
+    its facet, so a result never walks the answers again. While answers are
+    missing, the facets are prorated by the number of answered items; once
+    every question is answered the result is the same as IpipNeo.compute.
+
+    Complete results are kept, so the next one only looks up the facets
+    changed since then and their domains (see rescore).
+    """
+
+    def __init__(
+        self,
+        question: int,
+        sex: str,
+        age: int,
+        test: bool = False,
+        config: ScoringConfig = None,
+    ) -> None:
+        """
+        Start a session without answers.
+
+        Args:
+            - question: Question type, 120 or 300.
+            - sex: Gender of the individual (M or F or N).
+            - age: The age of the individual.
+            - test: If true, each answer brings its own (reverse_scored) flag.
+            - config: The scale settings used, DEFAULT_CONFIG by default.
+        """
+        raise_if_sex_is_invalid(sex=sex)
+        raise_if_age_is_invalid(age=age)
+
+        self._plan = scoring_plan(nquestion=question, custom=test)
+        self.question = self._plan.nquestion
+        self.test = test
+        self.sex = sex
+        self.age = age
+        self.config = config or DEFAULT_CONFIG
+        assert isinstance(
+            self.config, ScoringConfig
+        ), "The (config) field must be a ScoringConfig!"
+
+        self._selected = bytearray(self.question)
+        self._scored = bytearray(self.question)
+        self._reverse = bytearray(self.question)
+        self._facets = [0] * FacetScale.IPIP_MAX.value
+        self._counts = [0] * FacetScale.IPIP_MAX.value
+        self.answered = 0
+
+        # Position (domain, trait) of each facet in the OCEAN order of Result.
+        self._positions = [None] * FacetScale.IPIP_MAX.value
+        for d, (_, _, _, indexes, _) in enumerate(self._plan.domains):
+            for j, i in enumerate(indexes):
+                self._positions[i] = (d, j)
+
+        self._table = None
+        self._scores = None
+        self._levels = None
+        self._changed = set()
+
+    @property
+    def complete(self) -> bool:
+        """True when every question is answered."""
+        return self.answered == self.question
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the questions already answered (0 to 1)."""
+        return self.answered / self.question
+
+    def answer(
+        self, id_question: int, id_select: int, reverse_scored: int = 0
+    ) -> None | BaseException:
+        """
+        Add or replace the answer of a question.
+
+        Args:
+            - id_question: The question, 1 to 120 or 300.
+            - id_select: The selected option, 1 to 5.
+            - reverse_scored: If 1 the item is reverse scored (test mode only).
+        """
+        id_question, id_select = self._checked_answer(
+            id_question=id_question, id_select=id_select
+        )
+
+        i = id_question - 1
+        reverse = reverse_scored == 1 if self.test else self._plan.reverse[i]
+        scored = 6 - id_select if reverse else id_select
+
+        facet = self._plan.item_facet[i]
+        if self._scored[i]:
+            self._facets[facet] -= self._scored[i]
+        else:
+            self._counts[facet] += 1
+            self.answered += 1
+
+        self._facets[facet] += scored
+        self._selected[i] = id_select
+        self._scored[i] = scored
+        self._reverse[i] = reverse
+        self._changed.add(facet)
+
+    def _checked_answer(self, id_question: int, id_select: int) -> tuple:
+        """Return the answer as two ints, or raise an error if it is invalid."""
+        question, select = integral(id_question), integral(id_select)
+
+        if question is None:
+            raise BaseException(f"The id_question ({id_question}) must be an integer!")
+
+        if not 0 < question <= self.question:
+            raise BaseException(
+                f"The id_question ({id_question}) must be between 1 and {self.question}!"
+            )
+
+        if select is None:
+            raise BaseException(f"The id_select ({id_select}) must be an integer!")
+
+        if not 0 < select < 6:
+            raise BaseException(f"The id_select ({id_select}) must be between 1 and 5!")
+
+        return question, select
+
+    def remove(self, id_question: int) -> None:
+        """
+        Remove the answer of a question, if it was answered.
+
+        Args:
+            - id_question: The question, 1 to 120 or 300.
+        """
+        question = integral(id_question)
+        if question is None or not 0 < question <= self.question:
+            return
+
+        i = question - 1
+        if not self._scored[i]:
+            return
+
+        facet = self._plan.item_facet[i]
+        self._facets[facet] -= self._scored[i]
+        self._counts[facet] -= 1
+        self.answered -= 1
+        self._selected[i] = 0
+        self._scored[i] = 0
+        self._reverse[i] = 0
+        self._changed.add(facet)
+
+    def update(self, answers: list) -> None:
+        """
+        Add or replace many answers, in the format of the answers dictionary.
+
+        Args:
+            - answers: List with the id_question, id_select (and reverse_scored) of each answer.
+        """
+        for x in answers:
+            self.answer(
+                id_question=x["id_question"],
+                id_select=x["id_select"],
+                reverse_scored=x.get("reverse_scored", 0),
+            )
+
+    def rescore(self, changes: list, compact: bool = False) -> dict | Result:
+        """
+        Change some answers and return the new result.
+
+        Only the facets of the changed items and their domains are looked up
+        again, the other entries come from the previous result. The result is
+        the same as computing every answer again. In test mode the items keep
+        their (reverse_scored) flag.
+
+        Args:
+            - changes: List of (id_question, id_select) pairs.
+            - compact: If true, return a Result, see Result.to_dict.
+        """
+        changes = [
+            self._checked_answer(id_question=id_question, id_select=id_select)
+            for id_question, id_select in changes
+        ]
+
+        for id_question, id_select in changes:
+            self.answer(
+                id_question=id_question,
+                id_select=id_select,
+                reverse_scored=self._reverse[id_question - 1],
+            )
+
+        return self.result(compact=compact)
+
+    def answers(self) -> dict:
+        """Return the answered questions as the answers dictionary of compute."""
+        items = []
+        for i, (select, reverse) in enumerate(zip(self._selected, self._reverse)):
+            if not select:
+                continue
+            item = {"id_question": i + 1, "id_select": select}
+            if self.test:
+                item["reverse_scored"] = reverse
+            items.append(item)
+
+        return {"answers": items}
+
+    def facets(self) -> list:
+        """
+        Return the 30 facet sums, in inventory order.
+
+        A facet with missing answers is prorated to all of its items (the
+        mean of its answered items), or the midpoint (3) if none is answered.
+        """
+        scale = self._plan.scale
+        facets = []
+        for total, count in zip(self._facets, self._counts):
+            if count == scale:
+                facets.append(total)
+            elif not count:
+                facets.append(3 * scale)
+            elif total * scale % count:
+                facets.append(total * scale / count)
+            else:
+                facets.append(total * scale // count)
+
+        return facets
+
+    def result(self, compact: bool = False) -> dict | Result:
+        """
+        Return the result of the answers received so far.
+
+        Provisional while the session is not complete, see facets.
+
+        Args:
+            - compact: If true, return a Result, see Result.to_dict.
+        """
+        if self._table is None:
+            self._table = self.config.table(
+                nquestion=self.question,
+                ns=Norm.lookup(sex=self.sex, age=self.age, nquestion=self.question).ns,
+            )
+
+        if not self.complete:
+            result = Result.from_evaluation(
+                question=self.question,
+                test=self.test,
+                sex=self.sex,
+                age=self.age,
+                evaluation=self._evaluate_prorated(
+                    facets=self.facets(), table=self._table
+                ),
+            )
+        elif self._scores is None:
+            result = Result.from_evaluation(
+                question=self.question,
+                test=self.test,
+                sex=self.sex,
+                age=self.age,
+                evaluation=self._plan.evaluate(facets=self.facets(), table=self._table),
+            )
+            self._scores = list(result.scores)
+            self._levels = bytearray(result.levels)
+            self._changed.clear()
+        else:
+            self._update_changed()
+            result = Result(
+                question=self.question,
+                test=self.test,
+                sex=self.sex,
+                age=self.age,
+                scores=tuple(self._scores),
+                levels=bytes(self._levels),
+            )
+
+        return result if compact else result.to_dict()
+
+    def _update_changed(self) -> None:
+        """Look up the changed facets and their domains in the kept result."""
+        table, facets = self._table, self._facets
+        scores, levels = self._scores, self._levels
+
+        domains = set()
+        for i in self._changed:
+            d, j = self._positions[i]
+            percent, level = table.facet(index=i, raw=facets[i])
+            scores[5 + 6 * d + j] = percent
+            levels[5 + 6 * d + j] = LEVEL_CODES[level]
+            domains.add(d)
+
+        for d in domains:
+            _, _, domain, indexes, _ = self._plan.domains[d]
+            percent, level = table.domain(
+                index=domain, raw=sum(facets[i] for i in indexes)
+            )
+            scores[d] = percent
+            levels[d] = LEVEL_CODES[level]
+
+        self._changed.clear()
+
+    def _evaluate_prorated(self, facets: list, table) -> tuple:
+        """
+        Like ScoringPlan.evaluate, but the sums may have decimals.
+
+        Args:
+            - facets: The 30 facet sums, see facets.
+            - table: The ScoreTable of the person's norm group.
+        """
+
+        def facet(index: int, raw) -> tuple:
+            if type(raw) is int:
+                return table.facet(index=index, raw=raw)
+            return table.facet_entry(index=index, raw=raw)
+
+        result = []
+        for _, _, domain, indexes, _ in self._plan.domains:
+            raw = sum(facets[i] for i in indexes)
+            if type(raw) is int:
+                percent, level = table.domain(index=domain, raw=raw)
+            else:
+                percent, level = table.domain_entry(index=domain, raw=raw)
+
+            traits = tuple(facet(index=i, raw=facets[i]) for i in indexes)
+            result.append((percent, level, traits))
+
+        return tuple(result)
+
+    def __repr__(self) -> str:
+        return (
+            f"IncrementalSession(question={self.question}, sex={self.sex!r}, "
+            f"age={self.age}, answered={self.answered})"
+        )
@@ -0,0 +1,172 @@
+"""Precomputed percentile tables indexed by raw facet and domain sums."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from functools import lru_cache
+
+from ipipneo.model import FacetLevel, FacetScale, NormCubic, NormScale
+from ipipneo.plan import scoring_plan
+
+
+def cubic_percent(value: float) -> float:
+    """
+    Perceptile cubic approximation, the same polynomial as Norm.percent.
+
+    Args:
+        - value: The normalized (z) score.
+    """
+    return float(
+        NormCubic.CONST1.value
+        - (NormCubic.CONST2.value * value)
+        + (NormCubic.CONST3.value * value**2)
+        - (NormCubic.CONST4.value * value**3)
+    )
+
+
+def score_level(score: float, low: int, high: int) -> str:
+    """
+    Classify a score as low, average or high, like Facet.score_level.
+
+    Args:
+        - score: The score to be classified.
+        - low: Value considered low.
+        - high: Value considered high.
+    """
+    return "low" if int(score) < low else "average" if int(score) <= high else "high"
+
+
+class ScoreTable:
+    """Every possible facet and domain result of one norm group."""
+
+    def __init__(
+        self,
+        nquestion: int,
+        ns: tuple,
+        norm_scale: tuple = (NormScale.CONST_MIN.value, NormScale.CONST_MAX.value),
+        facet_level: tuple = (FacetLevel.LOW.value, FacetLevel.HIGH.value),
+    ) -> None:
+        """
+        Enumerate the (percent, level) pair of each raw sum.
+
+        Facets and domains follow the inventory order (N, E, O, A, C), the
+        facet index is the position of its items in the questionnaire (0..29).
+
+        Args:
+            - nquestion: Question type, 120 or 300.
+            - ns: The values of norms.
+            - norm_scale: The minimum and maximum value of the norm scale.
+            - facet_level: The values considered low and high.
+        """
+        plan = scoring_plan(nquestion=nquestion)
+        scale = plan.scale
+
+        self._facet_stats, self._domain_stats = plan.norm_stats(ns=ns)
+        self._norm_scale = tuple(norm_scale)
+        self._facet_level = tuple(facet_level)
+
+        self.facet_min, self.facet_max = scale, 5 * scale
+        self.domain_min, self.domain_max = 6 * scale, 30 * scale
+
+        self._facets = tuple(
+            tuple(
+                self.facet_entry(index=i, raw=raw)
+                for raw in range(self.facet_min, self.facet_max + 1)
+            )
+            for i in range(FacetScale.IPIP_MAX.value)
+        )
+        self._domains = tuple(
+            tuple(
+                self.domain_entry(index=i, raw=raw)
+                for raw in range(self.domain_min, self.domain_max + 1)
+            )
+            for i in range(5)
+        )
+
+    def facet_entry(self, index: int, raw: int) -> tuple:
+        """
+        Calculate the (percent, level) of a facet like Facet.personality.
+
+        Args:
+            - index: Facet position in the inventory (0..29).
+            - raw: The raw sum of the facet answers.
+        """
+        mean, deviation = self._facet_stats[index]
+        value = 50 + (10 * (raw - mean) / deviation)
+
+        percent = cubic_percent(value=value)
+        if value < self._norm_scale[0]:
+            percent = 1
+        if value > self._norm_scale[1]:
+            percent = 99
+
+        return percent, score_level(percent if percent else value, *self._facet_level)
+
+    def domain_entry(self, index: int, raw: int) -> tuple:
+        """
+        Calculate the (percent, level) of a domain like Norm.normalize.
+
+        Args:
+            - index: Domain position in the inventory order N, E, O, A, C (0..4).
+            - raw: The raw sum of the domain facets.
+        """
+        mean, deviation = self._domain_stats[index]
+        value = (10 * (raw - mean) / deviation) + 50
+
+        percent = cubic_percent(value=value)
+        if value < self._norm_scale[0]:
+            percent = 1
+        if value > self._norm_scale[1]:
+            percent = 99
+
+        return percent, score_level(percent, *self._facet_level)
+
+    def facet(self, index: int, raw: int) -> tuple:
+        """
+        Look up the (percent, level) of a facet.
+
+        Args:
+            - index: Facet position in the inventory (0..29).
+            - raw: The raw sum of the facet answers.
+        """
+        if self.facet_min <= raw <= self.facet_max:
+            return self._facets[index][raw - self.facet_min]
+        return self.facet_entry(index=index, raw=raw)
+
+    def domain(self, index: int, raw: int) -> tuple:
+        """
+        Look up the (percent, level) of a domain.
+
+        Args:
+            - index: Domain position in the inventory order N, E, O, A, C (0..4).
+            - raw: The raw sum of the domain facets.
+        """
+        if self.domain_min <= raw <= self.domain_max:
+            return self._domains[index][raw - self.domain_min]
+        return self.domain_entry(index=index, raw=raw)
+
+
+@lru_cache(maxsize=256)
+def score_table(
+    nquestion: int, ns: tuple, norm_scale: tuple, facet_level: tuple
+) -> ScoreTable:
+    """
+    Return the table of a norm group, built once per scale settings.
+
+    Args:
+        - nquestion: Question type, 120 or 300.
+        - ns: The values of norms.
+        - norm_scale: The minimum and maximum value of the norm scale.
+        - facet_level: The values considered low and high.
+    """
+    return ScoreTable(
+        nquestion=int(nquestion),
+        ns=ns,
+        norm_scale=norm_scale,
+        facet_level=facet_level,
+    )
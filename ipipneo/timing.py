@@ -0,0 +1,112 @@
+"""Opt-in wall time of each stage of the scoring pipeline."""
+
+__author__ = "Ederson Corbari"
+__email__ = "e@NeuroQuest.ai"
+__copyright__ = "Copyright NeuroQuest 2022-2025, Big 5 Personality Traits"
+__credits__ = ["John A. Johnson", "Dhiru Kholia"]
+__license__ = "MIT"
+__version__ = "1.13.1"
+__status__ = "production"
+
+from collections import namedtuple
+from collections.abc import Callable
+from threading import Lock
+from time import perf_counter
+
+# Stages recorded by IpipNeo, in pipeline order.
+STAGES = (
+    "answers",
+    "cache",
+    "reverse",
+    "facets",
+    "norm",
+    "table",
+    "evaluate",
+    "compare",
+    "dict",
+)
+
+
+class StageTime(namedtuple("StageTime", ("calls", "seconds"))):
+    """Number of calls and total wall time (seconds) of a stage."""
+
+    __slots__ = ()
+
+
+class StageTimer:
+    """
+    Accumulate the wall time and calls of each stage of IpipNeo.
+
+    Passed to IpipNeo (timer=...), it records the stages listed in STAGES.
+    Without a timer, IpipNeo only checks that it is None between the stages.
+    """
+
+    def __init__(self, callback: Callable[[str, float], None] = None) -> None:
+        """
+        Initialize the timer.
+
+        Args:
+            - callback: Called with (stage, seconds) after every stage, e.g. to export metrics.
+        """
+        assert callback is None or callable(
+            callback
+        ), "The (callback) field must be callable!"
+
+        self.callback = callback
+        self._calls = {}
+        self._seconds = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def start() -> float:
+        """Return the current mark of the clock."""
+        return perf_counter()
+
+    def lap(self, stage: str, mark: float) -> float:
+        """
+        Record the time of a stage since the mark, and return the new mark.
+
+        Args:
+            - stage: Name of the stage.
+            - mark: Value of start (or lap) when the stage began.
+        """
+        now = perf_counter()
+        self.record(stage=stage, seconds=now - mark)
+        return now
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Add one call of a stage.
+
+        Args:
+            - stage: Name of the stage.
+            - seconds: Wall time of the call.
+        """
+        with self._lock:
+            self._calls[stage] = self._calls.get(stage, 0) + 1
+            self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+
+        if self.callback is not None:
+            self.callback(stage, seconds)
+
+    def stages(self) -> dict:
+        """Return the calls and seconds of each recorded stage, in pipeline order."""
+        with self._lock:
+            names = sorted(
+                self._calls,
+                key=lambda x: STAGES.index(x) if x in STAGES else len(STAGES),
+            )
+            return {x: StageTime(self._calls[x], self._seconds[x]) for x in names}
+
+    def reset(self) -> None:
+        """Remove every recorded stage."""
+        with self._lock:
+            self._calls.clear()
+            self._seconds.clear()
+
+    def __repr__(self) -> str:
+        stages = ", ".join(
+            f"{name}={item.seconds / item.calls * 1e6:.1f}us x{item.calls}"
+            for name, item in self.stages().items()
+        )
+        return f"StageTimer({stages})"
@@ -10,10 +10,14 @@ __status__ = "production"
 
 from datetime import datetime
 from enum import Enum
+from operator import index, itemgetter
 
 from ipipneo.model import (Big5Agreeableness, Big5Conscientiousness,
                            Big5Extraversion, Big5Neuroticism, Big5Openness)
 
+# Marks an unanswered position while the answers are placed.
+EMPTY_SLOT = object()
+
 
 def raise_if_sex_is_invalid(sex: str) -> bool | AssertionError | BaseException:
     """
@@ -70,7 +74,7 @@ def answers_is_valid(answers: list) -> bool | AssertionError | BaseException:
     if 0 in answers:
         raise BaseException("It cannot contain zeros in the answer list!")
 
-    if 1 in [1 if x > 5 else 0 for x in answers]:
+    if max(answers) > 5:
         raise BaseException("You cannot have answers with a number greater than 5!")
 
     assert (
@@ -80,6 +84,142 @@ def answers_is_valid(answers: list) -> bool | AssertionError | BaseException:
     return True
 
 
+def integral(value) -> int | None:
+    """
+    Return a whole number as an int, or None if it is not one.
+
+    Accepts int, integer types like those of NumPy and floats without
+    decimals (3.0); a bool is not a whole number here.
+
+    Args:
+        - value: The number to convert.
+    """
+    if type(value) is int:
+        return value
+
+    if isinstance(value, bool):
+        return None
+
+    try:
+        return index(value)
+    except TypeError:
+        pass
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    return None
+
+
+def integral_answers(values) -> list | BaseException:
+    """
+    Return the selected options as ints, checking each one like validate_answers.
+
+    Args:
+        - values: The selected options (1 to 5) ordered by id_question.
+    """
+    result = []
+    for i, x in enumerate(values):
+        number = integral(x)
+        if number is None:
+            raise BaseException(f"The answer ({x}) at position {i} must be an integer!")
+
+        if not 1 <= number <= 5:
+            raise BaseException(
+                f"The answer ({x}) at position {i} must be between 1 and 5!"
+            )
+
+        result.append(number)
+
+    return result
+
+
+def validate_answers(
+    answers: dict, nquestion: int, custom: bool = False
+) -> tuple | AssertionError | ValueError | BaseException:
+    """
+    Validate and order the answers dictionary in a single pass.
+
+    Checks the structure, the range of each option (1 to 5), that every
+    question is answered and that none is duplicated. Errors point to the
+    position of the answer in the list.
+
+    Returns the selected options ordered by id_question and, in test mode
+    (custom), the reverse_scored flags in the same order (otherwise None).
+
+    Args:
+        - answers: Dictionary with the list of answers.
+        - nquestion: Number of questions, 120 or 300.
+        - custom: If true, read the (reverse_scored) key of each answer.
+    """
+    assert isinstance(answers, dict), "The (answers) field must be a dict!"
+
+    if "answers" not in answers:
+        raise ValueError("The key named (answers) was not found!")
+
+    items = answers["answers"]
+    assert isinstance(items, list), "The (answers) field must be a list!"
+
+    values = [0] * nquestion
+    reverse = [False] * nquestion if custom else None
+    flagged = False
+
+    for i, x in enumerate(items):
+        try:
+            question, select = x["id_question"], x["id_select"]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"The answer at position {i} must have the keys (id_question) and (id_select)!"
+            )
+
+        if type(question) is not int:
+            number = integral(question)
+            if number is None:
+                raise BaseException(
+                    f"The id_question ({question}) at position {i} must be an integer!"
+                )
+            question = number
+
+        if not 0 < question <= nquestion:
+            raise BaseException(
+                f"The id_question ({question}) at position {i} must be between 1 and {nquestion}!"
+            )
+
+        if values[question - 1]:
+            raise BaseException(
+                f"The id_question ({question}) at position {i} is duplicated!"
+            )
+
+        if type(select) is not int:
+            number = integral(select)
+            if number is None:
+                raise BaseException(
+                    f"The id_select ({select}) at position {i} must be an integer!"
+                )
+            select = number
+
+        if not 0 < select < 6:
+            raise BaseException(
+                f"The id_select ({select}) at position {i} must be between 1 and 5!"
+            )
+
+        values[question - 1] = select
+
+        if custom and "reverse_scored" in x:
+            flagged = True
+            reverse[question - 1] = x["reverse_scored"] == 1
+
+    if len(items) != nquestion:
+        raise BaseException(
+            f"The id_question ({values.index(0) + 1}) was not answered!"
+        )
+
+    if custom and not flagged:
+        raise ValueError("The key named (reverse_scored) was not found!")
+
+    return values, reverse
+
+
 def organize_list_json(answers: dict) -> list | AssertionError | BaseException:
     """
     Organize input list in json format.
@@ -92,19 +232,98 @@ def organize_list_json(answers: dict) -> list | AssertionError | BaseException:
     if "answers" not in answers:
         raise BaseException("The key named (answers) was not found!")
 
-    if not any("id_question" in x for x in answers.get("answers", [])):
-        raise BaseException("The key named (id_question) was not found!")
+    items = answers.get("answers", [])
 
-    if not any("id_select" in x for x in answers.get("answers", [])):
-        raise BaseException("The key named (id_select) was not found!")
+    try:
+        values = place_answers(answers=items) if items else None
+    except BaseException:
+        values = None
 
-    return [
-        x["id_select"]
-        for x in sorted(
-            [x for x in answers.get("answers", [])], key=lambda x: x["id_question"]
-        )
-        if x["id_select"] >= 1
-    ]
+    if values is None:
+        # Only invalid, duplicated or missing questions reach the full checks
+        # and the original (sorted) ordering.
+        if not any("id_question" in x for x in items):
+            raise BaseException("The key named (id_question) was not found!")
+
+        if not any("id_select" in x for x in items):
+            raise BaseException("The key named (id_select) was not found!")
+
+        values = [x["id_select"] for x in sorted(items, key=lambda x: x["id_question"])]
+
+    if min(values, default=1) >= 1:
+        return values
+
+    return [x for x in values if x >= 1]
+
+
+def place_answers(answers: list, nquestion: int = None) -> list | BaseException:
+    """
+    Place each id_select at the position of its id_question in one pass.
+
+    The ids must be the numbers 1 to nquestion, each one exactly once, so
+    duplicated, missing or unknown questions are rejected with their position.
+
+    Args:
+        - answers: List with the answers.
+        - nquestion: Number of questions, the size of the list by default.
+    """
+    size = len(answers) if nquestion is None else nquestion
+    questions = list(map(itemgetter("id_question"), answers))
+    selected = list(map(itemgetter("id_select"), answers))
+
+    # Answers usually arrive in order, then the values are already in place.
+    if questions == list(range(1, size + 1)):
+        return selected
+
+    # Every id in 1..size placed once leaves no empty slot (and no duplicates).
+    try:
+        low, high = min(questions), max(questions)
+    except (TypeError, ValueError):
+        low, high = None, None
+
+    numbers = questions
+    if type(low) is not int or type(high) is not int:
+        # Other integer types (NumPy, 3.0) are placed by their int value.
+        numbers = [integral(x) for x in questions]
+        try:
+            low, high = min(numbers), max(numbers)
+        except (TypeError, ValueError):
+            low, high = None, None
+
+    if len(questions) == size and low is not None and 1 <= low and high <= size:
+        values = [EMPTY_SLOT] * size
+        try:
+            for question, select in zip(numbers, selected):
+                values[question - 1] = select
+        except TypeError:
+            values = None
+
+        if values is not None and EMPTY_SLOT not in values:
+            return values
+
+    seen = bytearray(size)
+    for i, question in enumerate(questions):
+        number = integral(question)
+        if number is None:
+            raise BaseException(
+                f"The id_question ({question}) at position {i} must be an integer!"
+            )
+
+        if not 1 <= number <= size:
+            raise BaseException(
+                f"The id_question ({question}) at position {i} must be between 1 and {size}!"
+            )
+
+        question = number
+
+        if seen[question - 1]:
+            raise BaseException(
+                f"The id_question ({question}) at position {i} is duplicated!"
+            )
+
+        seen[question - 1] = 1
+
+    raise BaseException(f"The id_question ({seen.index(0) + 1}) was not answered!")
 
 
 def reverse_scored(select: int) -> int | BaseException:
@@ -22,14 +22,17 @@ setup(
     description=DESCRIPTION,
     long_description_content_type="text/markdown",
     long_description=long_description,
-    packages=find_packages(exclude=("test",)),
+    packages=find_packages(exclude=("test", "benchmarks")) + ["ipipneo.data"],
+    package_dir={"ipipneo.data": "data"},
+    package_data={"ipipneo.data": ["IPIP-NEO/*/*.json", "IPIP-NEO/*/*/*.json"]},
     python_requires=">=3.10",
     include_package_data=True,
     install_requires=[],
-    extras_require={"quiz": ["plotext"]},
+    extras_require={"quiz": ["plotext"], "batch": ["numpy"]},
     entry_points={
         "console_scripts": [
             "ipipneo-quiz = ipipneo.quiz:main",
+            "ipipneo-score = ipipneo.score:main",
         ],
     },
     keywords=[
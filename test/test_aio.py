@@ -0,0 +1,202 @@
+"""Unit tests for Aio."""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.utility import organize_list_json
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+async def collect(iterator) -> list:
+    return [x async for x in iterator]
+
+
+class TestAio(unittest.TestCase):
+    def test_compute_async(self) -> None:
+        answers = load_mock_answers_120()
+        values = organize_list_json(answers=answers)
+        ipip = IpipNeo(question=120)
+        expected = strip(ipip.compute(sex="M", age=40, answers=answers))
+
+        async def run(executor) -> list:
+            return await asyncio.gather(
+                ipip.compute_async(sex="M", age=40, answers=answers, executor=executor),
+                ipip.compute_async(sex="M", age=40, answers=values, executor=executor),
+                ipip.compute_async(
+                    sex="M", age=40, answers=answers, compact=True, executor=executor
+                ),
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as threads:
+            for executor in (None, threads):
+                full, vector, compact = asyncio.run(run(executor=executor))
+                self.assertEqual(strip(full), expected)
+                self.assertEqual(strip(vector), expected)
+                self.assertEqual(strip(compact.to_dict()), expected)
+
+        ipip.set_new_norm_scale(scale_min=30, scale_max=70)
+        with ProcessPoolExecutor(max_workers=1) as processes:
+            result = asyncio.run(
+                ipip.compute_async(sex="M", age=40, answers=answers, executor=processes)
+            )
+        self.assertEqual(
+            strip(result), strip(ipip.compute(sex="M", age=40, answers=answers))
+        )
+
+    def test_timeout_and_limit(self) -> None:
+        answers = load_mock_answers_120()
+        ipip = IpipNeo(question=120)
+        compute = ipip.compute
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def slow(**kwargs) -> dict:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return compute(**kwargs)
+
+        ipip.compute = slow
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(
+                ipip.compute_async(sex="M", age=40, answers=answers, timeout=0.001)
+            )
+
+        async def run() -> list:
+            limit = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                *(
+                    ipip.compute_async(sex="M", age=40, answers=answers, limit=limit)
+                    for _ in range(6)
+                )
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 6)
+        self.assertLessEqual(peak[0], 2)
+
+        async def run_timeout() -> tuple:
+            limit = asyncio.Semaphore(1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await ipip.compute_async(
+                    sex="M", age=40, answers=answers, timeout=0.001, limit=limit
+                )
+            locked = limit.locked()
+            result = await ipip.compute_async(
+                sex="M", age=40, answers=answers, limit=limit
+            )
+            return locked, result, limit.locked()
+
+        peak[0] = 0
+        locked, result, after = asyncio.run(run_timeout())
+        self.assertTrue(locked)
+        self.assertFalse(after)
+        self.assertIn("person", result)
+        self.assertEqual(peak[0], 1)
+
+    def test_iter_compute_async(self) -> None:
+        answers = load_mock_answers_120()
+        values = organize_list_json(answers=answers)
+        ipip = IpipNeo(question=120)
+        records = [("M", 40, answers), ("X", 40, answers), ("F", 18, values)] * 3
+        expected = list(ipip.iter_compute(records=records))
+
+        results = asyncio.run(
+            collect(ipip.iter_compute_async(records=records, concurrency=2))
+        )
+        self.assertEqual(len(results), len(expected))
+        for result, other in zip(results, expected):
+            self.assertEqual(strip(result), strip(other))
+        self.assertEqual(results[1]["index"], 1)
+        self.assertEqual(results[1]["error"], expected[1]["error"])
+
+        async def source():
+            for record in records:
+                await asyncio.sleep(0)
+                yield record
+
+        unordered = asyncio.run(
+            collect(ipip.iter_compute_async(records=source(), ordered=False))
+        )
+        self.assertEqual(sorted(i for i, _ in unordered), list(range(len(records))))
+        for index, result in unordered:
+            self.assertEqual(strip(result), strip(expected[index]))
+
+        with self.assertRaises(AssertionError):
+            asyncio.run(collect(ipip.iter_compute_async(records=[], concurrency=0)))
+
+    def test_iter_compute_async_bounded(self) -> None:
+        answers = load_mock_answers_120()
+        ipip = IpipNeo(question=120)
+        compute = ipip.compute
+        read = [0]
+
+        def slow(**kwargs) -> dict:
+            time.sleep(0.2 if kwargs["age"] == 20 else 0)
+            return compute(**kwargs)
+
+        def records():
+            for age in range(18, 100):
+                read[0] += 1
+                yield "M", age, answers
+
+        ipip.compute = slow
+
+        async def first() -> list:
+            iterator = ipip.iter_compute_async(
+                records=records(), concurrency=3, timeout=0.05
+            )
+            results = [await iterator.__anext__() for _ in range(3)]
+            await iterator.aclose()
+            return results
+
+        results = asyncio.run(first())
+        self.assertEqual(results[2]["index"], 2)
+        self.assertEqual(results[2]["error"], "TimeoutError")
+        self.assertLessEqual(read[0], 6)
+
+    def test_iter_compute_async_timeout_bound(self) -> None:
+        answers = load_mock_answers_120()
+        ipip = IpipNeo(question=120)
+        compute = ipip.compute
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def slow(**kwargs) -> dict:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+            return compute(**kwargs)
+
+        ipip.compute = slow
+        records = [("M", 40, answers)] * 8
+
+        with ThreadPoolExecutor(max_workers=16) as threads:
+            results = asyncio.run(
+                collect(
+                    ipip.iter_compute_async(
+                        records=records, executor=threads, concurrency=2, timeout=0.01
+                    )
+                )
+            )
+        self.assertEqual([x["error"] for x in results], ["TimeoutError"] * 8)
+        self.assertEqual(peak[0], 2)
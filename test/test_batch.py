@@ -0,0 +1,198 @@
+"""Unit tests for Batch."""
+
+import json
+import unittest
+
+from ipipneo.batch import (BATCH_COLUMNS, BIG5_ORDER, BatchResult,
+                           compute_batch, np)
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.utility import organize_list_json
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_300() -> dict:
+    with open("test/mock/answers-test-4.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_custom() -> dict:
+    with open("test/mock/answers-test-6.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+def flatten_result(result: dict) -> list:
+    """Domain and facet (score, level) pairs in OCEAN order."""
+    domains, facets = [], []
+    for label, item in zip(
+        BIG5_ORDER, result.get("person").get("result").get("personalities")
+    ):
+        big5 = list(item.values())[0]
+        domains.append((big5.get(label), big5.get("score")))
+        for trait in big5.get("traits"):
+            value = [v for k, v in trait.items() if k not in ("trait", "score")][0]
+            facets.append((value, trait.get("score")))
+    return domains + facets
+
+
+def flatten_batch(batch: dict, row: int) -> list:
+    """Domain and facet (score, level) pairs of a batch row."""
+    return [
+        (float(x), str(y))
+        for x, y in zip(batch.get("domains")[row], batch.get("domain_levels")[row])
+    ] + [
+        (float(x), str(y))
+        for x, y in zip(batch.get("facets")[row], batch.get("facet_levels")[row])
+    ]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatch(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        ipip = IpipNeo(question=120)
+
+        with self.assertRaises(AssertionError):
+            ipip.compute_batch(sex=["M"], age=[40], answers=[1, 2, 3])
+
+        with self.assertRaises(AssertionError):
+            ipip.compute_batch(sex=["M"], age=[40], answers=[[1] * 300])
+
+        with self.assertRaises(AssertionError):
+            ipip.compute_batch(sex=["X"], age=[40], answers=[[1] * 120])
+
+        with self.assertRaises(AssertionError):
+            ipip.compute_batch(sex=["M"], age=[9], answers=[[1] * 120])
+
+        with self.assertRaises(BaseException) as e:
+            ipip.compute_batch(sex=["M"], age=[40], answers=[[6] * 120])
+        self.assertEqual(
+            str(e.exception), "The answers must be numbers between 1 and 5!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            IpipNeo(question=120, test=True).compute_batch(
+                sex=["M"], age=[40], answers=[[1] * 120]
+            )
+        self.assertEqual(
+            str(e.exception), "The (reverse) mask is required in test mode!"
+        )
+
+    def test_compute_batch_same_as_compute(self) -> None:
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            ipip = IpipNeo(question=question)
+            row = organize_list_json(answers=answers)
+            people = [("M", 40), ("F", 18), ("N", 65), ("M", 90)]
+
+            batch = ipip.compute_batch(
+                sex=[s for s, _ in people],
+                age=[a for _, a in people],
+                answers=np.asarray([row] * len(people)),
+            )
+            self.assertEqual(batch.get("question"), question)
+            self.assertEqual(batch.get("size"), len(people))
+            self.assertEqual(batch.get("domains").shape, (len(people), 5))
+            self.assertEqual(batch.get("facets").shape, (len(people), 30))
+
+            for i, (sex, age) in enumerate(people):
+                result = ipip.compute(sex=sex, age=age, answers=answers)
+                self.assertEqual(flatten_batch(batch, i), flatten_result(result))
+
+    def test_compute_batch_custom_reversed(self) -> None:
+        answers = load_mock_answers_custom()
+        ordered = sorted(answers.get("answers"), key=lambda x: x["id_question"])
+
+        batch = IpipNeo(question=120, test=True).compute_batch(
+            sex=["M"],
+            age=[40],
+            answers=[[x["id_select"] for x in ordered]],
+            reverse=[x["reverse_scored"] == 1 for x in ordered],
+        )
+        result = IpipNeo(question=120, test=True).compute(
+            sex="M", age=40, answers=answers
+        )
+        self.assertEqual(flatten_batch(batch, 0), flatten_result(result))
+
+    def test_compute_batch_new_scale(self) -> None:
+        ipip = IpipNeo(question=120)
+        ipip.set_new_norm_scale(scale_min=40, scale_max=60)
+        ipip.set_new_facet_level(low_min=30, high_max=70)
+
+        answers = load_mock_answers_120()
+        batch = ipip.compute_batch(
+            sex=["F"], age=[30], answers=[organize_list_json(answers=answers)]
+        )
+        result = ipip.compute(sex="F", age=30, answers=answers)
+        self.assertEqual(flatten_batch(batch, 0), flatten_result(result))
+
+        batch = compute_batch(
+            nquestion=120,
+            sex=["F"],
+            age=[30],
+            answers=[organize_list_json(answers=answers)],
+            config=ipip.config,
+        )
+        self.assertEqual(flatten_batch(batch, 0), flatten_result(result))
+
+    def test_compute_batch_empty(self) -> None:
+        batch = IpipNeo(question=300).compute_batch(
+            sex=[], age=[], answers=np.zeros((0, 300), dtype=np.uint8)
+        )
+        self.assertEqual(batch.get("size"), 0)
+        self.assertEqual(batch.get("domains").shape, (0, 5))
+
+    def test_batch_result(self) -> None:
+        ipip = IpipNeo(question=120)
+        answers = load_mock_answers_120()
+        people = [("M", 40), ("F", 18), ("N", 65), ("M", 90)]
+
+        batch = ipip.compute_batch(
+            sex=[s for s, _ in people],
+            age=[a for _, a in people],
+            answers=[organize_list_json(answers=answers)] * len(people),
+        )
+        self.assertIsInstance(batch, BatchResult)
+        self.assertEqual(len(batch), len(people))
+        self.assertEqual(batch.scores.shape, (len(BATCH_COLUMNS), len(people)))
+        self.assertEqual(batch.levels.dtype, np.uint8)
+
+        column = batch["O1"]
+        self.assertTrue(column.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.shares_memory(column, batch.scores))
+        self.assertTrue(np.shares_memory(batch.level_column("N"), batch.levels))
+        np.testing.assert_array_equal(batch.column("C"), batch.get("domains")[:, 1])
+
+        with self.assertRaises(ValueError):
+            batch.column("X1")
+
+        for i, (sex, age) in enumerate(people):
+            row = batch[i]
+            self.assertEqual(row.to_dict()["id"], batch.ids[i])
+            self.assertEqual(
+                strip(row.to_dict()),
+                strip(ipip.compute(sex=sex, age=age, answers=answers)),
+            )
+        self.assertEqual(batch[-1].age, 90)
+        self.assertEqual(len(list(batch.to_dicts())), len(people))
+
+        part = batch[1:3]
+        self.assertEqual(len(part), 2)
+        self.assertTrue(np.shares_memory(part.scores, batch.scores))
+        self.assertEqual(part[0].id, batch[1].id)
+        self.assertEqual(list(part.sex), ["F", "N"])
+
+        older = batch[batch.age > 50]
+        self.assertEqual(list(older.age), [65, 90])
+        self.assertEqual(older[0].id, batch[2].id)
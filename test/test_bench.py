@@ -0,0 +1,84 @@
+"""Unit tests for the benchmark runner."""
+
+import subprocess
+import sys
+import unittest
+
+from benchmarks.bench import compare, format_time, mann_whitney, measure
+from benchmarks.cases import CASES, IMPORT_BUDGET, import_time, random_answers
+
+
+class TestBench(unittest.TestCase):
+    def test_cases(self) -> None:
+        for name, setup in CASES.items():
+            setup()()
+
+        answers = random_answers(nquestion=120, custom=True)
+        self.assertEqual(answers, random_answers(nquestion=120, custom=True))
+        self.assertEqual(
+            sorted(x["id_question"] for x in answers["answers"]),
+            list(range(1, 121)),
+        )
+
+    def test_import_budget(self) -> None:
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, ipipneo; print(' '.join(sorted(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        self.assertIn("ipipneo", loaded)
+        self.assertNotIn("ipipneo.ipipneo", loaded)
+        self.assertNotIn("ipipneo.norm", loaded)
+
+        import ipipneo
+
+        self.assertIn("IpipNeo", dir(ipipneo))
+        self.assertEqual(ipipneo.IpipNeo.__name__, "IpipNeo")
+        with self.assertRaises(AttributeError):
+            ipipneo.Other
+
+        self.assertLess(import_time(module="ipipneo"), IMPORT_BUDGET["ipipneo"])
+
+    def test_measure(self) -> None:
+        result = measure(func=lambda: None, repeat=3)
+        self.assertEqual(len(result["samples"]), 3)
+        self.assertLessEqual(result["min"], result["median"])
+
+    def test_mann_whitney(self) -> None:
+        self.assertLess(mann_whitney(list(range(10)), list(range(20, 30))), 0.01)
+        self.assertGreater(mann_whitney(list(range(10)), list(range(10))), 0.9)
+        self.assertEqual(mann_whitney([1.0] * 5, [1.0] * 5), 1.0)
+
+    def test_compare(self) -> None:
+        def run(**medians) -> dict:
+            return {
+                "results": {
+                    name: {
+                        "median": x,
+                        "samples": [x * (1 + i / 1000) for i in range(15)],
+                    }
+                    for name, x in medians.items()
+                }
+            }
+
+        rows = compare(
+            old=run(a=1.0, b=1.0, c=1.0, d=1.0),
+            new=run(a=1.5, b=0.5, c=1.001, e=1.0),
+            threshold=0.05,
+            alpha=0.01,
+        )
+        self.assertEqual(
+            {x["name"]: x["status"] for x in rows},
+            {"a": "slower", "b": "faster", "c": "same", "d": "missing", "e": "new"},
+        )
+
+    def test_format_time(self) -> None:
+        self.assertEqual(format_time(2.5), "2.50 s")
+        self.assertEqual(format_time(0.0025), "2.50 ms")
+        self.assertEqual(format_time(0.0000025), "2.50 us")
+        self.assertEqual(format_time(None), "-")
@@ -0,0 +1,95 @@
+"""Unit tests for Cache."""
+
+import json
+import unittest
+
+from ipipneo.cache import ResultCache
+from ipipneo.ipipneo import IpipNeo
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_custom() -> dict:
+    with open("test/mock/answers-test-6.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestCache(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        with self.assertRaises(AssertionError):
+            ResultCache(maxsize=0)
+
+        with self.assertRaises(AssertionError):
+            IpipNeo(question=120, cache={})
+
+    def test_lru(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        self.assertEqual(cache.get(("a",)), 1)
+
+        cache.put(("c",), 3)
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("c",)), 3)
+        self.assertEqual(tuple(cache.info()), (2, 1, 2, 2))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info().hits, 0)
+
+    def test_compute_cached(self) -> None:
+        cache = ResultCache(maxsize=8)
+        answers = load_mock_answers_120()
+        big5 = IpipNeo(question=120, cache=cache)
+        expected = IpipNeo(question=120).compute(sex="M", age=40, answers=answers)
+
+        first = big5.compute(sex="M", age=40, answers=answers)
+        second = big5.compute(sex="M", age=40, answers=answers)
+        self.assertEqual(strip(first), strip(expected))
+        self.assertEqual(strip(second), strip(expected))
+        self.assertNotEqual(first["id"], second["id"])
+        self.assertEqual(cache.info().hits, 1)
+
+        # Same norm group, but the person is not the same.
+        other = big5.compute(sex="M", age=39, answers=answers)
+        self.assertEqual(other["person"]["age"], 39)
+        self.assertEqual(cache.info().hits, 2)
+
+        values = [x["id_select"] for x in answers["answers"]]
+        big5.compute_vector(sex="M", age=40, values=values)
+        big5.compute_vector(sex="M", age=40, values=bytes(values))
+        self.assertEqual(cache.info().hits, 4)
+
+        # Other norm groups and scale settings are other keys.
+        big5.compute(sex="F", age=40, answers=answers)
+        big5.set_new_norm_scale(scale_min=40, scale_max=60)
+        scaled = IpipNeo(question=120)
+        scaled.set_new_norm_scale(scale_min=40, scale_max=60)
+        self.assertEqual(
+            strip(big5.compute(sex="M", age=40, answers=answers)),
+            strip(scaled.compute(sex="M", age=40, answers=answers)),
+        )
+        self.assertEqual(cache.info().misses, 3)
+
+    def test_compute_cached_custom(self) -> None:
+        cache = ResultCache()
+        answers = load_mock_answers_custom()
+        big5 = IpipNeo(question=120, test=True, cache=cache)
+        expected = IpipNeo(question=120, test=True).compute(
+            sex="F", age=30, answers=answers, compare=True
+        )
+
+        for _ in range(2):
+            result = big5.compute(sex="F", age=30, answers=answers, compare=True)
+            self.assertEqual(strip(result), strip(expected))
+
+        self.assertEqual(tuple(cache.info())[:2], (1, 1))
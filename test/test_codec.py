@@ -0,0 +1,103 @@
+"""Unit tests for Codec."""
+
+import json
+import unittest
+
+from ipipneo.codec import (decode_answers, encode_answers, pack_answers,
+                           reverse_answers, reverse_mask, unpack_answers)
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.plan import scoring_plan
+from ipipneo.utility import organize_list_json, reverse_scored
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_300() -> dict:
+    with open("test/mock/answers-test-4.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestCodec(unittest.TestCase):
+    def test_encode_decode(self) -> None:
+        for answers, size, packed in (
+            (load_mock_answers_120(), 120, 45),
+            (load_mock_answers_300(), 300, 113),
+        ):
+            data = encode_answers(answers=answers)
+            self.assertEqual(len(data), size)
+            self.assertEqual(list(data), organize_list_json(answers=answers))
+            self.assertEqual(encode_answers(answers=list(data)), data)
+
+            self.assertEqual(len(pack_answers(data=data)), packed)
+            self.assertEqual(unpack_answers(data=pack_answers(data=data)), data)
+
+            self.assertEqual(
+                organize_list_json(answers=decode_answers(data=data)), list(data)
+            )
+            self.assertEqual(
+                decode_answers(data=pack_answers(data=data), packed=True),
+                decode_answers(data=data),
+            )
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(BaseException) as e:
+            encode_answers(answers=[1, 2, 6])
+        self.assertEqual(
+            str(e.exception), "The answer (6) at position 2 must be between 1 and 5!"
+        )
+
+        with self.assertRaises(BaseException):
+            pack_answers(data=b"\x00\x01")
+
+        with self.assertRaises(ValueError):
+            encode_answers(answers=[1, 256])
+
+    def test_reverse_answers(self) -> None:
+        plan = scoring_plan(nquestion=300)
+        data = encode_answers(answers=load_mock_answers_300())
+
+        self.assertEqual(plan.reverse_mask, reverse_mask(reverse=plan.reverse))
+        self.assertEqual(
+            list(reverse_answers(data=data, mask=plan.reverse_mask)),
+            [reverse_scored(x) if r else x for x, r in zip(data, plan.reverse)],
+        )
+        self.assertEqual(reverse_answers(data=data, mask=0), data)
+        self.assertEqual(reverse_answers(data=b"\x01\x05", mask=0xFF), b"\x05\x05")
+
+    def test_compute_encoded(self) -> None:
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            ipip = IpipNeo(question=question)
+            data = encode_answers(answers=answers)
+            expected = strip(ipip.compute(sex="F", age=33, answers=answers))
+
+            self.assertEqual(
+                strip(ipip.compute_encoded(sex="F", age=33, data=data)), expected
+            )
+            self.assertEqual(
+                strip(
+                    ipip.compute_encoded(sex="F", age=33, data=pack_answers(data=data))
+                ),
+                expected,
+            )
+
+        with self.assertRaises(BaseException) as e:
+            IpipNeo(question=120).compute_encoded(sex="M", age=40, data=b"\x01" * 10)
+        self.assertEqual(
+            str(e.exception),
+            "The number of questions setting is wrong: expected 120 answers, got 10",
+        )
+
+        with self.assertRaises(AssertionError):
+            IpipNeo(question=120, test=True).compute_encoded(sex="M", age=40, data=data)
@@ -0,0 +1,138 @@
+"""Unit tests for ScoringConfig."""
+
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ipipneo.cache import ResultCache
+from ipipneo.config import DEFAULT_CONFIG, ScoringConfig
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.norm import Norm
+from ipipneo.session import IncrementalSession
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestScoringConfig(unittest.TestCase):
+    def test_config(self) -> None:
+        config = ScoringConfig()
+        self.assertEqual(config.norm_scale, (32, 73))
+        self.assertEqual(config.facet_level, (45, 55))
+        self.assertEqual(config, DEFAULT_CONFIG)
+        self.assertEqual(hash(config), hash(DEFAULT_CONFIG))
+
+        config = ScoringConfig(norm_scale=[25, 75], facet_level=(40, 60))
+        self.assertEqual(config.norm_scale, (25, 75))
+        self.assertEqual(len({config, ScoringConfig((25, 75), (40, 60))}), 1)
+
+        with self.assertRaises(AttributeError):
+            config.norm_scale = (30, 70)
+
+        with self.assertRaises(BaseException) as e:
+            ScoringConfig(norm_scale=(25, "75"))
+        self.assertEqual(
+            str(e.exception), "The (norm_scale) field must be a pair of ints!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            ScoringConfig(facet_level=(45,))
+        self.assertEqual(
+            str(e.exception), "The (facet_level) field must be a pair of ints!"
+        )
+
+        ns = Norm.lookup(sex="M", age=40, nquestion=120).ns
+        self.assertIs(config.table(nquestion=120, ns=ns), config.table(120, ns))
+        self.assertIsNot(config.table(120, ns), DEFAULT_CONFIG.table(120, ns))
+
+    def test_config_per_call(self) -> None:
+        answers = load_mock_answers_120()
+        config = ScoringConfig(norm_scale=(40, 60), facet_level=(30, 70))
+
+        ipip = IpipNeo(question=120)
+        scaled = IpipNeo(question=120)
+        scaled.set_new_norm_scale(scale_min=40, scale_max=60)
+        scaled.set_new_facet_level(low_min=30, high_max=70)
+        self.assertEqual(scaled.config, config)
+        self.assertEqual(scaled.get_current_norm(), (40, 60))
+        self.assertEqual(scaled.get_current_scale_level(), (30, 70))
+
+        expected = strip(scaled.compute(sex="M", age=40, answers=answers))
+        default = strip(ipip.compute(sex="M", age=40, answers=answers))
+        self.assertNotEqual(expected, default)
+
+        result = ipip.compute(sex="M", age=40, answers=answers, config=config)
+        self.assertEqual(strip(result), expected)
+        self.assertEqual(ipip.config, DEFAULT_CONFIG)
+
+        bound = IpipNeo(question=120, config=config)
+        self.assertEqual(
+            strip(bound.compute(sex="M", age=40, answers=answers)), expected
+        )
+
+        session = ipip.session(sex="M", age=40, answers=answers, config=config)
+        self.assertEqual(strip(session.result()), expected)
+        self.assertIs(session.config, config)
+
+        with self.assertRaises(AssertionError) as e:
+            IncrementalSession(question=120, sex="M", age=40, config=(40, 60))
+        self.assertEqual(
+            str(e.exception), "The (config) field must be a ScoringConfig!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            IpipNeo(question=120, config=((40, 60), (30, 70)))
+        self.assertEqual(
+            str(e.exception), "The (config) field must be a ScoringConfig!"
+        )
+
+    def test_config_zero_setters(self) -> None:
+        answers = load_mock_answers_120()
+        default = strip(IpipNeo(question=120).compute(sex="M", age=40, answers=answers))
+
+        ipip = IpipNeo(question=120)
+        ipip.set_new_facet_level(low_min=0, high_max=55)
+        ipip.set_new_norm_scale(scale_min=0, scale_max=0)
+        self.assertEqual(ipip.get_current_scale_level(), (45, 55))
+        self.assertEqual(ipip.get_current_norm(), (32, 73))
+        self.assertEqual(ipip.config, DEFAULT_CONFIG)
+        self.assertEqual(strip(ipip.compute(sex="M", age=40, answers=answers)), default)
+
+        ipip.set_new_facet_level(low_min=40, high_max=0)
+        self.assertEqual(ipip.get_current_scale_level(), (40, 55))
+
+    def test_config_tenants(self) -> None:
+        answers = load_mock_answers_120()
+        configs = [
+            ScoringConfig(norm_scale=(32 - i, 73 + i), facet_level=(45 - i, 55 + i))
+            for i in range(8)
+        ]
+        expected = [
+            strip(
+                IpipNeo(question=120, config=config).compute(
+                    sex="F", age=30, answers=answers
+                )
+            )
+            for config in configs
+        ]
+
+        cache = ResultCache()
+        ipip = IpipNeo(question=120, cache=cache)
+
+        def compute(i: int) -> dict:
+            config = configs[i % len(configs)]
+            return strip(ipip.compute(sex="F", age=30, answers=answers, config=config))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(compute, range(64)))
+
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i % len(configs)])
+        self.assertEqual(cache.info().currsize, len(configs))
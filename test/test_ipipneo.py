@@ -3,6 +3,7 @@
 import json
 import unittest
 
+from ipipneo.batch import np
 from ipipneo.ipipneo import IpipNeo
 
 
@@ -488,6 +489,88 @@ class TestIpipNeo(unittest.TestCase):
         self.assertEqual(personalities[3]["agreeableness"].get("A"), 1)
         self.assertEqual(personalities[4]["neuroticism"].get("N"), 53.138337443007686)
 
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_compute_numpy_integers(self) -> None:
+        answers = load_mock_answers_120()
+        ipip = IpipNeo(question=120)
+        expected = ipip.compute(sex="M", age=40, answers=answers)
+
+        for convert in (np.int64, np.uint8, float):
+            converted = {
+                "answers": [
+                    {
+                        "id_question": convert(x["id_question"]),
+                        "id_select": convert(x["id_select"]),
+                    }
+                    for x in answers["answers"]
+                ]
+            }
+            result = ipip.compute(sex="M", age=40, answers=converted)
+            self.assertEqual(result["person"]["result"], expected["person"]["result"])
+
+            session = ipip.session(sex="M", age=40, answers=converted)
+            self.assertEqual(
+                session.result()["person"]["result"], expected["person"]["result"]
+            )
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_compute_vector_numpy(self) -> None:
+        strip = lambda x: {k: v for k, v in x.items() if k not in ("id", "date")}
+
+        answers = load_mock_answers_120()
+        values = [
+            x["id_select"]
+            for x in sorted(answers["answers"], key=lambda x: x["id_question"])
+        ]
+        big5 = IpipNeo(question=120)
+        expected = strip(big5.compute(sex="F", age=30, answers=answers))
+
+        matrix = np.stack([values, values[::-1], values], axis=1)
+        for dtype in (np.uint8, np.int8, np.int16, np.int64):
+            columns = np.ascontiguousarray(matrix.astype(dtype))
+            self.assertFalse(columns[:, 0].flags["C_CONTIGUOUS"])
+
+            for vector in (columns[:, 0], columns[:, 2], columns[0::1, 0]):
+                self.assertEqual(
+                    strip(big5.compute_vector(sex="F", age=30, values=vector)),
+                    expected,
+                )
+
+            strided = np.repeat(np.array(values, dtype=dtype), 2)[::2]
+            self.assertEqual(
+                strip(big5.compute_vector(sex="F", age=30, values=strided)),
+                expected,
+            )
+
+        invalid = np.ascontiguousarray(matrix.astype(np.int8))
+        invalid[5, 0] = -1
+        with self.assertRaises(BaseException) as e:
+            big5.compute_vector(sex="F", age=30, values=invalid[:, 0])
+        self.assertEqual(
+            str(e.exception), "The answer (-1) at position 5 must be between 1 and 5!"
+        )
+
+    def test_compare_copies(self) -> None:
+        answers = load_mock_answers_120()
+        items = [dict(x) for x in answers["answers"]]
+
+        result = IpipNeo(question=120).compute(
+            sex="M", age=40, answers=answers, compare=True
+        )
+        compare = result["person"]["result"]["compare"]
+        original = compare["user_answers_original"]
+        reversed_ = compare["user_answers_reversed"]
+
+        self.assertEqual(original, items)
+        self.assertEqual(answers["answers"], items)
+        self.assertIsNot(original[0], answers["answers"][0])
+        self.assertEqual(
+            [x["id_question"] for x in reversed_], [x["id_question"] for x in items]
+        )
+
+        reversed_[0]["id_select"] = 0
+        self.assertEqual(original[0], items[0])
+
     def test_compute_300(self) -> None:
         #############################################
         # 1. Test with 40 year old man.
@@ -1313,3 +1396,163 @@ class TestIpipNeo(unittest.TestCase):
             self.assertEqual(
                 personalities[4]["neuroticism"]["traits"][5].get("score"), "high"
             )
+
+    def test_iter_compute(self) -> None:
+        big5 = IpipNeo(question=120)
+        answers = load_mock_answers_120()
+        values = [x["id_select"] for x in answers["answers"]]
+
+        stream = big5.iter_compute(
+            iter(
+                [
+                    ("M", 40, answers),
+                    ("X", 40, answers),
+                    ("F", 5, values),
+                    ("N", 30, {"answers": answers["answers"][:10]}),
+                    ("F", 25, values),
+                    ("M", 40),
+                ]
+            )
+        )
+        self.assertEqual(stream.__class__.__name__, "generator")
+
+        result = list(stream)
+        self.assertEqual(len(result), 6)
+
+        strip = lambda x: {k: v for k, v in x.items() if k not in ("id", "date")}
+        self.assertEqual(
+            strip(result[0]), strip(big5.compute(sex="M", age=40, answers=answers))
+        )
+        self.assertEqual(
+            strip(result[4]), strip(big5.compute(sex="F", age=25, answers=answers))
+        )
+
+        self.assertEqual(result[1]["index"], 1)
+        self.assertEqual(result[1]["error"], "AssertionError")
+        self.assertEqual(result[2]["index"], 2)
+        self.assertEqual(
+            result[2]["message"], "The age (5) must be between 10 and 110!"
+        )
+        self.assertEqual(result[3]["message"], "The id_question (11) was not answered!")
+        self.assertEqual(result[5]["error"], "ValueError")
+
+    def test_compute_does_not_change_answers(self) -> None:
+        for big5, answers in (
+            (IpipNeo(question=120), load_mock_answers_120()),
+            (IpipNeo(question=300), load_mock_answers_300()),
+            (IpipNeo(question=120, test=True), load_mock_answers_custom()),
+        ):
+            before = json.dumps(answers)
+            result = big5.compute(sex="M", age=40, answers=answers, compare=True)
+            self.assertEqual(json.dumps(answers), before)
+
+            compare = result["person"]["result"]["compare"]
+            self.assertEqual(compare["user_answers_original"], answers["answers"])
+            self.assertIsNot(compare["user_answers_original"], answers["answers"])
+            self.assertIsNot(
+                compare["user_answers_original"][0], compare["user_answers_reversed"][0]
+            )
+
+            result = big5.compute(sex="M", age=40, answers=answers)
+            self.assertNotIn("compare", result["person"]["result"])
+
+    def test_compute_trusted(self) -> None:
+        strip = lambda x: {k: v for k, v in x.items() if k not in ("id", "date")}
+
+        for question, test, answers in (
+            (120, False, load_mock_answers_120()),
+            (300, False, load_mock_answers_300()),
+            (120, True, load_mock_answers_custom()),
+        ):
+            big5 = IpipNeo(question=question, test=test)
+            trusted = IpipNeo(question=question, test=test, trusted=True)
+            shuffled = {"answers": list(reversed(answers["answers"]))}
+
+            for data in (answers, shuffled):
+                self.assertEqual(
+                    strip(trusted.compute(sex="F", age=30, answers=data, compare=True)),
+                    strip(big5.compute(sex="F", age=30, answers=data, compare=True)),
+                )
+
+        with self.assertRaises(AssertionError):
+            IpipNeo(question=120, trusted=1)
+
+        answers = load_mock_answers_120()
+        answers["answers"][0]["id_select"] = 6
+        with self.assertRaises(BaseException) as e:
+            IpipNeo(question=120).compute(sex="M", age=40, answers=answers)
+        self.assertEqual(
+            str(e.exception), "The id_select (6) at position 0 must be between 1 and 5!"
+        )
+
+    def test_compute_vector(self) -> None:
+        from array import array
+
+        strip = lambda x: {k: v for k, v in x.items() if k not in ("id", "date")}
+
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            big5 = IpipNeo(question=question)
+            values = [
+                x["id_select"]
+                for x in sorted(answers["answers"], key=lambda x: x["id_question"])
+            ]
+            expected = strip(big5.compute(sex="N", age=50, answers=answers))
+
+            for vector in (
+                values,
+                tuple(values),
+                bytes(values),
+                bytearray(values),
+                array("B", values),
+                array("i", values),
+                memoryview(array("q", values)),
+                memoryview(bytes(values)),
+            ):
+                self.assertEqual(
+                    strip(big5.compute_vector(sex="N", age=50, values=vector)),
+                    expected,
+                )
+
+        big5 = IpipNeo(question=120)
+
+        with self.assertRaises(BaseException) as e:
+            big5.compute_vector(sex="M", age=40, values=[3] * 119)
+        self.assertEqual(
+            str(e.exception),
+            "The number of questions setting is wrong: expected 120 answers, got 119",
+        )
+
+        with self.assertRaises(BaseException) as e:
+            big5.compute_vector(sex="M", age=40, values=array("i", [3] * 119 + [6]))
+        self.assertEqual(
+            str(e.exception), "The answer (6) at position 119 must be between 1 and 5!"
+        )
+
+        with self.assertRaises(AssertionError):
+            big5.compute_vector(sex="M", age=40, values=array("d", [3.0] * 120))
+
+        self.assertEqual(
+            strip(big5.compute_vector(sex="M", age=40, values=[3.0] * 120)),
+            strip(big5.compute_vector(sex="M", age=40, values=[3] * 120)),
+        )
+
+        with self.assertRaises(BaseException) as e:
+            big5.compute_vector(sex="M", age=40, values=[3] * 119 + [3.5])
+        self.assertEqual(
+            str(e.exception), "The answer (3.5) at position 119 must be an integer!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            big5.compute_vector(sex="M", age=40, values=[3] * 119 + [6.0])
+        self.assertEqual(
+            str(e.exception),
+            "The answer (6.0) at position 119 must be between 1 and 5!",
+        )
+
+        with self.assertRaises(AssertionError):
+            IpipNeo(question=120, test=True).compute_vector(
+                sex="M", age=40, values=[3] * 120
+            )
@@ -2,7 +2,7 @@
 
 import unittest
 
-from ipipneo.norm import Norm
+from ipipneo.norm import NORM_AGE_BANDS, Norm, NormGroup, norm_table
 
 
 class TestNorm(unittest.TestCase):
@@ -608,3 +608,65 @@ class TestNorm(unittest.TestCase):
         self.assertEqual(round(percent.get("E"), 2), 84.75)
         self.assertEqual(round(normalize.get("A"), 2), 1)
         self.assertEqual(round(percent.get("N"), 2), 10.1)
+
+    def test_lookup(self) -> None:
+        with self.assertRaises(BaseException) as e:
+            Norm.lookup(sex="M", age=20, nquestion=121)
+        self.assertEqual(str(e.exception), "Type question 121 is invalid!")
+
+        with self.assertRaises(AssertionError):
+            Norm.lookup(sex="M", age=9, nquestion=120)
+
+        with self.assertRaises(AssertionError):
+            Norm.lookup(sex="M", age=111, nquestion=300)
+
+        norm = Norm.lookup(sex="F", age=45, nquestion=120)
+        assert isinstance(norm, NormGroup), "norm must be a NormGroup"
+        assert isinstance(norm.ns, tuple), "ns must be a tuple"
+        self.assertEqual(norm.id, 7)
+        self.assertEqual(len(norm.ns), 71)
+        self.assertIs(norm, Norm.lookup(sex="F", age=60, nquestion=120))
+        self.assertIsNot(norm, Norm.lookup(sex="F", age=61, nquestion=120))
+
+        for nquestion in (120, 300):
+            for sex in ("M", "F", "N"):
+                for age in range(10, 111):
+                    norm = Norm(sex=sex, age=age, nquestion=nquestion)
+                    group = Norm.lookup(sex=sex, age=age, nquestion=nquestion)
+                    self.assertEqual(norm.get("id"), group.id)
+                    self.assertEqual(norm.get("ns"), list(group.ns))
+                    self.assertEqual(norm.get("category"), group.category)
+
+    def test_age_bands(self) -> None:
+        self.assertEqual(len(NORM_AGE_BANDS[120]), 101)
+        self.assertEqual(len(NORM_AGE_BANDS[300]), 101)
+
+        self.assertEqual(NORM_AGE_BANDS[120][20 - 10], 0)
+        self.assertEqual(NORM_AGE_BANDS[120][21 - 10], 1)
+        self.assertEqual(NORM_AGE_BANDS[120][40 - 10], 1)
+        self.assertEqual(NORM_AGE_BANDS[120][41 - 10], 2)
+        self.assertEqual(NORM_AGE_BANDS[120][61 - 10], 3)
+        self.assertEqual(NORM_AGE_BANDS[300][20 - 10], 0)
+        self.assertEqual(NORM_AGE_BANDS[300][110 - 10], 1)
+
+        self.assertEqual(len(norm_table(120)["M"]), 4)
+        self.assertEqual(len(norm_table(300)["F"]), 2)
+        self.assertEqual(len(norm_table(120)["N"]), 4)
+        self.assertEqual(len(norm_table(300)["N"]), 2)
+
+    def test_lookup_neutral(self) -> None:
+        for nquestion in (120, 300):
+            for age in range(10, 111):
+                norm = Norm.lookup(sex="N", age=age, nquestion=nquestion)
+                m = Norm.lookup(sex="M", age=age, nquestion=nquestion)
+                f = Norm.lookup(sex="F", age=age, nquestion=nquestion)
+
+                self.assertEqual(norm.id, 0)
+                self.assertEqual(
+                    norm.category, "neutral (combined male & female norms)"
+                )
+                self.assertEqual(
+                    norm.ns, tuple(round((x + y) / 2, 2) for x, y in zip(m.ns, f.ns))
+                )
+                self.assertIs(norm, Norm.lookup(sex="N", age=age, nquestion=nquestion))
+        self.assertIs(norm_table(120), norm_table(120))
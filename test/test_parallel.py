@@ -0,0 +1,201 @@
+"""Unit tests for Parallel."""
+
+import json
+import unittest
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.parallel import pack_chunk
+from ipipneo.utility import organize_list_json
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_300() -> dict:
+    with open("test/mock/answers-test-4.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_custom() -> dict:
+    with open("test/mock/answers-test-6.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestParallel(unittest.TestCase):
+    def test_pack_chunk(self) -> None:
+        answers = load_mock_answers_120()
+        values = organize_list_json(answers=answers)
+
+        kind, (sexes, ages, packed, errors, strict, start) = pack_chunk(
+            records=[("M", 40, answers), ("N", 18, values)],
+            nquestion=120,
+            compare=False,
+            test=False,
+        )
+        self.assertEqual(kind, "packed")
+        self.assertEqual(sexes, "MN")
+        self.assertEqual(ages, bytes([40, 18]))
+        self.assertEqual(packed, bytes(values) * 2)
+        self.assertEqual((errors, strict), ({}, True))
+
+        kind, (sexes, ages, packed, errors, strict, start) = pack_chunk(
+            records=[("M", 40, answers), BaseException("Bad"), ("X", 40, values)],
+            nquestion=120,
+            compare=False,
+            test=False,
+            strict=False,
+            start=10,
+        )
+        self.assertEqual(kind, "packed")
+        self.assertEqual(
+            (sexes, ages, packed, start), ("M", bytes([40]), bytes(values), 10)
+        )
+        self.assertEqual(
+            errors[1], {"index": 11, "error": "BaseException", "message": "Bad"}
+        )
+        self.assertEqual(errors[2]["index"], 12)
+        self.assertEqual(errors[2]["error"], "AssertionError")
+
+        kind, _ = pack_chunk(
+            records=[("M", 40, answers)], nquestion=120, compare=True, test=False
+        )
+        self.assertEqual(kind, "records")
+
+        kind, (sexes, ages, packed, errors, strict, start) = pack_chunk(
+            records=[("M", 40, values), ("M", 40, values[:10]), ("X", 40, values)],
+            nquestion=120,
+            compare=False,
+            test=False,
+        )
+        self.assertEqual((sexes, list(errors)), ("M", [1]))
+        self.assertEqual(
+            str(errors[1]),
+            "The number of questions setting is wrong: expected 120 answers, got 10",
+        )
+
+    def test_compute_many(self) -> None:
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            ipip = IpipNeo(question=question)
+            records = [
+                (sex, age, answers)
+                for sex in ("M", "F", "N")
+                for age in (15, 35, 50, 80)
+            ]
+
+            expected = [
+                strip(ipip.compute(sex=sex, age=age, answers=answers))
+                for sex, age, answers in records
+            ]
+
+            result = list(ipip.compute_many(records, workers=2, chunksize=5))
+            self.assertEqual([strip(x) for x in result], expected)
+
+            result = list(
+                ipip.compute_many(iter(records), workers=2, chunksize=2, ordered=False)
+            )
+            self.assertEqual(sorted(i for i, _ in result), list(range(len(records))))
+            for i, x in result:
+                self.assertEqual(strip(x), expected[i])
+
+    def test_compute_many_settings(self) -> None:
+        ipip = IpipNeo(question=120)
+        ipip.set_new_norm_scale(scale_min=40, scale_max=60)
+        ipip.set_new_facet_level(low_min=30, high_max=70)
+
+        answers = load_mock_answers_120()
+        result = list(ipip.compute_many([("F", 30, answers)], workers=1))
+        self.assertEqual(
+            strip(result[0]), strip(ipip.compute(sex="F", age=30, answers=answers))
+        )
+
+    def test_compute_many_custom_and_compare(self) -> None:
+        ipip = IpipNeo(question=120, test=True)
+        answers = load_mock_answers_custom()
+
+        result = list(
+            ipip.compute_many([("M", 40, answers)] * 3, workers=2, compare=True)
+        )
+        self.assertEqual(len(result), 3)
+        self.assertEqual(
+            strip(result[2]),
+            strip(ipip.compute(sex="M", age=40, answers=answers, compare=True)),
+        )
+
+    def test_compute_many_compare_vectors(self) -> None:
+        ipip = IpipNeo(question=120)
+        answers = load_mock_answers_120()
+        values = organize_list_json(answers=answers)
+        records = [("M", 30, [3] * 120), ("F", 40, values), ("N", 50, answers)] * 8
+
+        expected = [strip(x) for x in ipip.iter_compute(records=records, compare=True)]
+        for chunksize in (1, 5):
+            result = ipip.compute_many(
+                records, workers=2, chunksize=chunksize, compare=True
+            )
+            self.assertEqual([strip(x) for x in result], expected)
+        self.assertIn("compare", expected[2]["person"]["result"])
+
+    def test_compute_many_strict_order(self) -> None:
+        ipip = IpipNeo(question=120)
+        answers = load_mock_answers_120()
+        values = organize_list_json(answers=answers)
+
+        for record in (
+            ("X", 40, values),
+            ("M", 40, [9] + values[1:]),
+            ("M", 40, {"answers": [{"id_question": "a", "id_select": 1}]}),
+        ):
+            records = [("M", 40, values)] * 19 + [record] + [("F", 30, values)] * 20
+            error = list(ipip.iter_compute(records=[record]))[0]
+            for compare in (False, True):
+                result = []
+                with self.assertRaises(BaseException) as e:
+                    for x in ipip.compute_many(
+                        records, workers=2, chunksize=7, compare=compare
+                    ):
+                        result.append(x)
+                self.assertEqual(len(result), 19)
+                self.assertEqual(type(e.exception).__name__, error["error"])
+                self.assertEqual(str(e.exception), error["message"])
+
+    def test_compute_many_errors(self) -> None:
+        ipip = IpipNeo(question=120)
+        values = organize_list_json(answers=load_mock_answers_120())
+
+        with self.assertRaises(BaseException) as e:
+            list(ipip.compute_many([("M", 40, [9] + values[1:])], workers=1))
+        self.assertEqual(
+            str(e.exception), "The answer (9) at position 0 must be between 1 and 5!"
+        )
+
+        records = [
+            ("M", 40, values),
+            ("M", 40, [9] + values[1:]),
+            BaseException("Invalid JSON on line 3"),
+            ("F", 30, values[:10]),
+            ("F", 30, values),
+        ]
+        expected = list(ipip.iter_compute(records=records))
+        for chunksize in (1, 2, 5):
+            result = list(
+                ipip.compute_many(records, workers=2, chunksize=chunksize, strict=False)
+            )
+            self.assertEqual([strip(x) for x in result], [strip(x) for x in expected])
+        self.assertEqual(expected[2]["message"], "Invalid JSON on line 3")
+
+        with self.assertRaises(AssertionError):
+            list(ipip.compute_many([], chunksize=0))
+
+        self.assertEqual(list(ipip.compute_many([], workers=1)), [])
@@ -0,0 +1,114 @@
+"""Unit tests for Plan."""
+
+import json
+import unittest
+
+from ipipneo.facet import Facet
+from ipipneo.norm import Norm
+from ipipneo.plan import ScoringPlan, scoring_plan
+from ipipneo.reverse import IPIP_NEO_ITEMS_REVERSED_120
+from ipipneo.table import score_table
+from ipipneo.utility import organize_list_json
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_300() -> dict:
+    with open("test/mock/answers-test-4.json") as f:
+        data = json.load(f)
+    return data
+
+
+class TestPlan(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        with self.assertRaises(TypeError):
+            ScoringPlan()
+
+        with self.assertRaises(ValueError):
+            ScoringPlan(nquestion=0)
+
+        plan = scoring_plan(nquestion=120)
+        with self.assertRaises(AttributeError):
+            plan.scale = 10
+
+        with self.assertRaises(BaseException) as e:
+            plan.facet_sums(values=[1, 2, 3])
+        self.assertEqual(
+            str(e.exception),
+            "The number of questions setting is wrong: expected 120 answers, got 3",
+        )
+
+        with self.assertRaises(BaseException) as e:
+            plan.evaluate(facets=[1], table=None)
+        self.assertEqual(str(e.exception), "Invalid number of facets: 1")
+
+    def test_layout(self) -> None:
+        plan = scoring_plan(nquestion=120)
+        self.assertIs(plan, scoring_plan(nquestion=120))
+        self.assertIsNot(plan, scoring_plan(nquestion=120, custom=True))
+
+        self.assertEqual(plan.scale, 4)
+        self.assertEqual(len(plan.item_facet), 120)
+        self.assertEqual(plan.item_facet[30], 0)
+        self.assertEqual(sum(plan.reverse), len(IPIP_NEO_ITEMS_REVERSED_120))
+        self.assertTrue(plan.reverse[9 - 1])
+        self.assertFalse(any(scoring_plan(nquestion=120, custom=True).reverse))
+
+        self.assertEqual(scoring_plan(nquestion=300).scale, 10)
+        self.assertEqual(sum(scoring_plan(nquestion=300).reverse), 148)
+
+        self.assertEqual(
+            [(name, label, domain) for name, label, domain, _, _ in plan.domains],
+            [
+                ("openness", "O", 2),
+                ("conscientiousness", "C", 4),
+                ("extraversion", "E", 1),
+                ("agreeableness", "A", 3),
+                ("neuroticism", "N", 0),
+            ],
+        )
+        self.assertEqual(plan.domains[4][3], (0, 5, 10, 15, 20, 25))
+        self.assertEqual(plan.domains[4][4][0], "anxiety")
+
+    def test_facet_sums_same_as_score(self) -> None:
+        for nquestion, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            values = organize_list_json(answers=answers)
+            score = Facet(nquestion=nquestion).score(answers=list(values))
+
+            self.assertEqual(
+                scoring_plan(nquestion=nquestion).facet_sums(values=values),
+                score[1:31],
+            )
+
+    def test_norm_stats(self) -> None:
+        norm = Norm(sex="M", age=30, nquestion=300)
+        facets, domains = scoring_plan(nquestion=300).norm_stats(ns=norm["ns"])
+
+        self.assertEqual(len(facets), 30)
+        self.assertEqual(len(domains), 5)
+        self.assertEqual(domains[0], (norm["ns"][1], norm["ns"][6]))
+        self.assertEqual(facets[0], (norm["ns"][11], norm["ns"][17]))
+        self.assertEqual(facets[29], (norm["ns"][64], norm["ns"][70]))
+
+    def test_evaluate(self) -> None:
+        plan = scoring_plan(nquestion=120)
+        norm = Norm.lookup(sex="F", age=22, nquestion=120)
+        table = score_table(
+            nquestion=120, ns=norm.ns, norm_scale=(32, 73), facet_level=(45, 55)
+        )
+        facets = plan.facet_sums(values=organize_list_json(load_mock_answers_120()))
+
+        result = plan.evaluate(facets=facets, table=table)
+        self.assertEqual(len(result), 5)
+
+        percent, level, traits = result[0]
+        self.assertEqual((percent, level), table.domain(index=2, raw=sum(facets[2::5])))
+        self.assertEqual(traits[0], table.facet(index=2, raw=facets[2]))
+        self.assertEqual(len(traits), 6)
@@ -0,0 +1,61 @@
+"""Unit tests for Questions."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ipipneo.questions import (DATA_DIR_ENV, QUESTION_FILES, data_dir,
+                               load_questions, question_file)
+
+
+class TestQuestions(unittest.TestCase):
+    def test_load_questions(self) -> None:
+        for question in (120, 300):
+            data = load_questions(question=question)
+            self.assertEqual(len(data.get("questions")), question)
+            self.assertEqual(len(data.get("select")), 5)
+            self.assertIs(load_questions(question=question), data)
+
+        for lang in QUESTION_FILES:
+            data = load_questions(question=120, lang=lang)
+            self.assertEqual(len(data.get("questions")), 120)
+
+        with open("data/IPIP-NEO/120/translation/questions-pt-br.json") as f:
+            self.assertEqual(load_questions(question=120, lang=2), json.load(f))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(BaseException) as e:
+            question_file(question=120, lang=9)
+        self.assertEqual(str(e.exception), "The language (9) is invalid!")
+
+        with self.assertRaises(BaseException):
+            load_questions(question=300, lang=1)
+
+    def test_local_directory(self) -> None:
+        self.assertTrue((data_dir() / "120" / "questions.json").is_file())
+
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "120"))
+            shutil.copy(
+                "data/IPIP-NEO/120/questions.json",
+                os.path.join(directory, "120", "questions.json"),
+            )
+            with open(os.path.join(directory, "120", "questions.json")) as f:
+                data = json.load(f)
+            data["questions"] = data["questions"][:10]
+            with open(os.path.join(directory, "120", "questions.json"), "w") as f:
+                json.dump(data, f)
+
+            local = load_questions(question=120, directory=directory)
+            self.assertEqual(len(local.get("questions")), 10)
+
+            os.environ[DATA_DIR_ENV] = directory
+            try:
+                self.assertEqual(str(data_dir()), directory)
+                self.assertEqual(load_questions(question=120), local)
+            finally:
+                del os.environ[DATA_DIR_ENV]
+
+            self.assertEqual(len(load_questions(question=120).get("questions")), 120)
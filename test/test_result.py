@@ -0,0 +1,84 @@
+"""Unit tests for Result."""
+
+import json
+import pickle
+import unittest
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.result import LEVEL_LABELS, Result
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_custom() -> dict:
+    with open("test/mock/answers-test-6.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestResult(unittest.TestCase):
+    def test_compact(self) -> None:
+        big5 = IpipNeo(question=120)
+        answers = load_mock_answers_120()
+
+        result = big5.compute(sex="M", age=40, answers=answers, compact=True)
+        expected = big5.compute(sex="M", age=40, answers=answers)
+
+        self.assertIsInstance(result, Result)
+        self.assertEqual(len(result.scores), 35)
+        self.assertEqual(len(result.levels), 35)
+        self.assertEqual(strip(result.to_dict()), strip(expected))
+        self.assertEqual(result.to_dict()["id"], result.id)
+        self.assertEqual(json.loads(result.to_json()), result.to_dict())
+
+        personalities = expected["person"]["result"]["personalities"]
+        self.assertEqual(
+            result.domains,
+            {
+                "openness": personalities[0]["openness"]["O"],
+                "conscientiousness": personalities[1]["conscientiousness"]["C"],
+                "extraversion": personalities[2]["extraversion"]["E"],
+                "agreeableness": personalities[3]["agreeableness"]["A"],
+                "neuroticism": personalities[4]["neuroticism"]["N"],
+            },
+        )
+        self.assertEqual(result.level(0), personalities[0]["openness"]["score"])
+        self.assertEqual(
+            result.level(34), personalities[4]["neuroticism"]["traits"][5]["score"]
+        )
+        self.assertIn(result.level(10), LEVEL_LABELS)
+
+        with self.assertRaises(AttributeError):
+            result.other = 1
+
+        copy = pickle.loads(pickle.dumps(result))
+        self.assertEqual(copy.to_dict(), result.to_dict())
+
+    def test_compact_compare_and_vector(self) -> None:
+        big5 = IpipNeo(question=120, test=True)
+        answers = load_mock_answers_custom()
+
+        result = big5.compute(
+            sex="F", age=30, answers=answers, compare=True, compact=True
+        )
+        self.assertEqual(
+            strip(result.to_dict()),
+            strip(big5.compute(sex="F", age=30, answers=answers, compare=True)),
+        )
+
+        big5 = IpipNeo(question=120)
+        values = [x["id_select"] for x in load_mock_answers_120()["answers"]]
+        result = big5.compute_vector(sex="F", age=30, values=values, compact=True)
+        self.assertIsNone(result.compare)
+        self.assertEqual(
+            strip(result.to_dict()),
+            strip(big5.compute_vector(sex="F", age=30, values=values)),
+        )
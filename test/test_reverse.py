@@ -4,8 +4,13 @@ import json
 import unittest
 
 from ipipneo.reverse import (IPIP_NEO_ITEMS_REVERSED_120,
-                             IPIP_NEO_ITEMS_REVERSED_300, ReverseScored120,
-                             ReverseScored300, ReverseScoredCustom)
+                             IPIP_NEO_ITEMS_REVERSED_300,
+                             IPIP_NEO_KEYS_REVERSED_120,
+                             IPIP_NEO_KEYS_REVERSED_300,
+                             IPIP_NEO_MASK_REVERSED_120,
+                             IPIP_NEO_MASK_REVERSED_300, ReverseScored120,
+                             ReverseScored300, ReverseScoredCustom,
+                             reverse_selected, reverse_values)
 
 
 def load_mock_answers_120() -> dict:
@@ -168,3 +173,62 @@ class TestReverse(unittest.TestCase):
         )
 
         self.assertNotEqual(a, b)
+
+    def test_reverse_keys_and_masks(self) -> None:
+        self.assertEqual(
+            IPIP_NEO_KEYS_REVERSED_120, frozenset(IPIP_NEO_ITEMS_REVERSED_120)
+        )
+        self.assertEqual(
+            IPIP_NEO_KEYS_REVERSED_300, frozenset(IPIP_NEO_ITEMS_REVERSED_300)
+        )
+
+        self.assertEqual(len(IPIP_NEO_MASK_REVERSED_120), 120)
+        self.assertEqual(sum(IPIP_NEO_MASK_REVERSED_120), 55)
+        self.assertEqual(len(IPIP_NEO_MASK_REVERSED_300), 300)
+        self.assertEqual(sum(IPIP_NEO_MASK_REVERSED_300), 148)
+        self.assertTrue(IPIP_NEO_MASK_REVERSED_120[9 - 1])
+        self.assertFalse(IPIP_NEO_MASK_REVERSED_120[1 - 1])
+
+    def test_reverse_selected(self) -> None:
+        answers = load_mock_answers_300()
+        items = answers["answers"]
+
+        selected = reverse_selected(answers=items, keys=IPIP_NEO_KEYS_REVERSED_300)
+        self.assertEqual(answers, load_mock_answers_300())
+        self.assertEqual(
+            selected,
+            [
+                (x["id_question"], x["id_select"])
+                for x in ReverseScored300(answers=load_mock_answers_300())["answers"]
+            ],
+        )
+
+        custom = load_mock_answers_custom()["answers"]
+        self.assertEqual(
+            reverse_selected(answers=custom),
+            [
+                (x["id_question"], x["id_select"])
+                for x in ReverseScoredCustom(answers=load_mock_answers_custom())[
+                    "answers"
+                ]
+            ],
+        )
+
+        with self.assertRaises(BaseException) as e:
+            reverse_selected(
+                answers=[{"id_question": 9, "id_select": 0}],
+                keys=IPIP_NEO_KEYS_REVERSED_120,
+            )
+        self.assertEqual(str(e.exception), "Something wrong in the selection option: 0")
+
+    def test_reverse_values(self) -> None:
+        values = [x["id_select"] for x in load_mock_answers_120()["answers"]]
+
+        self.assertEqual(
+            reverse_values(values=values, mask=IPIP_NEO_MASK_REVERSED_120),
+            [
+                x["id_select"]
+                for x in ReverseScored120(answers=load_mock_answers_120())["answers"]
+            ],
+        )
+        self.assertEqual(reverse_values(values=[1, 2, 5], mask=(True,) * 3), [5, 4, 1])
@@ -0,0 +1,124 @@
+"""Unit tests for Score."""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.score import CSV_HEADER, main, read_records
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestScore(unittest.TestCase):
+    def setUp(self) -> None:
+        answers = load_mock_answers_120()["answers"]
+        lines = [
+            {"sex": "M", "age": 40, "answers": answers},
+            {"sex": "F", "age": 25, "answers": [x["id_select"] for x in answers]},
+            {"sex": "N", "age": 5, "answers": answers},
+        ]
+
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w") as f:
+            f.write("\n".join(json.dumps(x) for x in lines) + "\n\n")
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def run_main(self, *argv) -> str:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(argv=[*argv, self.path])
+        return out.getvalue()
+
+    def test_read_records(self) -> None:
+        records = list(
+            read_records(['{"sex": "M", "age": 30, "answers": [1, 2]}', "  \n"])
+        )
+        self.assertEqual(records, [("M", 30, [1, 2])])
+
+        (error,) = read_records(["[1, 2]"])
+        self.assertIsInstance(error, BaseException)
+        self.assertEqual(str(error), "Invalid JSON on line 1: expected an object")
+
+    def test_json(self) -> None:
+        answers = load_mock_answers_120()
+        ipip = IpipNeo(question=120)
+
+        for workers in ("1", "2"):
+            lines = self.run_main("--workers", workers, "--chunk-size", "1")
+            result = [json.loads(x) for x in lines.splitlines()]
+
+            self.assertEqual(len(result), 3)
+            self.assertEqual(
+                strip(result[0]), strip(ipip.compute(sex="M", age=40, answers=answers))
+            )
+            self.assertEqual(
+                strip(result[1]), strip(ipip.compute(sex="F", age=25, answers=answers))
+            )
+            self.assertEqual(
+                result[2],
+                {
+                    "index": 2,
+                    "error": "AssertionError",
+                    "message": "The age (5) must be between 10 and 110!",
+                },
+            )
+
+    def test_csv(self) -> None:
+        rows = list(csv.reader(io.StringIO(self.run_main("--format", "csv"))))
+
+        self.assertEqual(rows[0], CSV_HEADER)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1][2:4], ["M", "40"])
+        self.assertEqual(rows[1][-1], "")
+        self.assertIn(rows[1][5], ("low", "average", "high"))
+        self.assertEqual(rows[3][0], "2")
+        self.assertTrue(rows[3][-1].startswith("AssertionError"))
+
+    def test_invalid(self) -> None:
+        answers = load_mock_answers_120()["answers"]
+        with open(self.path, "a") as f:
+            f.write("{bad\n[1, 2]\n")
+            f.write(json.dumps({"sex": "F", "age": 30, "answers": answers}) + "\n")
+
+        ipip = IpipNeo(question=120)
+        expected = strip(ipip.compute(sex="F", age=30, answers={"answers": answers}))
+
+        for workers in ("1", "2"):
+            for chunk in ("1", "2", "256"):
+                lines = self.run_main("--workers", workers, "--chunk-size", chunk)
+                result = [json.loads(x) for x in lines.splitlines()]
+
+                self.assertEqual(len(result), 6)
+                self.assertEqual(result[2]["error"], "AssertionError")
+                self.assertEqual(result[3]["index"], 3)
+                self.assertEqual(result[3]["error"], "BaseException")
+                self.assertTrue(
+                    result[3]["message"].startswith("Invalid JSON on line 5: ")
+                )
+                self.assertEqual(
+                    result[4],
+                    {
+                        "index": 4,
+                        "error": "BaseException",
+                        "message": "Invalid JSON on line 6: expected an object",
+                    },
+                )
+                self.assertEqual(strip(result[5]), expected)
+
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(argv=["--workers", "-1"])
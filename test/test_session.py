@@ -0,0 +1,201 @@
+"""Unit tests for Session."""
+
+import json
+import random
+import unittest
+
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.session import IncrementalSession
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_300() -> dict:
+    with open("test/mock/answers-test-4.json") as f:
+        data = json.load(f)
+    return data
+
+
+def load_mock_answers_custom() -> dict:
+    with open("test/mock/answers-test-6.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestSession(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        with self.assertRaises(AssertionError):
+            IncrementalSession(question=120, sex="X", age=40)
+
+        session = IncrementalSession(question=120, sex="M", age=40)
+        with self.assertRaises(BaseException) as e:
+            session.answer(id_question=121, id_select=1)
+        self.assertEqual(
+            str(e.exception), "The id_question (121) must be between 1 and 120!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            session.answer(id_question=1, id_select=6)
+        self.assertEqual(str(e.exception), "The id_select (6) must be between 1 and 5!")
+
+        with self.assertRaises(BaseException) as e:
+            session.answer(id_question=1, id_select="5")
+        self.assertEqual(str(e.exception), "The id_select (5) must be an integer!")
+        self.assertEqual(session.answered, 0)
+
+        session.answer(id_question=1.0, id_select=5.0)
+        self.assertEqual(
+            session.answers(), {"answers": [{"id_question": 1, "id_select": 5}]}
+        )
+        session.remove(id_question=1.0)
+        self.assertEqual(session.answered, 0)
+
+    def test_complete_same_as_compute(self) -> None:
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            big5 = IpipNeo(question=question)
+            session = big5.session(sex="F", age=33)
+
+            items = list(answers["answers"])
+            random.Random(question).shuffle(items)
+            for x in items:
+                self.assertFalse(session.complete)
+                session.answer(id_question=x["id_question"], id_select=x["id_select"])
+
+            self.assertTrue(session.complete)
+            self.assertEqual(session.progress, 1)
+            self.assertEqual(
+                strip(session.result()),
+                strip(big5.compute(sex="F", age=33, answers=answers)),
+            )
+            self.assertEqual(
+                strip(big5.compute(sex="F", age=33, answers=session.answers())),
+                strip(session.result()),
+            )
+
+    def test_edit_and_remove(self) -> None:
+        answers = load_mock_answers_120()
+        big5 = IpipNeo(question=120)
+        session = big5.session(sex="M", age=40)
+        session.update(answers=answers["answers"])
+
+        session.answer(id_question=9, id_select=1)
+        session.answer(id_question=10, id_select=5)
+        edited = json.loads(json.dumps(answers))
+        edited["answers"][8]["id_select"] = 1
+        edited["answers"][9]["id_select"] = 5
+        self.assertEqual(
+            strip(session.result()),
+            strip(big5.compute(sex="M", age=40, answers=edited)),
+        )
+
+        session.remove(id_question=9)
+        session.remove(id_question=9)
+        self.assertEqual(session.answered, 119)
+        self.assertEqual(len(session.answers()["answers"]), 119)
+
+        session.answer(id_question=9, id_select=1)
+        self.assertEqual(
+            strip(session.result()),
+            strip(big5.compute(sex="M", age=40, answers=edited)),
+        )
+
+    def test_provisional(self) -> None:
+        session = IncrementalSession(question=120, sex="N", age=25)
+        facets = session.facets()
+        self.assertEqual(facets, [12] * 30)
+
+        # Questions 1 and 31 are the first two items of the Anxiety facet.
+        session.answer(id_question=1, id_select=5)
+        self.assertEqual(session.facets()[0], 20)
+        session.answer(id_question=31, id_select=2)
+        self.assertEqual(session.facets()[0], 14)
+        session.answer(id_question=61, id_select=2)
+        self.assertEqual(session.facets()[0], 9 * 4 / 3)
+
+        result = session.result(compact=True)
+        self.assertEqual(session.progress, 3 / 120)
+        self.assertEqual(len(result.scores), 35)
+        self.assertEqual(
+            result.to_dict()["person"]["result"]["personalities"][4]["neuroticism"][
+                "traits"
+            ][0]["anxiety"],
+            result.scores[29],
+        )
+
+    def test_custom(self) -> None:
+        answers = load_mock_answers_custom()
+        big5 = IpipNeo(question=120, test=True)
+
+        session = big5.session(sex="F", age=30)
+        session.update(answers=answers["answers"])
+        self.assertEqual(
+            strip(session.result()),
+            strip(big5.compute(sex="F", age=30, answers=answers)),
+        )
+        self.assertEqual(
+            strip(big5.compute(sex="F", age=30, answers=session.answers())),
+            strip(session.result()),
+        )
+
+    def test_rescore(self) -> None:
+        for question, answers in (
+            (120, load_mock_answers_120()),
+            (300, load_mock_answers_300()),
+        ):
+            big5 = IpipNeo(question=question)
+            session = big5.session(sex="M", age=50, answers=answers)
+            self.assertTrue(session.complete)
+            self.assertEqual(
+                strip(session.result()),
+                strip(big5.compute(sex="M", age=50, answers=answers)),
+            )
+
+            edited = json.loads(json.dumps(answers))
+            rng = random.Random(question)
+            for _ in range(20):
+                changes = [
+                    (rng.randint(1, question), rng.randint(1, 5))
+                    for _ in range(rng.randint(1, 3))
+                ]
+                for id_question, id_select in changes:
+                    for x in edited["answers"]:
+                        if x["id_question"] == id_question:
+                            x["id_select"] = id_select
+
+                self.assertEqual(
+                    strip(session.rescore(changes=changes)),
+                    strip(big5.compute(sex="M", age=50, answers=edited)),
+                )
+
+            with self.assertRaises(BaseException):
+                session.rescore(changes=[(1, 1), (2, 9)])
+            self.assertEqual(
+                session.answers()["answers"][0]["id_select"],
+                edited["answers"][0]["id_select"],
+            )
+
+    def test_rescore_custom(self) -> None:
+        answers = load_mock_answers_custom()
+        big5 = IpipNeo(question=120, test=True)
+        session = big5.session(sex="F", age=30, answers=answers)
+
+        edited = json.loads(json.dumps(answers))
+        for x in edited["answers"]:
+            if x["id_question"] in (1, 2):
+                x["id_select"] = 4
+
+        self.assertEqual(
+            strip(session.rescore(changes=[(1, 4), (2, 4)])),
+            strip(big5.compute(sex="F", age=30, answers=edited)),
+        )
@@ -0,0 +1,80 @@
+"""Unit tests for Table."""
+
+import unittest
+
+from ipipneo.facet import Facet
+from ipipneo.norm import Norm
+from ipipneo.table import ScoreTable, cubic_percent, score_level, score_table
+
+
+class TestTable(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        with self.assertRaises(TypeError):
+            ScoreTable()
+
+        with self.assertRaises(ValueError):
+            ScoreTable(nquestion=0, ns=Norm(sex="M", age=40, nquestion=120)["ns"])
+
+    def test_cubic_percent(self) -> None:
+        self.assertEqual(
+            cubic_percent(value=Norm.calc({"O": 60}, {"ns": [0] + [50] * 70})["O"]),
+            Norm.percent(normc=Norm.calc({"O": 60}, {"ns": [0] + [50] * 70}))["O"],
+        )
+
+    def test_score_level(self) -> None:
+        self.assertEqual(score_level(score=44.9, low=45, high=55), "low")
+        self.assertEqual(score_level(score=45, low=45, high=55), "average")
+        self.assertEqual(score_level(score=55.9, low=45, high=55), "average")
+        self.assertEqual(score_level(score=56, low=45, high=55), "high")
+
+    def test_facet_table_same_as_personality(self) -> None:
+        for nquestion, scale in ((120, 4), (300, 10)):
+            facet = Facet(nquestion=nquestion)
+            norm = Norm(sex="N", age=33, nquestion=nquestion)
+            table = ScoreTable(nquestion=nquestion, ns=norm["ns"])
+
+            self.assertEqual((table.facet_min, table.facet_max), (scale, 5 * scale))
+            self.assertEqual(
+                (table.domain_min, table.domain_max), (6 * scale, 30 * scale)
+            )
+
+            for raw in range(scale, 5 * scale + 1):
+                score = [0] + [raw] * 30
+                b5 = facet.b5create(score=score)
+                distrib = facet.distrib(size=len(score), b5=b5, norm=norm)
+                normc = Norm.calc(domain=facet.domain(score=score), norm=norm)
+                big5 = Norm.normalize(normc=normc, percent=Norm.percent(normc=normc))
+
+                for i, label in enumerate("NEOAC"):
+                    result = facet.big_five_level(
+                        big5=facet.personality(
+                            size=len(score), big5=big5, traits=distrib, label=label
+                        ),
+                        label=label,
+                    )
+                    self.assertEqual(
+                        table.domain(index=i, raw=6 * raw),
+                        (result[label], result["score"]),
+                    )
+                    for j, trait in enumerate(result["traits"]):
+                        self.assertEqual(
+                            table.facet(index=i + 5 * j, raw=raw),
+                            (list(trait.values())[1], trait["score"]),
+                        )
+
+    def test_out_of_range(self) -> None:
+        table = ScoreTable(nquestion=120, ns=Norm(sex="M", age=40, nquestion=120)["ns"])
+        self.assertEqual(table.facet(index=0, raw=0), table.facet_entry(0, 0))
+        self.assertEqual(table.facet(index=0, raw=0)[0], 1)
+        self.assertEqual(table.domain(index=0, raw=500)[0], 99)
+
+    def test_score_table_cache(self) -> None:
+        ns = tuple(Norm(sex="F", age=25, nquestion=300)["ns"])
+
+        a = score_table(nquestion=300, ns=ns, norm_scale=(32, 73), facet_level=(45, 55))
+        b = score_table(nquestion=300, ns=ns, norm_scale=(32, 73), facet_level=(45, 55))
+        c = score_table(nquestion=300, ns=ns, norm_scale=(40, 60), facet_level=(45, 55))
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(c.facet(index=0, raw=10)[0], 1)
@@ -0,0 +1,81 @@
+"""Unit tests for Timing."""
+
+import json
+import unittest
+
+from ipipneo.cache import ResultCache
+from ipipneo.ipipneo import IpipNeo
+from ipipneo.timing import STAGES, StageTimer
+
+
+def load_mock_answers_120() -> dict:
+    with open("test/mock/answers-test-1.json") as f:
+        data = json.load(f)
+    return data
+
+
+def strip(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k not in ("id", "date")}
+
+
+class TestTiming(unittest.TestCase):
+    def test_invalid_params(self) -> None:
+        with self.assertRaises(AssertionError):
+            StageTimer(callback=1)
+
+        with self.assertRaises(AssertionError):
+            IpipNeo(question=120, timer=print)
+
+    def test_record(self) -> None:
+        calls = []
+        timer = StageTimer(callback=lambda stage, seconds: calls.append(stage))
+        timer.record(stage="norm", seconds=0.5)
+        timer.record(stage="answers", seconds=0.25)
+        timer.record(stage="norm", seconds=0.5)
+
+        self.assertEqual(list(timer.stages()), ["answers", "norm"])
+        self.assertEqual(tuple(timer.stages()["norm"]), (2, 1.0))
+        self.assertEqual(calls, ["norm", "answers", "norm"])
+
+        mark = timer.start()
+        self.assertGreaterEqual(timer.lap(stage="other", mark=mark), mark)
+        self.assertEqual(list(timer.stages())[-1], "other")
+
+        timer.reset()
+        self.assertEqual(timer.stages(), {})
+
+    def test_compute_timed(self) -> None:
+        answers = load_mock_answers_120()
+        timer = StageTimer()
+        big5 = IpipNeo(question=120, timer=timer)
+
+        self.assertEqual(
+            strip(big5.compute(sex="M", age=40, answers=answers, compare=True)),
+            strip(
+                IpipNeo(question=120).compute(
+                    sex="M", age=40, answers=answers, compare=True
+                )
+            ),
+        )
+        stages = timer.stages()
+        self.assertEqual(
+            list(stages),
+            [x for x in STAGES if x != "cache"],
+        )
+        self.assertTrue(all(x.calls == 1 for x in stages.values()))
+        self.assertTrue(all(x.seconds >= 0 for x in stages.values()))
+
+        timer.reset()
+        big5.compute(sex="M", age=40, answers=answers, compact=True)
+        self.assertNotIn("dict", timer.stages())
+
+        timer.reset()
+        big5.evaluator(sex="M", age=40, score=[0] + [10] * 30)
+        self.assertEqual(list(timer.stages()), ["norm", "table", "evaluate", "dict"])
+
+        timer.reset()
+        big5 = IpipNeo(question=120, cache=ResultCache(), timer=timer)
+        big5.compute(sex="M", age=40, answers=answers)
+        big5.compute(sex="M", age=40, answers=answers)
+        self.assertEqual(timer.stages()["cache"].calls, 2)
+        self.assertEqual(timer.stages()["facets"].calls, 1)
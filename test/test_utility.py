@@ -6,8 +6,9 @@ import unittest
 from ipipneo.utility import (add_dict_footer, answers_is_valid,
                              big5_ocean_is_valid, big5_target,
                              create_big5_dict, organize_list_json,
-                             raise_if_age_is_invalid, raise_if_sex_is_invalid,
-                             reverse_scored)
+                             place_answers, raise_if_age_is_invalid,
+                             raise_if_sex_is_invalid, reverse_scored,
+                             validate_answers)
 
 LIB_CURRENT_VERSION = "1.13.1"
 
@@ -397,6 +398,176 @@ class TestUtility(unittest.TestCase):
         assert isinstance(answers, list), "answers must be a list"
         self.assertEqual(len(answers), 5)
 
+    def test_place_answers(self) -> None:
+        data = load_mock_answers(idx=2)
+        self.assertEqual(
+            place_answers(answers=data["answers"]),
+            organize_list_json(answers=data),
+        )
+        self.assertEqual(
+            place_answers(
+                answers=[
+                    {"id_question": 2, "id_select": 5},
+                    {"id_question": 1, "id_select": 3},
+                ],
+                nquestion=2,
+            ),
+            [3, 5],
+        )
+
+        with self.assertRaises(BaseException) as e:
+            place_answers(
+                answers=[
+                    {"id_question": 1, "id_select": 5},
+                    {"id_question": 1, "id_select": 3},
+                ]
+            )
+        self.assertEqual(
+            str(e.exception), "The id_question (1) at position 1 is duplicated!"
+        )
+
+        with self.assertRaises(BaseException) as e:
+            place_answers(answers=[{"id_question": 1, "id_select": 5}], nquestion=3)
+        self.assertEqual(str(e.exception), "The id_question (2) was not answered!")
+
+        with self.assertRaises(BaseException) as e:
+            place_answers(answers=[{"id_question": 0, "id_select": 5}])
+        self.assertEqual(
+            str(e.exception),
+            "The id_question (0) at position 0 must be between 1 and 1!",
+        )
+
+        self.assertEqual(
+            place_answers(
+                answers=[
+                    {"id_question": 2.0, "id_select": 4},
+                    {"id_question": 1.0, "id_select": 2},
+                ]
+            ),
+            [2, 4],
+        )
+
+        with self.assertRaises(BaseException) as e:
+            place_answers(
+                answers=[
+                    {"id_question": 1, "id_select": 5},
+                    {"id_question": 1.5, "id_select": 5},
+                    {"id_question": 3, "id_select": 5},
+                ]
+            )
+        self.assertEqual(
+            str(e.exception), "The id_question (1.5) at position 1 must be an integer!"
+        )
+
+        self.assertEqual(
+            organize_list_json(
+                answers={
+                    "answers": [
+                        {"id_question": 3, "id_select": 4},
+                        {"id_question": 1, "id_select": 2},
+                        {"id_question": 1, "id_select": 0},
+                    ]
+                }
+            ),
+            [2, 4],
+        )
+
+    def test_validate_answers(self) -> None:
+        data = load_mock_answers(idx=2)
+        values, reverse = validate_answers(answers=data, nquestion=120)
+        self.assertEqual(values, organize_list_json(answers=data))
+        self.assertIsNone(reverse)
+
+        with self.assertRaises(AssertionError):
+            validate_answers(answers=[], nquestion=120)
+
+        with self.assertRaises(ValueError) as e:
+            validate_answers(answers={}, nquestion=120)
+        self.assertEqual(str(e.exception), "The key named (answers) was not found!")
+
+        cases = (
+            (
+                [{"id_question": 1}],
+                "The answer at position 0 must have the keys (id_question) and (id_select)!",
+            ),
+            (
+                [
+                    {"id_question": 1, "id_select": 1},
+                    {"id_question": 4, "id_select": 1},
+                ],
+                "The id_question (4) at position 1 must be between 1 and 3!",
+            ),
+            (
+                [
+                    {"id_question": 2, "id_select": 1},
+                    {"id_question": 2, "id_select": 1},
+                ],
+                "The id_question (2) at position 1 is duplicated!",
+            ),
+            (
+                [
+                    {"id_question": 1, "id_select": 1},
+                    {"id_question": 2, "id_select": 6},
+                ],
+                "The id_select (6) at position 1 must be between 1 and 5!",
+            ),
+            (
+                [
+                    {"id_question": "1", "id_select": 1},
+                    {"id_question": 2, "id_select": 1},
+                ],
+                "The id_question (1) at position 0 must be an integer!",
+            ),
+            (
+                [
+                    {"id_question": 1, "id_select": 1},
+                    {"id_question": 2, "id_select": 2.5},
+                ],
+                "The id_select (2.5) at position 1 must be an integer!",
+            ),
+            (
+                [
+                    {"id_question": 1, "id_select": True},
+                    {"id_question": 2, "id_select": 1},
+                ],
+                "The id_select (True) at position 0 must be an integer!",
+            ),
+            (
+                [
+                    {"id_question": 1, "id_select": 1},
+                    {"id_question": 3, "id_select": 2},
+                ],
+                "The id_question (2) was not answered!",
+            ),
+        )
+        for answers, message in cases:
+            with self.assertRaises(BaseException) as e:
+                validate_answers(answers={"answers": answers}, nquestion=3)
+            self.assertEqual(str(e.exception), message)
+
+        values, reverse = validate_answers(
+            answers={
+                "answers": [
+                    {"id_question": 2, "id_select": 4, "reverse_scored": 1},
+                    {"id_question": 1, "id_select": 5},
+                ]
+            },
+            nquestion=2,
+            custom=True,
+        )
+        self.assertEqual(values, [5, 4])
+        self.assertEqual(reverse, [False, True])
+
+        with self.assertRaises(ValueError) as e:
+            validate_answers(
+                answers={"answers": [{"id_question": 1, "id_select": 5}]},
+                nquestion=1,
+                custom=True,
+            )
+        self.assertEqual(
+            str(e.exception), "The key named (reverse_scored) was not found!"
+        )
+
     def test_big5_ocean_is_valid(self) -> None:
         with self.assertRaises(BaseException) as e:
             big5_ocean_is_valid(label="")